@@ -0,0 +1,228 @@
+"""
+Check that the graph algorithms grow no faster than their expected bounds.
+
+Each case builds inputs at doubling sizes, times the algorithm (best of a
+few runs, graph construction is not timed) and fits the slope of
+log(seconds / bound(V, E)) against log(size). An algorithm that matches its
+bound has a slope near 0; an accidental O(E^2) step pushes it towards 1.
+tests/test_scaling.py fails when a slope exceeds SLOPE_TOLERANCE (only with
+GRAPHS_TIMING_TESTS set, like the other wall-clock tests).
+
+The cases in COUNTED_CASES report to the profiler, so their growth is also
+fitted to the work they count (vertices visited + edges relaxed + heap
+operations) instead of seconds. Those counts do not depend on the machine,
+and tests/test_scaling.py always checks them against WORK_SLOPE_TOLERANCE.
+
+Run from the repository root:
+    python -m benchmarks.bench_scaling
+"""
+import math
+import sys
+import time
+
+from graphs.graph import Graph
+from util.random_graph import across_parity, forward_only, make_random_graph
+
+# Largest accepted growth in excess of the bound, as a log-log slope. Timer
+# noise and cache effects stay well below this; a hidden extra factor of
+# V or E shows up as a slope close to 1.
+SLOPE_TOLERANCE = 0.35
+
+# Counts are exact, so only a real change in the algorithm moves this slope.
+WORK_SLOPE_TOLERANCE = 0.1
+
+# Vertex counts every case is timed at; each graph has EDGE_FACTOR * V edges.
+SIZES = [1000, 2000, 4000, 8000]
+EDGE_FACTOR = 4
+
+
+def linear(num_vertices, num_edges):
+    """O(V + E)."""
+    return num_vertices + num_edges
+
+
+def edges_log_edges(num_vertices, num_edges):
+    """O(E log E)."""
+    return num_edges * math.log(num_edges)
+
+
+def dijkstra_bound(num_vertices, num_edges):
+    """O((V + E) log V)."""
+    return (num_vertices + num_edges) * math.log(num_vertices)
+
+
+def make_chain(num_vertices):
+    """Return a directed path 0 -> 1 -> ... -> V-1, the deepest BFS tree."""
+    graph = Graph(is_directed=True)
+    for i in range(num_vertices):
+        graph.add_vertex(str(i))
+    for i in range(num_vertices - 1):
+        graph.add_edge(str(i), str(i + 1))
+    return graph
+
+
+def with_search_endpoints(graph):
+    """
+    Add a vertex 'source' with an edge to every vertex and an isolated vertex
+    'unreachable', so a search between the two settles the whole graph.
+    """
+    vertex_ids = [vertex.get_id() for vertex in graph.get_vertices()]
+    graph.add_vertex('source')
+    graph.add_vertex('unreachable')
+    for vertex_id in vertex_ids:
+        graph.add_edge('source', vertex_id, 100)
+    return graph
+
+
+# name -> (build(V) -> graph, run(graph, V), bound(V, E))
+CASES = {
+    'bfs shortest path (chain)': (
+        make_chain,
+        lambda graph, n: graph.find_shortest_path('0', str(n - 1)),
+        linear),
+    'k-hop neighborhood': (
+        lambda n: make_random_graph(n, EDGE_FACTOR * n),
+        lambda graph, n: graph.find_k_hop_neighborhood(['0'], n, mode='within'),
+        linear),
+    'connected components': (
+        lambda n: make_random_graph(n, EDGE_FACTOR * n, is_directed=False),
+        lambda graph, n: graph.find_connected_components(),
+        linear),
+    'strongly connected components': (
+        lambda n: make_random_graph(n, EDGE_FACTOR * n),
+        lambda graph, n: graph.find_strongly_connected_components(),
+        linear),
+    'topological sort': (
+        lambda n: make_random_graph(n, EDGE_FACTOR * n, edge_filter=forward_only),
+        lambda graph, n: graph.topological_sort(),
+        linear),
+    'bipartite check': (
+        lambda n: make_random_graph(n, EDGE_FACTOR * n, is_directed=False,
+                             edge_filter=across_parity),
+        lambda graph, n: graph.find_bipartition(),
+        linear),
+    'mst kruskal': (
+        lambda n: make_random_graph(n, EDGE_FACTOR * n, is_directed=False, weighted=True),
+        lambda graph, n: graph.minimum_spanning_tree_kruskal(),
+        edges_log_edges),
+    'mst prim': (
+        lambda n: make_random_graph(n, EDGE_FACTOR * n, is_directed=False, weighted=True),
+        lambda graph, n: graph.minimum_spanning_tree_prim(),
+        edges_log_edges),
+    'weighted shortest path': (
+        lambda n: with_search_endpoints(make_random_graph(n, EDGE_FACTOR * n, weighted=True)),
+        lambda graph, n: graph.find_shortest_path('source', 'unreachable',
+                                                  method='dijkstra'),
+        dijkstra_bound),
+    'graph statistics': (
+        lambda n: make_random_graph(n, EDGE_FACTOR * n),
+        lambda graph, n: graph.compute_statistics(samples=1000, seed=0),
+        edges_log_edges),
+}
+
+
+# The cases whose algorithm records AlgorithmStats when profiling is enabled.
+COUNTED_CASES = ['bfs shortest path (chain)', 'topological sort', 'mst kruskal',
+                 'weighted shortest path']
+
+
+def count_edges(graph):
+    """Return the number of stored (directed) edges of the graph."""
+    return sum(len(graph.get_neighbor_ids(vertex.get_id()))
+               for vertex in graph.get_vertices())
+
+
+def best_time(function, *args, repeat=3):
+    """Return the fastest wall time of `function(*args)` over `repeat` runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def fit_slope(xs, ys):
+    """Return the least squares slope of log(ys) against log(xs)."""
+    log_xs = [math.log(x) for x in xs]
+    log_ys = [math.log(y) for y in ys]
+    mean_x = sum(log_xs) / len(log_xs)
+    mean_y = sum(log_ys) / len(log_ys)
+    numerator = sum((x - mean_x) * (y - mean_y) for x, y in zip(log_xs, log_ys))
+    denominator = sum((x - mean_x) ** 2 for x in log_xs)
+    return numerator / denominator
+
+
+def measure_growth(name, sizes=SIZES, repeat=3):
+    """
+    Time one case of CASES at every size.
+
+    Parameters:
+    name (string): The case to run.
+    sizes (list<int>): Vertex counts, smallest first.
+    repeat (int): Runs per size, the fastest counts.
+
+    Returns:
+    tuple: (slope, times) where slope is the log-log growth of time in
+    excess of the case's bound and times lists the seconds per size.
+    """
+    build, run, bound = CASES[name]
+    times = []
+    ratios = []
+    for size in sizes:
+        graph = build(size)
+        num_edges = count_edges(graph)
+        seconds = best_time(run, graph, size, repeat=repeat)
+        times.append(seconds)
+        # max() keeps a zero timer reading from breaking the logarithm
+        ratios.append(max(seconds, 1e-9) / bound(size, max(num_edges, 2)))
+    return fit_slope(sizes, ratios), times
+
+
+def measure_work(name, sizes=SIZES):
+    """
+    Count the work one case of COUNTED_CASES does at every size.
+
+    Parameters:
+    name (string): The case to run.
+    sizes (list<int>): Vertex counts, smallest first.
+
+    Returns:
+    tuple: (slope, counts) where slope is the log-log growth of the counted
+    work in excess of the case's bound and counts lists the work per size.
+    """
+    build, run, bound = CASES[name]
+    counts = []
+    ratios = []
+    for size in sizes:
+        graph = build(size)
+        num_edges = count_edges(graph)
+        profiler = graph.enable_profiling()
+        run(graph, size)
+        graph.disable_profiling()
+        work = sum(stats.vertices_visited + stats.edges_relaxed + stats.heap_operations
+                   for stats in profiler.history)
+        counts.append(work)
+        ratios.append(max(work, 1) / bound(size, max(num_edges, 2)))
+    return fit_slope(sizes, ratios), counts
+
+
+def main():
+    failed = False
+    for name in CASES:
+        slope, times = measure_growth(name)
+        status = 'ok' if slope <= SLOPE_TOLERANCE else 'TOO SLOW'
+        failed = failed or slope > SLOPE_TOLERANCE
+        timings = ' '.join(f'{seconds * 1000:7.1f}' for seconds in times)
+        print(f'{name:32} {timings} ms  slope {slope:+.2f}  {status}')
+    for name in COUNTED_CASES:
+        slope, counts = measure_work(name)
+        status = 'ok' if slope <= WORK_SLOPE_TOLERANCE else 'TOO MUCH WORK'
+        failed = failed or slope > WORK_SLOPE_TOLERANCE
+        work = ' '.join(f'{count:7}' for count in counts)
+        print(f'{name:32} {work} ops  slope {slope:+.2f}  {status}')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,39 @@
+"""
+Compare the shortest path engines of WeightedGraph on random graphs with
+small integer weights.
+
+Run from the repository root:
+    python -m benchmarks.bench_shortest_path
+"""
+import random
+import time
+
+from util.random_graph import make_random_graph
+
+
+def time_method(graph, method, queries):
+    """Return the seconds taken to answer every (start, target) query."""
+    start = time.perf_counter()
+    for start_id, target_id in queries:
+        graph.find_shortest_path(start_id, target_id, method)
+    return time.perf_counter() - start
+
+
+def main():
+    rng = random.Random(1)
+    print(f'{"vertices":>9} {"edges":>8} {"max w":>6} '
+          f'{"dijkstra":>10} {"dial":>10} {"delta":>10}')
+    for num_vertices in [1000, 10000, 50000]:
+        for max_weight in [4, 64]:
+            graph = make_random_graph(num_vertices, num_vertices * 4, weighted=True,
+                                      max_weight=max_weight)
+            queries = [(str(rng.randrange(num_vertices)), str(rng.randrange(num_vertices)))
+                       for _ in range(20)]
+            times = [time_method(graph, method, queries)
+                     for method in ['dijkstra', 'dial', 'delta_stepping']]
+            print(f'{num_vertices:>9} {num_vertices * 4:>8} {max_weight:>6} '
+                  + ' '.join(f'{t:>10.3f}' for t in times))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Measure the cold-start cost of the command line entry point.
+
+Run from the repository root:
+    python -m benchmarks.bench_startup
+"""
+import os
+import subprocess
+import sys
+import time
+
+# Extra seconds the CLI may take over a bare interpreter start, best of
+# several runs. tests/test_startup.py fails when this is exceeded.
+STARTUP_BUDGET = 0.15
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE_COMMAND = ['main.py', 'test_files/graph_medium_undirected.txt', 'shortest-path', 'A', 'F']
+
+
+def best_run_time(arguments, repeat=5):
+    """Return the fastest wall time of running the interpreter with `arguments`."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + arguments, cwd=REPO_ROOT, check=True,
+                       stdout=subprocess.DEVNULL)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure_startup(repeat=5):
+    """
+    Return (interpreter seconds, cli seconds): the best time to start a bare
+    interpreter and to run the sample CLI command.
+    """
+    return best_run_time(['-c', 'pass'], repeat), best_run_time(SAMPLE_COMMAND, repeat)
+
+
+def main():
+    interpreter, cli = measure_startup()
+    overhead = cli - interpreter
+    print(f'interpreter: {interpreter * 1000:.1f} ms')
+    print(f'cli:         {cli * 1000:.1f} ms')
+    print(f'overhead:    {overhead * 1000:.1f} ms (budget {STARTUP_BUDGET * 1000:.0f} ms)')
+    return 0 if overhead <= STARTUP_BUDGET else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,38 @@
+"""
+Graph data structures and algorithms.
+
+Names are imported from their submodules the first time they are used, so
+`import graphs` stays cheap and optional engines (asyncio service, distance
+indexes, ...) only load for the programs that need them.
+"""
+import importlib
+
+# public name -> submodule that defines it
+_LAZY_NAMES = {
+    'Vertex': 'graphs.graph',
+    'Graph': 'graphs.graph',
+    'WeightedVertex': 'graphs.weighted_graph',
+    'WeightedGraph': 'graphs.weighted_graph',
+    'GraphSnapshot': 'graphs.snapshot',
+    'CompactGraph': 'graphs.compact',
+    'Profiler': 'graphs.profiling',
+    'AlgorithmStats': 'graphs.profiling',
+    'LandmarkIndex': 'graphs.distance_oracle',
+    'TwoHopLabels': 'graphs.distance_oracle',
+    'GraphQueryService': 'graphs.service',
+}
+
+__all__ = list(_LAZY_NAMES)
+
+
+def __getattr__(name):
+    """Import `name` from its submodule on first access."""
+    if name not in _LAZY_NAMES:
+        raise AttributeError(f"module 'graphs' has no attribute '{name}'")
+    value = getattr(importlib.import_module(_LAZY_NAMES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
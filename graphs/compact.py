@@ -0,0 +1,153 @@
+from array import array
+
+
+class CompactGraph(object):
+    """
+    A read-only graph stored as integer arrays (compressed sparse rows).
+
+    Vertices are numbered 0..V-1. The neighbors of vertex `i` are
+    `targets[offsets[i]:offsets[i + 1]]`. Compared with Vertex objects and
+    dictionaries this uses a few bytes per edge and lets algorithms index
+    flat arrays instead of hashing ids.
+    """
+
+    def __init__(self, vertex_ids, offsets, targets, is_directed, weights=None):
+        """
+        Initialize a compact graph from its arrays. Use `from_graph` to build one.
+
+        Parameters:
+        vertex_ids (list): Vertex index -> original vertex id.
+        offsets (array): V + 1 positions into `targets`.
+        targets (array): Neighbor indexes, grouped by source vertex.
+        is_directed (boolean): Whether each edge is stored once (directed)
+        or in both directions (undirected).
+        weights (array): Edge weights parallel to `targets`, or None.
+        """
+        self.vertex_ids = vertex_ids
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.is_directed = is_directed
+        self.__index = None
+
+    @classmethod
+    def from_graph(cls, graph, undirected=False):
+        """
+        Convert a Graph (or WeightedGraph or GraphSnapshot) to arrays in O(V + E).
+
+        Parameters:
+        graph (Graph): The graph to convert.
+        undirected (boolean): Also store the reverse of every edge of a
+        directed graph, for algorithms that ignore edge direction.
+
+        Returns:
+        CompactGraph: The compact copy.
+        """
+        vertex_ids = [vertex.get_id() for vertex in graph.get_vertices()]
+        index = {vertex_id: i for i, vertex_id in enumerate(vertex_ids)}
+
+        adjacency = [[index[neighbor_id] for neighbor_id in graph.get_neighbor_ids(vertex_id)]
+                     for vertex_id in vertex_ids]
+        is_directed = graph.is_directed()
+        if is_directed and undirected:
+            reverse = [[] for _ in vertex_ids]
+            for source, neighbors in enumerate(adjacency):
+                for target in neighbors:
+                    reverse[target].append(source)
+            adjacency = [neighbors + reverse[i] for i, neighbors in enumerate(adjacency)]
+            is_directed = False
+
+        offsets = array('q', [0])
+        targets = array('q')
+        for neighbors in adjacency:
+            targets.extend(neighbors)
+            offsets.append(len(targets))
+
+        compact = cls(vertex_ids, offsets, targets, is_directed)
+        compact.__index = index
+        return compact
+
+    def num_vertices(self):
+        """Return the number of vertices."""
+        return len(self.vertex_ids)
+
+    def num_edges(self):
+        """Return the number of stored (directed) edges."""
+        return len(self.targets)
+
+    def get_index(self, vertex_id):
+        """Return the integer index of a vertex id."""
+        if self.__index is None:
+            self.__index = {vertex_id: i for i, vertex_id in enumerate(self.vertex_ids)}
+        return self.__index[vertex_id]
+
+    def neighbors(self, i):
+        """Return the neighbor indexes of vertex index `i`."""
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def degree(self, i):
+        """Return the out-degree of vertex index `i`."""
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def find_bipartition(self):
+        """
+        Two-color every component with breadth-first search in O(V + E).
+
+        Returns:
+        tuple: (True, colors) where colors is an array of 0/1 per vertex
+        index, or (False, cycle) where cycle is a list of vertex indexes
+        forming an odd cycle (the first vertex is not repeated at the end).
+        """
+        num_vertices = len(self.vertex_ids)
+        offsets = self.offsets
+        targets = self.targets
+        colors = array('b', [-1]) * num_vertices
+        parent = array('q', [-1]) * num_vertices
+        depth = array('q', [0]) * num_vertices
+        queue = array('q', [0]) * num_vertices # every vertex is queued once
+
+        for root in range(num_vertices):
+            if colors[root] != -1:
+                continue
+            colors[root] = 0
+            queue[0] = root
+            head = 0
+            tail = 1
+            while head < tail:
+                current = queue[head]
+                head += 1
+                next_color = 1 - colors[current]
+                for position in range(offsets[current], offsets[current + 1]):
+                    neighbor = targets[position]
+                    if colors[neighbor] == -1:
+                        colors[neighbor] = next_color
+                        parent[neighbor] = current
+                        depth[neighbor] = depth[current] + 1
+                        queue[tail] = neighbor
+                        tail += 1
+                    elif colors[neighbor] != next_color:
+                        return False, self.__odd_cycle(current, neighbor, parent, depth)
+        return True, colors
+
+    def __odd_cycle(self, first, second, parent, depth):
+        """
+        Return the cycle closed by the edge first-second, whose endpoints have
+        the same color: the two tree paths up to their lowest common ancestor.
+        """
+        first_path = [first]
+        second_path = [second]
+        while depth[first] > depth[second]:
+            first = parent[first]
+            first_path.append(first)
+        while depth[second] > depth[first]:
+            second = parent[second]
+            second_path.append(second)
+        while first != second:
+            first = parent[first]
+            second = parent[second]
+            first_path.append(first)
+            second_path.append(second)
+        # both paths end at the common ancestor, keep it once
+        second_path.pop()
+        second_path.reverse()
+        return first_path + second_path
@@ -0,0 +1,370 @@
+import heapq
+import json
+
+from graphs.weighted_graph import WeightedGraph
+
+
+INFINITY = float('inf')
+
+
+def _adjacency_lists(graph):
+    """
+    Return the forward and reverse adjacency of a graph as dictionaries of
+    vertex_id -> list of (neighbor_id, weight). Unweighted edges weigh 1.
+    """
+    weighted = isinstance(graph, WeightedGraph)
+    if weighted and graph.has_negative_weights():
+        raise ValueError("Distance indexes need non-negative edge weights")
+
+    forward = {}
+    for vertex in graph.get_vertices():
+        if weighted:
+            forward[vertex.get_id()] = vertex.get_neighbors_with_weights()
+        else:
+            forward[vertex.get_id()] = [(neighbor.get_id(), 1)
+                                        for neighbor in vertex.get_neighbors()]
+    if not graph.is_directed():
+        return forward, forward
+
+    reverse = {vertex_id: [] for vertex_id in forward}
+    for vertex_id, edges in forward.items():
+        for neighbor_id, weight in edges:
+            reverse[neighbor_id].append((vertex_id, weight))
+    return forward, reverse
+
+
+def _distances_from(adjacency, start_id):
+    """Return vertex_id -> distance from start_id with a heap Dijkstra."""
+    distances = {}
+    heap = [(0, 0, start_id)]
+    counter = 1
+    while heap:
+        distance, _, vertex_id = heapq.heappop(heap)
+        if vertex_id in distances:
+            continue
+        distances[vertex_id] = distance
+        for neighbor_id, weight in adjacency[vertex_id]:
+            if neighbor_id not in distances:
+                heapq.heappush(heap, (distance + weight, counter, neighbor_id))
+                counter += 1
+    return distances
+
+
+class LandmarkIndex(object):
+    """
+    Precomputed distances to and from a few landmark vertices.
+
+    For any landmark L the triangle inequality gives
+        d(u, v) >= d(L, v) - d(L, u)    and    d(u, v) >= d(u, L) - d(v, L)
+        d(u, v) <= d(u, L) + d(L, v)
+    so a query only looks at two short lists of numbers (ALT bounds). The
+    lower bound is an admissible A* heuristic.
+    """
+
+    def __init__(self, landmarks, from_landmarks, to_landmarks, is_directed):
+        """
+        Initialize an index from precomputed distances. Use `build` or `load`.
+
+        Parameters:
+        landmarks (list<string>): The landmark vertex ids.
+        from_landmarks (dict): vertex_id -> list of d(landmark, vertex).
+        to_landmarks (dict): vertex_id -> list of d(vertex, landmark).
+        is_directed (boolean): Whether the indexed graph is directed.
+        """
+        self.landmarks = landmarks
+        self.is_directed = is_directed
+        self.__from = from_landmarks
+        self.__to = to_landmarks
+
+    @classmethod
+    def build(cls, graph, num_landmarks=8):
+        """
+        Pick landmarks by farthest-point sampling and index a graph.
+
+        The first landmark is the vertex of highest out-degree, each next one
+        is the vertex farthest from the landmarks chosen so far (vertices
+        they cannot reach count as farthest, so every component is covered).
+
+        Parameters:
+        graph (Graph or WeightedGraph): The graph to index.
+        num_landmarks (int): How many landmarks to use.
+
+        Returns:
+        LandmarkIndex: The index.
+        """
+        forward, reverse = _adjacency_lists(graph)
+        vertex_ids = list(forward)
+        num_landmarks = min(num_landmarks, len(vertex_ids))
+
+        landmarks = []
+        from_landmarks = {vertex_id: [] for vertex_id in vertex_ids}
+        to_landmarks = from_landmarks
+        if graph.is_directed():
+            to_landmarks = {vertex_id: [] for vertex_id in vertex_ids}
+        nearest = {vertex_id: INFINITY for vertex_id in vertex_ids}
+
+        if vertex_ids:
+            candidate = max(vertex_ids, key=lambda vertex_id: len(forward[vertex_id]))
+        while len(landmarks) < num_landmarks:
+            landmarks.append(candidate)
+            distances_from = _distances_from(forward, candidate)
+            for vertex_id in vertex_ids:
+                from_landmarks[vertex_id].append(distances_from.get(vertex_id, INFINITY))
+            if graph.is_directed():
+                distances_to = _distances_from(reverse, candidate)
+                for vertex_id in vertex_ids:
+                    to_landmarks[vertex_id].append(distances_to.get(vertex_id, INFINITY))
+
+            for vertex_id, distance in distances_from.items():
+                if distance < nearest[vertex_id]:
+                    nearest[vertex_id] = distance
+            chosen = set(landmarks)
+            candidate = max((vertex_id for vertex_id in vertex_ids if vertex_id not in chosen),
+                            key=lambda vertex_id: nearest[vertex_id], default=None)
+            if candidate is None:
+                break
+
+        return cls(landmarks, from_landmarks, to_landmarks, graph.is_directed())
+
+    def lower_bound(self, start_id, target_id):
+        """Return a lower bound on the distance from start_id to target_id."""
+        if start_id == target_id:
+            return 0
+        from_start = self.__from[start_id]
+        from_target = self.__from[target_id]
+        to_start = self.__to[start_id]
+        to_target = self.__to[target_id]
+
+        best = 0
+        for i in range(len(self.landmarks)):
+            # a landmark reaching the start but not the target proves there
+            # is no path, and so does one reachable from the target only
+            if from_start[i] != INFINITY:
+                bound = from_target[i] - from_start[i]
+                if bound > best:
+                    best = bound
+            if to_target[i] != INFINITY:
+                bound = to_start[i] - to_target[i]
+                if bound > best:
+                    best = bound
+        return best
+
+    def upper_bound(self, start_id, target_id):
+        """
+        Return an upper bound on the distance from start_id to target_id (the
+        best detour through a landmark), or infinity if none is known.
+        """
+        if start_id == target_id:
+            return 0
+        to_start = self.__to[start_id]
+        from_target = self.__from[target_id]
+        return min((to_start[i] + from_target[i] for i in range(len(self.landmarks))),
+                   default=INFINITY)
+
+    def estimate_distance(self, start_id, target_id):
+        """
+        Return an approximate distance from start_id to target_id: the
+        landmark upper bound, which is exact whenever a shortest path runs
+        through a landmark.
+        """
+        return self.upper_bound(start_id, target_id)
+
+    def heuristic(self, target_id):
+        """Return an admissible A* heuristic function towards target_id."""
+        return lambda vertex_id: self.lower_bound(vertex_id, target_id)
+
+    def save(self, filename):
+        """Write the index to a JSON file."""
+        with open(filename, 'w') as index_file:
+            json.dump({
+                'type': 'landmarks',
+                'is_directed': self.is_directed,
+                'landmarks': self.landmarks,
+                'vertices': [[vertex_id, self.__from[vertex_id], self.__to[vertex_id]]
+                             for vertex_id in self.__from],
+            }, index_file)
+
+    @classmethod
+    def load(cls, filename):
+        """Read an index written by `save`."""
+        with open(filename) as index_file:
+            data = json.load(index_file)
+        if data.get('type') != 'landmarks':
+            raise ValueError("Not a landmark index file")
+        from_landmarks = {}
+        to_landmarks = {}
+        for vertex_id, distances_from, distances_to in data['vertices']:
+            from_landmarks[vertex_id] = distances_from
+            to_landmarks[vertex_id] = distances_to
+        return cls(data['landmarks'], from_landmarks, to_landmarks, data['is_directed'])
+
+
+class TwoHopLabels(object):
+    """
+    Exact distance labels built by pruned landmark labeling.
+
+    Every vertex stores the distance to (and from) a small set of hub
+    vertices so that some shortest path between any two vertices passes
+    through a hub both of them store. A query merges two labels. Labels grow
+    quickly on large graphs, so this is meant for small ones.
+    """
+
+    def __init__(self, out_labels, in_labels, is_directed):
+        """
+        Initialize labels from precomputed hubs. Use `build` or `load`.
+
+        Parameters:
+        out_labels (dict): vertex_id -> {hub rank: d(vertex, hub)}.
+        in_labels (dict): vertex_id -> {hub rank: d(hub, vertex)}.
+        is_directed (boolean): Whether the labeled graph is directed.
+        """
+        self.is_directed = is_directed
+        self.__out = out_labels
+        self.__in = in_labels
+
+    @classmethod
+    def build(cls, graph):
+        """
+        Label a graph, processing hubs from highest to lowest degree.
+
+        Parameters:
+        graph (Graph or WeightedGraph): The graph to label.
+
+        Returns:
+        TwoHopLabels: The labels.
+        """
+        forward, reverse = _adjacency_lists(graph)
+        order = sorted(forward, key=lambda vertex_id: -len(forward[vertex_id]))
+        out_labels = {vertex_id: {} for vertex_id in forward}
+        in_labels = out_labels
+        if graph.is_directed():
+            in_labels = {vertex_id: {} for vertex_id in forward}
+
+        def query(out_label, in_label):
+            return min((distance + in_label[hub] for hub, distance in out_label.items()
+                        if hub in in_label), default=INFINITY)
+
+        for rank, hub_id in enumerate(order):
+            # forward search fills in_labels, reverse search fills out_labels
+            for adjacency, labels, hub_label, is_forward in (
+                    (forward, in_labels, out_labels[hub_id], True),
+                    (reverse, out_labels, in_labels[hub_id], False)):
+                if not graph.is_directed() and not is_forward:
+                    break
+                settled = set()
+                heap = [(0, 0, hub_id)]
+                counter = 1
+                while heap:
+                    distance, _, vertex_id = heapq.heappop(heap)
+                    if vertex_id in settled:
+                        continue
+                    settled.add(vertex_id)
+                    # prune: earlier hubs already cover this pair
+                    if is_forward:
+                        known = query(hub_label, in_labels[vertex_id])
+                    else:
+                        known = query(out_labels[vertex_id], hub_label)
+                    if known <= distance:
+                        continue
+                    labels[vertex_id][rank] = distance
+                    for neighbor_id, weight in adjacency[vertex_id]:
+                        if neighbor_id not in settled:
+                            heapq.heappush(heap, (distance + weight, counter, neighbor_id))
+                            counter += 1
+
+        return cls(out_labels, in_labels, graph.is_directed())
+
+    def distance(self, start_id, target_id):
+        """Return the exact distance from start_id to target_id (inf if unreachable)."""
+        out_label = self.__out[start_id]
+        in_label = self.__in[target_id]
+        if len(in_label) < len(out_label):
+            return min((distance + out_label[hub] for hub, distance in in_label.items()
+                        if hub in out_label), default=INFINITY)
+        return min((distance + in_label[hub] for hub, distance in out_label.items()
+                    if hub in in_label), default=INFINITY)
+
+    def label_size(self):
+        """Return the average number of hubs stored per vertex."""
+        if not self.__out:
+            return 0
+        total = sum(len(label) for label in self.__out.values())
+        if self.is_directed:
+            total += sum(len(label) for label in self.__in.values())
+        return total / len(self.__out)
+
+    def save(self, filename):
+        """Write the labels to a JSON file."""
+        with open(filename, 'w') as label_file:
+            json.dump({
+                'type': 'two_hop',
+                'is_directed': self.is_directed,
+                'vertices': [[vertex_id, list(self.__out[vertex_id].items()),
+                              list(self.__in[vertex_id].items())]
+                             for vertex_id in self.__out],
+            }, label_file)
+
+    @classmethod
+    def load(cls, filename):
+        """Read labels written by `save`."""
+        with open(filename) as label_file:
+            data = json.load(label_file)
+        if data.get('type') != 'two_hop':
+            raise ValueError("Not a two-hop label file")
+        out_labels = {}
+        in_labels = {}
+        for vertex_id, out_label, in_label in data['vertices']:
+            out_labels[vertex_id] = dict(out_label)
+            in_labels[vertex_id] = dict(in_label)
+        if not data['is_directed']:
+            in_labels = out_labels
+        return cls(out_labels, in_labels, data['is_directed'])
+
+
+def find_shortest_path_astar(graph, start_id, target_id, heuristic):
+    """
+    Use A* search to return the total weight of the shortest path from a
+    start vertex to a destination. Unweighted edges weigh 1.
+
+    Parameters:
+    graph (Graph or WeightedGraph): A graph with non-negative edge weights.
+    start_id (string): The id of the start vertex.
+    target_id (string): The id of the target vertex.
+    heuristic (function): vertex_id -> lower bound on its distance to the
+    target, such as `LandmarkIndex.heuristic(target_id)`.
+
+    Returns:
+    number: The shortest distance, or None if the target is unreachable.
+    """
+    if not graph.contains_id(start_id) or not graph.contains_id(target_id):
+        raise KeyError("One or both vertices are not in the graph!")
+    weighted = isinstance(graph, WeightedGraph)
+
+    distances = {start_id: 0}
+    settled = set()
+    heap = [(heuristic(start_id), 0, start_id)]
+    counter = 1
+    while heap:
+        _, _, vertex_id = heapq.heappop(heap)
+        if vertex_id in settled:
+            continue
+        if vertex_id == target_id:
+            return distances[vertex_id]
+        settled.add(vertex_id)
+
+        vertex = graph.get_vertex(vertex_id)
+        if weighted:
+            edges = vertex.get_neighbors_with_weights()
+        else:
+            edges = [(neighbor.get_id(), 1) for neighbor in vertex.get_neighbors()]
+        distance = distances[vertex_id]
+        for neighbor_id, weight in edges:
+            new_distance = distance + weight
+            if new_distance < distances.get(neighbor_id, INFINITY):
+                distances[neighbor_id] = new_distance
+                estimate = heuristic(neighbor_id)
+                if estimate == INFINITY:
+                    continue # the index proves the target is unreachable from here
+                heapq.heappush(heap, (new_distance + estimate, counter, neighbor_id))
+                counter += 1
+    return None
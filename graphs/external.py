@@ -0,0 +1,312 @@
+"""
+Traversals for graphs whose edges do not fit in memory.
+
+`build_edge_store` turns a graph file (the format read by
+`util.file_reader.read_graph_from_file`) into sorted binary edge blocks on
+disk with an external merge sort. `ExternalGraph` memory-maps those blocks,
+so a traversal only keeps O(V) bytes of bookkeeping in RAM while the
+operating system pages edges in and out as needed.
+"""
+import heapq
+import json
+import mmap
+import os
+import tempfile
+import tracemalloc
+from array import array
+
+# int64 items per read/write block when streaming binary files
+BLOCK_ITEMS = 1 << 16
+
+
+def _read_pairs(filename):
+    """Yield the (source, target) pairs stored in a sorted run file."""
+    with open(filename, 'rb') as run_file:
+        while True:
+            block = array('q')
+            block.frombytes(run_file.read(BLOCK_ITEMS * block.itemsize))
+            if not block:
+                return
+            for i in range(0, len(block), 2):
+                yield block[i], block[i + 1]
+
+
+def _write_run(pairs, directory):
+    """Sort a chunk of edge pairs, write it as a run file and return its name."""
+    pairs.sort()
+    flat = array('q')
+    for source, target in pairs:
+        flat.append(source)
+        flat.append(target)
+    handle, filename = tempfile.mkstemp(suffix='.run', dir=directory)
+    with os.fdopen(handle, 'wb') as run_file:
+        flat.tofile(run_file)
+    return filename
+
+
+def build_edge_store(filename, prefix, chunk_edges=1000000):
+    """
+    Convert a graph file to a memory-mappable edge store.
+
+    Edges are read `chunk_edges` at a time, sorted and spilled to run files,
+    then merged into one file of neighbor indexes grouped by source vertex
+    (plus an offsets file), so RAM use is bounded by the chunk size and the
+    number of vertices, never by the number of edges.
+
+    Parameters:
+    filename (string): The graph file to convert.
+    prefix (string): Path prefix of the files to write.
+    chunk_edges (int): Edges held in memory at once while sorting.
+
+    Returns:
+    ExternalGraph: The store, opened.
+    """
+    directory = os.path.dirname(os.path.abspath(prefix))
+    runs = []
+    try:
+        with open(filename) as graph_file:
+            graph_type = graph_file.readline().strip()
+            if graph_type not in ('G', 'D'):
+                raise ValueError("Invalid Graph type")
+            is_directed = graph_type == 'D'
+            vertex_ids = [vertex_id for vertex_id in graph_file.readline().strip().split(',')
+                          if vertex_id]
+            index = {vertex_id: i for i, vertex_id in enumerate(vertex_ids)}
+
+            pairs = []
+            for edge in graph_file:
+                edge = edge.strip()
+                if not edge:
+                    continue
+                vertex1, vertex2 = edge[1:-1].split(',')[:2]
+                source = index[vertex1]
+                target = index[vertex2]
+                pairs.append((source, target))
+                if not is_directed:
+                    pairs.append((target, source))
+                if len(pairs) >= chunk_edges:
+                    runs.append(_write_run(pairs, directory))
+                    pairs = []
+            if pairs:
+                runs.append(_write_run(pairs, directory))
+            del index
+
+        num_vertices = len(vertex_ids)
+        with open(prefix + '.ids', 'w') as ids_file:
+            for vertex_id in vertex_ids:
+                ids_file.write(vertex_id + '\n')
+        del vertex_ids
+
+        # merge the sorted runs, dropping duplicate edges like Graph.add_edge does
+        num_edges = 0
+        next_source = 0 # first vertex whose offset is not written yet
+        previous = None
+        targets = array('q')
+        offsets = array('q')
+        with open(prefix + '.targets', 'wb') as targets_file, \
+                open(prefix + '.offsets', 'wb') as offsets_file:
+            for pair in heapq.merge(*[_read_pairs(run) for run in runs]):
+                if pair == previous:
+                    continue
+                previous = pair
+                source, target = pair
+                while next_source <= source:
+                    offsets.append(num_edges)
+                    next_source += 1
+                targets.append(target)
+                num_edges += 1
+                if len(targets) >= BLOCK_ITEMS:
+                    targets.tofile(targets_file)
+                    targets = array('q')
+                if len(offsets) >= BLOCK_ITEMS:
+                    offsets.tofile(offsets_file)
+                    offsets = array('q')
+            while next_source <= num_vertices:
+                offsets.append(num_edges)
+                next_source += 1
+            targets.tofile(targets_file)
+            offsets.tofile(offsets_file)
+    finally:
+        # also when parsing or merging fails, e.g. on an unknown vertex id
+        for run in runs:
+            os.remove(run)
+
+    with open(prefix + '.json', 'w') as meta_file:
+        json.dump({'is_directed': is_directed, 'num_vertices': num_vertices,
+                   'num_edges': num_edges}, meta_file)
+    return ExternalGraph(prefix)
+
+
+def _map_int64(filename):
+    """Return (mmap or None, int64 view) of a binary file, read-only."""
+    if os.path.getsize(filename) == 0:
+        return None, memoryview(array('q'))
+    with open(filename, 'rb') as binary_file:
+        mapped = mmap.mmap(binary_file.fileno(), 0, access=mmap.ACCESS_READ)
+    return mapped, memoryview(mapped).cast('q')
+
+
+class ExternalGraph(object):
+    """
+    A read-only graph whose edges stay on disk in a memory-mapped file.
+    """
+
+    def __init__(self, prefix):
+        """
+        Open an edge store written by `build_edge_store`.
+
+        Parameters:
+        prefix (string): The path prefix the store was written with.
+        """
+        with open(prefix + '.json') as meta_file:
+            meta = json.load(meta_file)
+        self.prefix = prefix
+        self.is_directed = meta['is_directed']
+        self.__num_vertices = meta['num_vertices']
+        self.__num_edges = meta['num_edges']
+        self.__offsets_map, self.__offsets = _map_int64(prefix + '.offsets')
+        self.__targets_map, self.__targets = _map_int64(prefix + '.targets')
+        self.__index = None
+
+    def close(self):
+        """Release the memory maps."""
+        self.__offsets.release()
+        self.__targets.release()
+        for mapped in (self.__offsets_map, self.__targets_map):
+            if mapped is not None:
+                mapped.close()
+
+    def num_vertices(self):
+        """Return the number of vertices."""
+        return self.__num_vertices
+
+    def num_edges(self):
+        """Return the number of stored (directed) edges."""
+        return self.__num_edges
+
+    def get_ids(self):
+        """Return the vertex ids, in index order. This reads the ids file."""
+        with open(self.prefix + '.ids') as ids_file:
+            return [line.rstrip('\n') for line in ids_file]
+
+    def get_index(self, vertex_id):
+        """Return the integer index of a vertex id (loads the id table once)."""
+        if self.__index is None:
+            self.__index = {vertex_id: i for i, vertex_id in enumerate(self.get_ids())}
+        return self.__index[vertex_id]
+
+    def neighbors(self, i):
+        """Return the neighbor indexes of vertex index `i`."""
+        return self.__targets[self.__offsets[i]:self.__offsets[i + 1]]
+
+    def edge_blocks(self, block_items=BLOCK_ITEMS):
+        """
+        Yield (first source index, offsets slice, targets slice) over the
+        whole edge file, `block_items` vertices at a time, in source order.
+        """
+        for start in range(0, self.__num_vertices, block_items):
+            stop = min(start + block_items, self.__num_vertices)
+            offsets = self.__offsets[start:stop + 1]
+            yield start, offsets, self.__targets[offsets[0]:offsets[-1]]
+
+
+def external_bfs(graph, start_index):
+    """
+    Level-synchronous breadth-first search over an ExternalGraph.
+
+    Each level's frontier is sorted before it is expanded so the edge file is
+    read front to back. RAM use is one byte per vertex for the visited set,
+    four per vertex for the distances, plus the current frontiers.
+
+    Parameters:
+    graph (ExternalGraph): The graph to search.
+    start_index (int): The index of the start vertex.
+
+    Returns:
+    tuple: (distances, level_sizes) where distances is an array with the
+    hop count of every vertex index (-1 if unreachable), and level_sizes
+    lists how many vertices are on each level.
+    """
+    num_vertices = graph.num_vertices()
+    visited = bytearray(num_vertices)
+    distances = array('i', [-1]) * num_vertices
+    visited[start_index] = 1
+    distances[start_index] = 0
+    frontier = array('q', [start_index])
+    level_sizes = [1]
+
+    depth = 0
+    while frontier:
+        depth += 1
+        next_frontier = array('q')
+        for vertex in sorted(frontier):
+            for neighbor in graph.neighbors(vertex):
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    distances[neighbor] = depth
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+        if frontier:
+            level_sizes.append(len(frontier))
+    return distances, level_sizes
+
+
+def external_connected_components(graph):
+    """
+    Label the (weakly) connected components of an ExternalGraph by streaming
+    its edge blocks once through a union-find over vertex indexes.
+
+    Parameters:
+    graph (ExternalGraph): The graph to label.
+
+    Returns:
+    tuple: (labels, count) where labels gives the component number of every
+    vertex index and count is the number of components.
+    """
+    num_vertices = graph.num_vertices()
+    parent = array('q', range(num_vertices))
+
+    def find(vertex):
+        # path halving keeps the trees shallow without recursion
+        while parent[vertex] != vertex:
+            parent[vertex] = parent[parent[vertex]]
+            vertex = parent[vertex]
+        return vertex
+
+    for start, offsets, targets in graph.edge_blocks():
+        base = offsets[0]
+        for i in range(len(offsets) - 1):
+            root = find(start + i)
+            for position in range(offsets[i] - base, offsets[i + 1] - base):
+                other = find(targets[position])
+                if other != root:
+                    parent[other] = root
+
+    labels = array('i', [0]) * num_vertices
+    numbering = {}
+    for vertex in range(num_vertices):
+        root = find(vertex)
+        if root not in numbering:
+            numbering[root] = len(numbering)
+        labels[vertex] = numbering[root]
+    return labels, len(numbering)
+
+
+def measure_peak_memory(function, *args):
+    """
+    Run `function(*args)` and return (result, peak bytes) of Python memory
+    allocated during the call. Memory-mapped edge pages are not counted,
+    they belong to the operating system's page cache.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    try:
+        result = function(*args)
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return result, peak
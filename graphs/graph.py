@@ -1,4 +1,6 @@
 from collections import deque
+from graphs.compact import CompactGraph
+from graphs.profiling import Profiler
 
 class Vertex(object):
     """
@@ -12,8 +14,8 @@ class Vertex(object):
         Parameters:
         vertex_id (string): A unique identifier to identify this vertex.
         """
-        self.__id = vertex_id
-        self.__neighbors_dict = {} # neighbor_id -> object
+        self._id = vertex_id
+        self._neighbors_dict = {} # neighbor_id -> object
 
     def add_neighbor(self, vertex_obj):
         """
@@ -22,13 +24,22 @@ class Vertex(object):
         Parameters:
         vertex_obj (Vertex): An instance of Vertex to be stored as a neighbor.
         """
-        self.__neighbors_dict[vertex_obj.__id] = vertex_obj
+        self._neighbors_dict[vertex_obj._id] = vertex_obj
         pass
 
+    def remove_neighbor(self, vertex_id):
+        """
+        Remove a neighbor from the neighbors dictionary.
+
+        Parameters:
+        vertex_id (string): The id of the neighbor to remove.
+        """
+        del self._neighbors_dict[vertex_id]
+
     def __str__(self):
         """Output the list of neighbors of this vertex."""
-        neighbor_ids = list(self.__neighbors_dict.keys())
-        return f'{self.__id} adjacent to {neighbor_ids}'
+        neighbor_ids = list(self._neighbors_dict.keys())
+        return f'{self._id} adjacent to {neighbor_ids}'
 
     def __repr__(self):
         """Output the list of neighbors of this vertex."""
@@ -36,26 +47,85 @@ class Vertex(object):
 
     def get_neighbors(self):
         """Return the neighbors of this vertex."""
-        return list(self.__neighbors_dict.values())
+        return list(self._neighbors_dict.values())
 
     def get_id(self):
         """Return the neighbor_id of this vertex."""
-        return self.__id
+        return self._id
+
+    def has_neighbor(self, vertex_id):
+        """Return True if there is an edge from this vertex to `vertex_id`."""
+        return vertex_id in self._neighbors_dict
+
+    def _copy_neighbors_dict(self):
+        """
+        Replace the neighbors dictionary with a private copy and return it, so
+        a snapshot still holding the old dictionary never sees later edits.
+        """
+        self._neighbors_dict = dict(self._neighbors_dict)
+        return self._neighbors_dict
 
 
 class Graph:
     """ Graph Class
     Represents a directed or undirected graph.
+
+    Subclasses share this storage: they only swap `vertex_class` and pass
+    their extra edge data (such as a weight) through `_add_edge`, so every
+    algorithm written here runs on them unchanged.
     """
-    def __init__(self, is_directed=True):
+    vertex_class = Vertex
+
+    def __init__(self, is_directed=True, reverse_index=False):
         """
         Initialize a graph object with an empty vertex dictionary.
 
         Parameters:
         is_directed (boolean): Whether the graph is directed (edges go in only one direction).
+        reverse_index (boolean): Whether to maintain the in-neighbors of every
+        vertex as edges are added (see `enable_reverse_index`).
+        """
+        self._vertex_dict = {} # neighbor_id -> object
+        self._is_directed = is_directed
+        self._profiler = None # only set while profiling is enabled
+
+        # Copy-on-write state shared with snapshots. `_adjacency` maps each
+        # id to the dictionary backing that vertex's neighbors. Once a
+        # snapshot holds it, the first write copies the top level dictionary
+        # and each vertex's neighbors are copied on their first edit.
+        self._adjacency = {} # vertex_id -> neighbors dict
+        self._weight_adjacency = None # vertex_id -> weights dict, if weighted
+        self._adjacency_shared = False
+        self._owned_ids = None # ids copied since the last snapshot
+
+        # vertex_id -> {source_id: source Vertex}, only for directed graphs
+        self._in_adjacency = None
+        if reverse_index:
+            self.enable_reverse_index()
+
+    def enable_profiling(self, callback=None):
         """
-        self.__vertex_dict = {} # neighbor_id -> object
-        self.__is_directed = is_directed
+        Start collecting per-call statistics for the instrumented algorithms.
+
+        Parameters:
+        callback (function): Optional hook called with an AlgorithmStats
+        object after every instrumented call.
+
+        Returns:
+        Profiler: The profiler that records the statistics.
+        """
+        self._profiler = Profiler(callback)
+        return self._profiler
+
+    def disable_profiling(self):
+        """Stop collecting statistics and return the last profiler, if any."""
+        profiler = self._profiler
+        self._profiler = None
+        return profiler
+
+    def get_profiler(self):
+        """Return the active profiler, or None if profiling is disabled."""
+        return self._profiler
 
     def add_vertex(self, vertex_id):
         """
@@ -67,17 +137,25 @@ class Graph:
         Returns:
         Vertex: The new vertex object.
         """
-        new_vertex = Vertex(vertex_id)
-        self.__vertex_dict[vertex_id] = new_vertex
+        new_vertex = self.vertex_class(vertex_id)
+        if self._owned_ids is not None:
+            self._copy_on_write()
+            self._owned_ids.add(vertex_id)
+        self._vertex_dict[vertex_id] = new_vertex
+        self._adjacency[vertex_id] = new_vertex._neighbors_dict
+        if self._weight_adjacency is not None:
+            self._weight_adjacency[vertex_id] = new_vertex._weights_dict
+        if self._in_adjacency is not None:
+            self._in_adjacency[vertex_id] = {}
         return new_vertex
         
 
     def get_vertex(self, vertex_id):
         """Return the vertex if it exists."""
-        if vertex_id not in self.__vertex_dict:
+        if vertex_id not in self._vertex_dict:
             return None
 
-        vertex_obj = self.__vertex_dict[vertex_id]
+        vertex_obj = self._vertex_dict[vertex_id]
         return vertex_obj
 
     def add_edge(self, vertex_id1, vertex_id2):
@@ -88,12 +166,181 @@ class Graph:
         vertex_id1 (string): The unique identifier of the first vertex.
         vertex_id2 (string): The unique identifier of the second vertex.
         """
-        vertex1 = self.__vertex_dict[vertex_id1]
-        vertex2 = self.__vertex_dict[vertex_id2]
-        vertex1.add_neighbor(vertex2)
-        if(not self.__is_directed):
-            vertex2.add_neighbor(vertex1)
-        pass
+        self._add_edge(vertex_id1, vertex_id2)
+
+    def _add_edge(self, vertex_id1, vertex_id2, *edge_data):
+        """
+        Store an edge, passing any extra `edge_data` to `add_neighbor`, and
+        keep the snapshots and the reverse index up to date.
+        """
+        vertex1 = self._vertex_dict[vertex_id1]
+        vertex2 = self._vertex_dict[vertex_id2]
+        if self._owned_ids is not None:
+            self._copy_on_write(vertex1)
+            if not self._is_directed:
+                self._copy_on_write(vertex2)
+        vertex1.add_neighbor(vertex2, *edge_data)
+        if(not self._is_directed):
+            vertex2.add_neighbor(vertex1, *edge_data)
+        elif self._in_adjacency is not None:
+            self._in_adjacency[vertex_id2][vertex_id1] = vertex1
+
+    def remove_edge(self, vertex_id1, vertex_id2):
+        """
+        Remove the edge from vertex `vertex_id1` to vertex `vertex_id2`.
+
+        Parameters:
+        vertex_id1 (string): The unique identifier of the first vertex.
+        vertex_id2 (string): The unique identifier of the second vertex.
+        """
+        if (vertex_id1 not in self._vertex_dict or vertex_id2 not in self._vertex_dict
+                or vertex_id2 not in self._adjacency[vertex_id1]):
+            raise KeyError("Edge is not in the graph!")
+        vertex1 = self._vertex_dict[vertex_id1]
+        vertex2 = self._vertex_dict[vertex_id2]
+        if self._owned_ids is not None:
+            self._copy_on_write(vertex1)
+            if not self._is_directed:
+                self._copy_on_write(vertex2)
+        vertex1.remove_neighbor(vertex_id2)
+        if not self._is_directed:
+            if vertex_id1 != vertex_id2:
+                vertex2.remove_neighbor(vertex_id1)
+        elif self._in_adjacency is not None:
+            del self._in_adjacency[vertex_id2][vertex_id1]
+
+    def remove_vertex(self, vertex_id):
+        """
+        Remove a vertex and every edge into or out of it.
+
+        This takes O(degree) for undirected graphs and for directed graphs
+        with the reverse index, and O(V) for directed graphs without it.
+
+        Parameters:
+        vertex_id (string): The unique identifier of the vertex to remove.
+        """
+        if vertex_id not in self._vertex_dict:
+            raise KeyError("Vertex is not in the graph!")
+
+        if not self._is_directed:
+            source_ids = list(self._adjacency[vertex_id])
+        elif self._in_adjacency is not None:
+            source_ids = list(self._in_adjacency[vertex_id])
+            for neighbor_id in self._adjacency[vertex_id]:
+                if neighbor_id != vertex_id:
+                    del self._in_adjacency[neighbor_id][vertex_id]
+        else:
+            source_ids = [source_id for source_id, neighbors in self._adjacency.items()
+                          if vertex_id in neighbors]
+
+        for source_id in source_ids:
+            if source_id == vertex_id:
+                continue
+            source_vertex = self._vertex_dict[source_id]
+            if self._owned_ids is not None:
+                self._copy_on_write(source_vertex)
+            source_vertex.remove_neighbor(vertex_id)
+
+        if self._owned_ids is not None:
+            self._copy_on_write()
+            self._owned_ids.discard(vertex_id)
+        del self._vertex_dict[vertex_id]
+        del self._adjacency[vertex_id]
+        if self._weight_adjacency is not None:
+            del self._weight_adjacency[vertex_id]
+        if self._in_adjacency is not None:
+            del self._in_adjacency[vertex_id]
+
+    def enable_reverse_index(self):
+        """
+        Start maintaining the in-neighbors of every vertex, so that
+        `get_in_neighbors` takes O(in-degree) and `get_in_degree` O(1).
+        Building the index takes O(V + E); afterwards each `add_edge`
+        updates it in O(1). Undirected graphs need no index.
+        """
+        if not self._is_directed or self._in_adjacency is not None:
+            return
+        in_adjacency = {vertex_id: {} for vertex_id in self._vertex_dict}
+        for vertex_id, vertex_obj in self._vertex_dict.items():
+            for neighbor_id in self._adjacency[vertex_id]:
+                in_adjacency[neighbor_id][vertex_id] = vertex_obj
+        self._in_adjacency = in_adjacency
+
+    def has_reverse_index(self):
+        """Return True if in-neighbor queries avoid scanning the whole graph."""
+        return not self._is_directed or self._in_adjacency is not None
+
+    def get_in_neighbors(self, vertex_id):
+        """
+        Return the vertices with an edge pointing to the given vertex.
+
+        This scans every edge unless the reverse index is enabled.
+
+        Parameters:
+        vertex_id (string): The unique identifier of the vertex.
+
+        Returns:
+        List<Vertex>: The vertex objects with an edge to `vertex_id`.
+        """
+        if vertex_id not in self._vertex_dict:
+            raise KeyError("Vertex is not in the graph!")
+        if not self._is_directed:
+            return self._vertex_dict[vertex_id].get_neighbors()
+        if self._in_adjacency is not None:
+            return list(self._in_adjacency[vertex_id].values())
+        return [self._vertex_dict[source_id]
+                for source_id, neighbors in self._adjacency.items()
+                if vertex_id in neighbors]
+
+    def get_in_degree(self, vertex_id):
+        """
+        Return the number of edges pointing to the given vertex.
+
+        This is O(1) with the reverse index and O(V) without it.
+        """
+        if vertex_id not in self._vertex_dict:
+            raise KeyError("Vertex is not in the graph!")
+        if not self._is_directed:
+            return len(self._adjacency[vertex_id])
+        if self._in_adjacency is not None:
+            return len(self._in_adjacency[vertex_id])
+        return sum(1 for neighbors in self._adjacency.values()
+                   if vertex_id in neighbors)
+
+    def snapshot(self):
+        """
+        Return an immutable view of the graph as it is right now.
+
+        Taking a snapshot is O(1). Later writes copy only the dictionaries
+        they touch, so readers can keep querying the snapshot from other
+        threads while this graph keeps changing.
+
+        Returns:
+        GraphSnapshot: A read-only graph sharing structure with this one.
+        """
+        from graphs.snapshot import GraphSnapshot
+
+        self._adjacency_shared = True
+        self._owned_ids = set()
+        return GraphSnapshot(self._adjacency, self._is_directed, self._weight_adjacency)
+
+    def _copy_on_write(self, vertex_obj=None):
+        """
+        Make sure the adjacency (and the neighbors of `vertex_obj`) are no
+        longer shared with a snapshot before they are modified.
+        """
+        if self._adjacency_shared:
+            self._adjacency = dict(self._adjacency)
+            if self._weight_adjacency is not None:
+                self._weight_adjacency = dict(self._weight_adjacency)
+            self._adjacency_shared = False
+        if vertex_obj is not None:
+            vertex_id = vertex_obj.get_id()
+            if vertex_id not in self._owned_ids:
+                self._adjacency[vertex_id] = vertex_obj._copy_neighbors_dict()
+                if self._weight_adjacency is not None:
+                    self._weight_adjacency[vertex_id] = vertex_obj._weights_dict
+                self._owned_ids.add(vertex_id)
         
     def get_vertices(self):
         """
@@ -102,10 +349,22 @@ class Graph:
         Returns:
         List<Vertex>: The vertex objects contained in the graph.
         """
-        return list(self.__vertex_dict.values())
+        return list(self._vertex_dict.values())
 
     def contains_id(self, vertex_id):
-        return vertex_id in self.__vertex_dict
+        return vertex_id in self._vertex_dict
+
+    def is_weighted(self):
+        """Return True if the edges carry weights (a WeightedGraph)."""
+        return self._weight_adjacency is not None
+
+    def is_directed(self):
+        """Return True if edges go in only one direction."""
+        return self._is_directed
+
+    def get_neighbor_ids(self, vertex_id):
+        """Return the ids of the neighbors of the given vertex."""
+        return list(self._adjacency[vertex_id].keys())
 
     def __str__(self):
         """Return a string representation of the graph."""
@@ -159,10 +418,13 @@ class Graph:
         if not self.contains_id(start_id) or not self.contains_id(target_id):
             raise KeyError("One or both vertices are not in the graph!")
 
-        # vertex keys we've seen before and their paths from the start vertex
-        vertex_id_to_path = {
-            start_id: [start_id] # only one thing in the path
-        }
+        profiler = self._profiler
+        if profiler is not None:
+            start_time = profiler.start()
+
+        # vertex keys we've seen before and the vertex we reached them from;
+        # copying whole paths here made long chains quadratic
+        parent = {start_id: None}
 
         # queue of vertices to visit next
         queue = deque() 
@@ -170,26 +432,111 @@ class Graph:
 
         # while queue is not empty
         while queue:
-            current_vertex_obj = queue.pop() # vertex obj to visit next
+            current_vertex_obj = queue.popleft() # vertex obj to visit next
             current_vertex_id = current_vertex_obj.get_id()
 
             # found target, can stop the loop early
             if current_vertex_id == target_id:
                 break
 
-            neighbors = current_vertex_obj.get_neighbors()
-            for neighbor in neighbors:
-                if neighbor.get_id() not in vertex_id_to_path:
-                    current_path = vertex_id_to_path[current_vertex_id]
-                    # extend the path by 1 vertex
-                    next_path = current_path + [neighbor.get_id()]
-                    vertex_id_to_path[neighbor.get_id()] = next_path
+            for neighbor in current_vertex_obj.get_neighbors():
+                if neighbor.get_id() not in parent:
+                    parent[neighbor.get_id()] = current_vertex_id
                     queue.append(neighbor)
 
-        if target_id not in vertex_id_to_path: # path not found
+        if profiler is not None:
+            visited, relaxed = self._count_expanded(parent, queue)
+            if target_id in parent and not any(vertex.get_id() == target_id
+                                               for vertex in queue):
+                # the target was dequeued but its edges were not scanned
+                relaxed -= len(self._adjacency[target_id])
+            profiler.record('find_shortest_path', start_time, visited, relaxed)
+
+        if target_id not in parent: # path not found
             return None
 
-        return vertex_id_to_path[target_id]
+        path = []
+        vertex_id = target_id
+        while vertex_id is not None:
+            path.append(vertex_id)
+            vertex_id = parent[vertex_id]
+        path.reverse()
+        return path
+
+    def find_shortest_paths(self, start_id, target_ids):
+        """
+        Find the shortest paths from start_id to several targets with a single
+        breadth-first search, stopping once every target has been reached.
+
+        Parameters:
+        start_id (string): The id of the start vertex.
+        target_ids (list<string>): The ids of the target vertices.
+
+        Returns:
+        dict<string, list<string>>: Target id -> list of vertex ids in the
+        shortest path from start to target, or None if it is unreachable.
+        """
+        if not self.contains_id(start_id):
+            raise KeyError("One or both vertices are not in the graph!")
+        for target_id in target_ids:
+            if not self.contains_id(target_id):
+                raise KeyError("One or both vertices are not in the graph!")
+
+        profiler = self._profiler
+        if profiler is not None:
+            start_time = profiler.start()
+
+        # store only the previous vertex, paths are rebuilt for the targets
+        parent = {start_id: None}
+        remaining = set(target_ids)
+        remaining.discard(start_id)
+
+        queue = deque()
+        queue.append(self.get_vertex(start_id))
+        while queue and remaining:
+            current_vertex_obj = queue.popleft()
+            current_vertex_id = current_vertex_obj.get_id()
+
+            for neighbor in current_vertex_obj.get_neighbors():
+                neighbor_id = neighbor.get_id()
+                if neighbor_id not in parent:
+                    parent[neighbor_id] = current_vertex_id
+                    remaining.discard(neighbor_id)
+                    queue.append(neighbor)
+
+        if profiler is not None:
+            visited, relaxed = self._count_expanded(parent, queue)
+            profiler.record('find_shortest_paths', start_time, visited, relaxed)
+
+        paths = {}
+        for target_id in target_ids:
+            if target_id not in parent: # path not found
+                paths[target_id] = None
+                continue
+            path = []
+            vertex_id = target_id
+            while vertex_id is not None:
+                path.append(vertex_id)
+                vertex_id = parent[vertex_id]
+            path.reverse()
+            paths[target_id] = path
+        return paths
+
+    def _count_expanded(self, parent, queue):
+        """
+        Return (vertices dequeued, edges scanned) by a breadth-first search
+        that reached the keys of `parent` and left the vertices in `queue`
+        unvisited. Only called while profiling, so the search loops
+        themselves carry no counters.
+        """
+        waiting = {vertex.get_id() for vertex in queue}
+        visited = 0
+        relaxed = 0
+        for vertex_id in parent:
+            if vertex_id not in waiting:
+                visited += 1
+                relaxed += len(self._adjacency[vertex_id])
+        return visited, relaxed
 
     def find_vertices_n_away(self, start_id, target_distance):
         """
@@ -202,81 +549,288 @@ class Graph:
         Returns:
         list<string>: All vertex ids that are `target_distance` away from the start vertex
         """
+        return self.find_k_hop_neighborhood([start_id], target_distance)
+
+    def find_k_hop_neighborhood(self, start_ids, k, mode='exact', count_only=False):
+        """
+        Run a level-by-level breadth-first search from one or more start
+        vertices that stops as soon as level `k` is known.
+
+        Every vertex is marked as seen when it is queued, so it is expanded at
+        most once, and vertices on level `k` are never expanded at all.
+
+        Arguments:
+        start_ids (list<string>): The ids of the start vertices (distance 0).
+        k (integer): The number of hops to search.
+        mode (string): 'exact' for the vertices exactly `k` hops away,
+        'within' for those at most `k` hops away (including the starts), or
+        'levels' for a list whose entry `d` holds the vertices `d` hops away.
+        count_only (boolean): Return the number of vertices instead of ids.
+
+        Returns:
+        list<string> or int: For 'exact' and 'within'.
+        list<list<string>> or list<int>: For 'levels'.
+        """
+        if mode not in ('exact', 'within', 'levels'):
+            raise ValueError(f'Unknown k-hop mode: {mode}')
+        if k < 0:
+            raise ValueError("k must not be negative")
+
+        frontier = []
         seen = set()
-        dist_dict = {start_id: 0}
-        quene = [start_id]
-        current_dist = 0
-        correct_dist = []
-        while len(quene) > 0 and current_dist < target_distance:
-            current_id = quene.pop(0)
-            seen.add(current_id)
-            current_dist = dist_dict[current_id]
-            current_vertex = self.get_vertex(current_id)
-            for neighbor in current_vertex.get_neighbors():
-                neighbor_id = neighbor.get_id()
-                if neighbor_id not in seen:
-                    quene.append(neighbor_id)
-                
-                if neighbor_id not in dist_dict:
-                    dist_dict[neighbor_id] = current_dist + 1
-                    if current_dist + 1 == target_distance:
-                        correct_dist.append(neighbor_id)
-        return correct_dist
+        for start_id in start_ids:
+            if not self.contains_id(start_id):
+                raise KeyError("One or both vertices are not in the graph!")
+            if start_id not in seen:
+                seen.add(start_id)
+                frontier.append(start_id)
+
+        keep_levels = mode != 'exact' and not count_only
+        levels = [frontier] if keep_levels else None
+        counts = [len(frontier)]
+
+        depth = 0
+        while depth < k and frontier:
+            next_frontier = []
+            for vertex_id in frontier:
+                for neighbor_id in self.get_neighbor_ids(vertex_id):
+                    if neighbor_id not in seen:
+                        seen.add(neighbor_id)
+                        next_frontier.append(neighbor_id)
+            frontier = next_frontier
+            depth += 1
+            counts.append(len(frontier))
+            if keep_levels:
+                levels.append(frontier)
+
+        if depth < k:
+            # ran out of vertices before reaching level k
+            frontier = []
+            counts.extend([0] * (k - depth))
+            if keep_levels:
+                levels.extend([] for _ in range(k - depth))
+
+        if mode == 'exact':
+            return len(frontier) if count_only else frontier
+        if mode == 'within':
+            if count_only:
+                return sum(counts)
+            return [vertex_id for level in levels for vertex_id in level]
+        return counts if count_only else levels
+
+    def to_compact(self, undirected=False):
+        """
+        Return an integer-indexed copy of the graph backed by flat arrays.
+
+        Parameters:
+        undirected (boolean): Store every edge of a directed graph in both
+        directions.
+
+        Returns:
+        CompactGraph: The compact copy.
+        """
+        return CompactGraph.from_graph(self, undirected)
+
+    def compute_statistics(self, samples=10000, seed=None):
+        """
+        Summarize the graph for capacity planning: the out-degree
+        distribution, a double-sweep diameter estimate and a sampled
+        clustering coefficient, computed on the compact representation
+        (see graphs/statistics.py).
+
+        Parameters:
+        samples (int): Wedges sampled for the clustering estimate.
+        seed (int): Seed for the random generator, for repeatable estimates.
+
+        Returns:
+        dict: With keys 'num_vertices', 'degree_distribution',
+        'diameter_estimate', 'diameter_endpoints', 'clustering_coefficient'
+        and 'triangle_estimate'.
+        """
+        from graphs.statistics import graph_statistics
+
+        return graph_statistics(self.to_compact(), samples, seed)
 
     def is_bipartite(self):
-        start_id = list(self.__vertex_dict.keys())[0]
-        quene = [start_id]
-        color_dict = {start_id: 0}
-        seen = set()
-        seen.add(start_id)
-        current_color = 0
-        while len(quene) > 0:
-            current_id = quene.pop(0)
-            current_color = color_dict[current_id]
-            seen.add(current_id)
-            current_node = self.get_vertex(current_id)
-            for neighbor in current_node.get_neighbors():
-                neighbor_id = neighbor.get_id()
-                if neighbor_id in color_dict:
-                    if color_dict[neighbor_id] == current_color:
-                        return False
-                else:
-                    color_dict[neighbor_id] = (current_color + 1) % 2
-                    quene.append(neighbor_id)
-        return True
+        """
+        Return True if the vertices can be split into two sets with every
+        edge going between the sets. Every component is checked.
+        """
+        return self.find_bipartition()[0]
+
+    def find_bipartition(self):
+        """
+        Two-color the graph (ignoring edge directions) in O(V + E), running
+        on the compact integer-indexed representation.
+
+        Returns:
+        tuple: (True, [left_ids, right_ids]) with the two sets of vertex ids,
+        or (False, cycle_ids) with the vertex ids of an odd cycle that proves
+        the graph is not bipartite.
+        """
+        compact = self.to_compact(undirected=True)
+        is_bipartite, result = compact.find_bipartition()
+        vertex_ids = compact.vertex_ids
+        if not is_bipartite:
+            return False, [vertex_ids[i] for i in result]
+
+        sides = [[], []]
+        for i, color in enumerate(result):
+            sides[color].append(vertex_ids[i])
+        return True, sides
 
     def find_connected_components(self):
-        all_ids = set(self.__vertex_dict.keys())
+        """
+        Return the connected components of the graph as lists of vertex ids.
+        For a directed graph these are the weakly connected components, so
+        the result does not depend on where the search starts.
+        """
+        return self.find_weakly_connected_components()
 
-        components = []
+    def find_weakly_connected_components(self):
+        """
+        Return the components of the graph when edge directions are ignored,
+        as lists of vertex ids. Runs in O(V + E).
+        """
+        adjacency = self._adjacency
+        if self._in_adjacency is not None:
+            in_adjacency = self._in_adjacency
+            adjacency = {vertex_id: list(neighbors) + list(in_adjacency[vertex_id])
+                         for vertex_id, neighbors in adjacency.items()}
+        elif self._is_directed:
+            # add the reverse of every edge so both directions can be followed
+            undirected = {vertex_id: list(neighbors)
+                          for vertex_id, neighbors in adjacency.items()}
+            for vertex_id, neighbors in adjacency.items():
+                for neighbor_id in neighbors:
+                    undirected[neighbor_id].append(vertex_id)
+            adjacency = undirected
 
-        while len(all_ids) > 0:
-            start_id = list(all_ids).pop()
-            all_ids.remove(start_id)
-            start_vertex = self.get_vertex(start_id)
-            seen = set()
-            quene = [start_id]
+        components = []
+        seen = set()
+        for start_id in adjacency:
+            if start_id in seen:
+                continue
             seen.add(start_id)
-            while len(quene) > 0:
-                current_id = quene.pop(0)
-                current_vertex = self.get_vertex(current_id)
-                for neighbor in current_vertex.get_neighbors():
-                    neighbor_id = neighbor.get_id()
-                    if neighbor_id in all_ids:
-                        all_ids.remove(neighbor_id)
+            component = [start_id]
+            queue = deque([start_id])
+            while queue:
+                current_id = queue.popleft()
+                for neighbor_id in adjacency[current_id]:
                     if neighbor_id not in seen:
-                        quene.append(neighbor_id)
                         seen.add(neighbor_id)
-            components.append(list(seen))
-        return(components)
-    
+                        component.append(neighbor_id)
+                        queue.append(neighbor_id)
+            components.append(component)
+        return components
+
+    def find_strongly_connected_components(self):
+        """
+        Use Tarjan's Algorithm (without recursion) to return the strongly
+        connected components of the graph as lists of vertex ids.
+
+        Components come out in reverse topological order: no component has
+        an edge to a component listed after it. Runs in O(V + E).
+        """
+        adjacency = self._adjacency
+        index = {} # vertex_id -> order in which the DFS reached it
+        lowlink = {} # vertex_id -> smallest index reachable from its subtree
+        stack = []
+        on_stack = set()
+        components = []
+        counter = 0
+
+        for root_id in adjacency:
+            if root_id in index:
+                continue
+            index[root_id] = lowlink[root_id] = counter
+            counter += 1
+            stack.append(root_id)
+            on_stack.add(root_id)
+            # explicit DFS stack of (vertex_id, iterator over its neighbors)
+            work = [(root_id, iter(adjacency[root_id]))]
+
+            while work:
+                vertex_id, neighbors = work[-1]
+                descended = False
+                for neighbor_id in neighbors:
+                    if neighbor_id not in index:
+                        index[neighbor_id] = lowlink[neighbor_id] = counter
+                        counter += 1
+                        stack.append(neighbor_id)
+                        on_stack.add(neighbor_id)
+                        work.append((neighbor_id, iter(adjacency[neighbor_id])))
+                        descended = True
+                        break
+                    if neighbor_id in on_stack and index[neighbor_id] < lowlink[vertex_id]:
+                        lowlink[vertex_id] = index[neighbor_id]
+                if descended:
+                    continue
+
+                # every neighbor is done, so vertex_id is finished
+                work.pop()
+                if work:
+                    parent_id = work[-1][0]
+                    if lowlink[vertex_id] < lowlink[parent_id]:
+                        lowlink[parent_id] = lowlink[vertex_id]
+
+                if lowlink[vertex_id] == index[vertex_id]:
+                    component = []
+                    while True:
+                        member_id = stack.pop()
+                        on_stack.remove(member_id)
+                        component.append(member_id)
+                        if member_id == vertex_id:
+                            break
+                    components.append(component)
+
+        return components
+
+    def condensation(self):
+        """
+        Collapse every strongly connected component into a single vertex.
+
+        Returns:
+        tuple<Graph, list<list<string>>>: A directed acyclic graph whose
+        vertex ids are indexes into the list of components, and that list.
+        The DAG can be passed straight to `topological_sort`.
+        """
+        # Tarjan lists sinks first; flip it so index order is topological
+        components = self.find_strongly_connected_components()
+        components.reverse()
+
+        component_of = {}
+        for component_index, component in enumerate(components):
+            for vertex_id in component:
+                component_of[vertex_id] = component_index
+
+        dag = Graph(is_directed=True)
+        for component_index in range(len(components)):
+            dag.add_vertex(component_index)
+        for vertex_id, neighbors in self._adjacency.items():
+            component_index = component_of[vertex_id]
+            for neighbor_id in neighbors:
+                neighbor_index = component_of[neighbor_id]
+                if neighbor_index != component_index:
+                    dag.add_edge(component_index, neighbor_index)
+        return dag, components
+
     def topological_sort(self):
         """
         Return a valid ordering of vertices in a directed acyclic graph.
         If the graph contains a cycle, throw a ValueError.
         """
+        profiler = self._profiler
+        if profiler is not None:
+            start_time = profiler.start()
+
         verts = self.get_vertices()
         indegree_dict = {}
+        if self._in_adjacency is not None:
+            # the reverse index already knows every in-degree
+            indegree_dict = {vertex_id: len(sources)
+                             for vertex_id, sources in self._in_adjacency.items()}
+            verts = []
         for vert in verts:
             if vert.get_id() not in indegree_dict:
                 indegree_dict[vert.get_id()] = 0
@@ -303,6 +857,15 @@ class Graph:
                 indegree_dict[neighbor_id] -= 1
                 if indegree_dict[neighbor_id] == 0:
                     indeg0.append(neighbor_id)
+
+        if profiler is not None:
+            # every sorted vertex had all of its edges scanned
+            relaxed = sum(len(self._adjacency[vertex_id]) for vertex_id in sorted_list)
+            profiler.record('topological_sort', start_time, len(sorted_list), relaxed)
+
+        # vertices on a cycle never reach in-degree 0
+        if len(sorted_list) < len(indegree_dict):
+            raise ValueError("Graph contains a cycle!")
         return sorted_list
 
     def find_path_dfs_iter(self, start_id, target_id):
@@ -351,7 +914,7 @@ class Graph:
             stack.remove(vertex)
             return False
 
-        all_ids = set(self.__vertex_dict.keys())
+        all_ids = set(self._vertex_dict.keys())
 
         visited = set()
         while len(all_ids) > 0:
@@ -0,0 +1,108 @@
+import time
+
+
+class AlgorithmStats(object):
+    """
+    Counters collected during a single run of a graph algorithm.
+    """
+
+    def __init__(self, algorithm):
+        """
+        Initialize an empty set of counters for one algorithm call.
+
+        Parameters:
+        algorithm (string): The name of the algorithm that was run.
+        """
+        self.algorithm = algorithm
+        self.vertices_visited = 0
+        self.edges_relaxed = 0
+        self.heap_operations = 0
+        self.wall_time = 0.0
+
+    def __str__(self):
+        """Return a one line summary of the counters."""
+        return (f'{self.algorithm}: {self.vertices_visited} vertices visited, '
+                f'{self.edges_relaxed} edges relaxed, '
+                f'{self.heap_operations} heap operations, '
+                f'{self.wall_time:.6f}s')
+
+    def __repr__(self):
+        """Return a one line summary of the counters."""
+        return self.__str__()
+
+
+class Profiler(object):
+    """
+    Collects AlgorithmStats from a graph that has profiling enabled.
+
+    A graph only holds a profiler while profiling is turned on. The
+    algorithms keep no counters in their loops: they check `is None` once
+    per call and, only when a profiler is attached, work the counts out
+    from the finished search or run through a counting view of the graph.
+    """
+
+    def __init__(self, callback=None):
+        """
+        Initialize a profiler with no recorded calls.
+
+        Parameters:
+        callback (function): Optional hook called with each AlgorithmStats
+        as soon as the algorithm finishes.
+        """
+        self.callback = callback
+        self.history = []
+        self.last = {} # algorithm name -> most recent AlgorithmStats
+
+    def start(self):
+        """Return a timestamp marking the start of an algorithm call."""
+        return time.perf_counter()
+
+    def record(self, algorithm, start_time, vertices_visited=0,
+               edges_relaxed=0, heap_operations=0):
+        """
+        Store the counters of a finished algorithm call and return them.
+
+        Parameters:
+        algorithm (string): The name of the algorithm that was run.
+        start_time (float): The value returned by `start()` for this call.
+        vertices_visited (int): Number of vertices taken off the frontier.
+        edges_relaxed (int): Number of edges examined.
+        heap_operations (int): Number of pushes and pops on a priority queue.
+
+        Returns:
+        AlgorithmStats: The counters for this call.
+        """
+        stats = AlgorithmStats(algorithm)
+        stats.vertices_visited = vertices_visited
+        stats.edges_relaxed = edges_relaxed
+        stats.heap_operations = heap_operations
+        stats.wall_time = time.perf_counter() - start_time
+
+        self.history.append(stats)
+        self.last[algorithm] = stats
+        if self.callback is not None:
+            self.callback(stats)
+        return stats
+
+    def totals(self):
+        """
+        Return the counters summed over every recorded call, per algorithm.
+
+        Returns:
+        dict<string, AlgorithmStats>: Algorithm name -> summed counters.
+        """
+        totals = {}
+        for stats in self.history:
+            if stats.algorithm not in totals:
+                totals[stats.algorithm] = AlgorithmStats(stats.algorithm)
+            total = totals[stats.algorithm]
+            total.vertices_visited += stats.vertices_visited
+            total.edges_relaxed += stats.edges_relaxed
+            total.heap_operations += stats.heap_operations
+            total.wall_time += stats.wall_time
+        return totals
+
+    def reset(self):
+        """Forget every recorded call."""
+        self.history = []
+        self.last = {}
@@ -0,0 +1,168 @@
+import asyncio
+import time
+from collections import deque
+
+
+class GraphQueryService(object):
+    """
+    Serve graph queries from asyncio code.
+
+    - Identical queries that are still in flight share one result.
+    - Shortest path queries from the same start vertex that arrive within
+      `batch_window` seconds are answered by a single breadth-first search
+      (unweighted graphs only; weighted queries each run their own search).
+    - Traversals run in an executor so the event loop never blocks.
+
+    The service reads from whatever graph was last published, typically a
+    `Graph.snapshot()`, so a writer thread can keep editing the live graph
+    and publish a fresh snapshot when it is ready. Each query is answered
+    from the graph that was published when it arrived, even if a batch or
+    an identical query is still running.
+    """
+
+    def __init__(self, graph, executor=None, batch_window=0.001, latency_window=10000):
+        """
+        Initialize the service.
+
+        Parameters:
+        graph (Graph or GraphSnapshot): The graph to answer queries from.
+        executor (concurrent.futures.Executor): Where traversals run. None
+        uses the event loop's default thread pool.
+        batch_window (float): Seconds to wait for more queries with the same
+        start vertex before running a batch.
+        latency_window (int): How many of the most recent query latencies
+        to keep for `latency_percentiles`.
+        """
+        self.__graph = graph
+        self.__executor = executor
+        self.__batch_window = batch_window
+        self.__in_flight = {} # query key -> future shared by its callers
+        self.__pending_paths = {} # (graph, start_id) -> {target_id: future}
+        # seconds, one per answered query, oldest dropped first
+        self.__latencies = deque(maxlen=latency_window)
+        self.batches_run = 0
+
+    def publish(self, graph):
+        """
+        Answer every query that starts after this call from `graph`.
+
+        Parameters:
+        graph (Graph or GraphSnapshot): The new graph to read from.
+        """
+        self.__graph = graph
+
+    async def find_shortest_path(self, start_id, target_id):
+        """
+        Find and return the shortest path from start_id to target_id.
+
+        Returns:
+        list<string>: For an unweighted graph, a list of all vertex ids in
+        the shortest path, from start to end, or None if there is no path.
+        number: For a weighted graph, the total weight of the shortest path
+        (see `WeightedGraph.find_shortest_path`), or None.
+        """
+        graph = self.__graph
+        if not graph.contains_id(start_id) or not graph.contains_id(target_id):
+            raise KeyError("One or both vertices are not in the graph!")
+
+        # the graph is part of the key so callers that arrive after `publish()`
+        # never share an answer computed on the old graph
+        key = ('find_shortest_path', graph, start_id, target_id)
+        if graph.is_weighted():
+            # batches share one breadth-first search, which ignores weights
+            loop = asyncio.get_running_loop()
+            return await self.__coalesce(key, lambda: loop.run_in_executor(
+                self.__executor, graph.find_shortest_path, start_id, target_id))
+        return await self.__coalesce(
+            key, lambda: self.__queue_path(graph, start_id, target_id))
+
+    async def find_vertices_n_away(self, start_id, target_distance):
+        """
+        Find and return all vertex ids `target_distance` away from start_id.
+        """
+        graph = self.__graph
+        if not graph.contains_id(start_id):
+            raise KeyError("One or both vertices are not in the graph!")
+
+        key = ('find_vertices_n_away', graph, start_id, target_distance)
+        loop = asyncio.get_running_loop()
+        return await self.__coalesce(key, lambda: loop.run_in_executor(
+            self.__executor, graph.find_vertices_n_away, start_id, target_distance))
+
+    def latency_percentiles(self, percentiles=(50, 90, 99)):
+        """
+        Return the latency of the last `latency_window` answered queries at
+        the given percentiles. Sorting them costs O(window log window).
+
+        Parameters:
+        percentiles (tuple<number>): Percentiles between 0 and 100.
+
+        Returns:
+        dict<number, float>: Percentile -> latency in seconds, empty if no
+        query has been answered yet.
+        """
+        latencies = sorted(self.__latencies)
+        if not latencies:
+            return {}
+        result = {}
+        for percentile in percentiles:
+            # nearest-rank percentile
+            rank = max(int(len(latencies) * percentile / 100.0 + 0.5), 1)
+            result[percentile] = latencies[min(rank, len(latencies)) - 1]
+        return result
+
+    def reset_latencies(self):
+        """Forget the recorded latencies."""
+        self.__latencies.clear()
+
+    async def __coalesce(self, key, start_query):
+        """Await the in-flight future for `key`, starting it if needed."""
+        start_time = time.perf_counter()
+        future = self.__in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(start_query())
+            self.__in_flight[key] = future
+            future.add_done_callback(lambda _: self.__in_flight.pop(key, None))
+
+        # shield so one cancelled caller does not cancel everyone else
+        result = await asyncio.shield(future)
+        self.__latencies.append(time.perf_counter() - start_time)
+        return result
+
+    def __queue_path(self, graph, start_id, target_id):
+        """
+        Add a target to the batch for start_id on `graph`, the graph the
+        query was checked against, and return its future.
+        """
+        loop = asyncio.get_running_loop()
+        batch_key = (graph, start_id)
+        batch = self.__pending_paths.get(batch_key)
+        if batch is None:
+            batch = {}
+            self.__pending_paths[batch_key] = batch
+            loop.call_later(self.__batch_window, self.__run_path_batch, graph, start_id)
+
+        future = loop.create_future()
+        batch[target_id] = future
+        return future
+
+    def __run_path_batch(self, graph, start_id):
+        """Answer every pending target of start_id on `graph` with one search."""
+        batch = self.__pending_paths.pop((graph, start_id))
+        loop = asyncio.get_running_loop()
+        self.batches_run += 1
+
+        search = loop.run_in_executor(
+            self.__executor, graph.find_shortest_paths, start_id, list(batch))
+
+        def deliver(search):
+            error = search.exception()
+            for target_id, future in batch.items():
+                if future.done():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(search.result()[target_id])
+
+        search.add_done_callback(deliver)
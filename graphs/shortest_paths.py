@@ -0,0 +1,411 @@
+import heapq
+from collections import deque
+
+
+# Largest edge weight for which Dial's bucket queue is used automatically.
+# Dial's algorithm keeps `max_weight + 1` buckets, so it only beats a binary
+# heap while that circular array stays small.
+DIAL_MAX_WEIGHT = 256
+
+
+def _expanded_edges(graph, vertex_ids):
+    """Return the number of edges leaving the given vertices."""
+    return sum(len(graph.get_vertex(vertex_id).get_neighbors_with_weights())
+               for vertex_id in vertex_ids)
+
+
+def _record_search(stats, graph, settled, target_id, queue_ops):
+    """
+    Fill in `stats` for a finished Dijkstra style search. Every settled
+    vertex had its edges relaxed, except the target the search stopped at.
+    """
+    relaxed = _expanded_edges(graph, settled)
+    if target_id in settled:
+        relaxed -= _expanded_edges(graph, [target_id])
+    stats.vertices_visited += len(settled)
+    stats.edges_relaxed += relaxed
+    stats.heap_operations += queue_ops
+
+
+def dijkstra_heap(graph, start_id, target_id, stats=None):
+    """
+    Use Dijkstra's Algorithm with a binary heap to return the total weight of
+    the shortest path from a start vertex to a destination.
+
+    Parameters:
+    graph (WeightedGraph): A graph with non-negative edge weights.
+    start_id (string): The id of the start vertex.
+    target_id (string): The id of the target vertex.
+    stats (AlgorithmStats): Optional counters to fill in.
+
+    Returns:
+    number: The shortest distance, or None if the target is unreachable.
+    """
+    distances = {start_id: 0}
+    settled = set()
+    heap = [(0, 0, start_id)]
+    counter = 1 # tie breaker so vertex ids are never compared
+    result = None
+
+    while heap:
+        distance, _, vertex_id = heapq.heappop(heap)
+        if vertex_id in settled:
+            continue
+        settled.add(vertex_id)
+        if vertex_id == target_id:
+            result = distance
+            break
+
+        for neighbor_id, weight in graph.get_vertex(vertex_id).get_neighbors_with_weights():
+            new_distance = distance + weight
+            if new_distance < distances.get(neighbor_id, float('inf')):
+                distances[neighbor_id] = new_distance
+                heapq.heappush(heap, (new_distance, counter, neighbor_id))
+                counter += 1
+
+    if stats is not None:
+        # `counter` entries were pushed and all but those left were popped
+        _record_search(stats, graph, settled, target_id, 2 * counter - len(heap))
+    return result
+
+
+def dial(graph, start_id, target_id, max_weight, stats=None):
+    """
+    Use Dial's Algorithm (Dijkstra with a circular bucket queue) to return the
+    total weight of the shortest path from a start vertex to a destination.
+
+    Every edge weight must be an integer between 0 and `max_weight`, which
+    means all tentative distances in the queue fall within `max_weight + 1`
+    consecutive values and fit in that many buckets.
+
+    Parameters:
+    graph (WeightedGraph): A graph with small non-negative integer weights.
+    start_id (string): The id of the start vertex.
+    target_id (string): The id of the target vertex.
+    max_weight (int): An upper bound on every edge weight.
+    stats (AlgorithmStats): Optional counters to fill in.
+
+    Returns:
+    int: The shortest distance, or None if the target is unreachable.
+    """
+    num_buckets = max_weight + 1
+    buckets = [[] for _ in range(num_buckets)]
+    buckets[0].append(start_id)
+    distances = {start_id: 0}
+    settled = set()
+    pushed = 1 # entries put into a bucket so far
+    popped = 0 # entries taken out again
+    distance = 0
+    result = None
+
+    while popped < pushed:
+        bucket = buckets[distance % num_buckets]
+        if not bucket:
+            distance += 1
+            continue
+
+        vertex_id = bucket.pop()
+        popped += 1
+        # stale entry, the vertex was moved to a closer bucket later on
+        if vertex_id in settled or distances[vertex_id] != distance:
+            continue
+        settled.add(vertex_id)
+        if vertex_id == target_id:
+            result = distance
+            break
+
+        for neighbor_id, weight in graph.get_vertex(vertex_id).get_neighbors_with_weights():
+            new_distance = distance + weight
+            if new_distance < distances.get(neighbor_id, float('inf')):
+                distances[neighbor_id] = new_distance
+                buckets[new_distance % num_buckets].append(neighbor_id)
+                pushed += 1
+
+    if stats is not None:
+        _record_search(stats, graph, settled, target_id, pushed + popped)
+    return result
+
+
+def delta_stepping(graph, start_id, target_id, delta, stats=None):
+    """
+    Use the (sequential) delta-stepping algorithm to return the total weight
+    of the shortest path from a start vertex to a destination.
+
+    Vertices are kept in buckets of width `delta`. Light edges (weight at most
+    `delta`) are relaxed repeatedly inside the current bucket, heavy edges
+    once the bucket is empty. A `delta` of 1 on integer weights behaves like
+    Dial's algorithm, a very large `delta` like Bellman-Ford.
+
+    Parameters:
+    graph (WeightedGraph): A graph with non-negative edge weights.
+    start_id (string): The id of the start vertex.
+    target_id (string): The id of the target vertex.
+    delta (number): The bucket width, must be positive.
+    stats (AlgorithmStats): Optional counters to fill in.
+
+    Returns:
+    number: The shortest distance, or None if the target is unreachable.
+    """
+    if delta <= 0:
+        raise ValueError("delta must be positive")
+
+    distances = {start_id: 0}
+    buckets = {0: {start_id}} # bucket index -> set of vertex ids
+    visited = 0
+
+    def relax(vertex_id, new_distance):
+        """Move the vertex to a closer bucket; return True if it moved."""
+        old_distance = distances.get(vertex_id)
+        if old_distance is not None and new_distance >= old_distance:
+            return False
+        if old_distance is not None:
+            old_index = int(old_distance // delta)
+            if old_index in buckets:
+                buckets[old_index].discard(vertex_id)
+        distances[vertex_id] = new_distance
+        buckets.setdefault(int(new_distance // delta), set()).add(vertex_id)
+        return True
+
+    if stats is not None:
+        # only a profiled run pays for counting every relaxation
+        move = relax
+        stats.heap_operations += 1
+
+        def relax(vertex_id, new_distance):
+            stats.edges_relaxed += 1
+            if move(vertex_id, new_distance):
+                stats.heap_operations += 1
+
+    while buckets:
+        index = min(buckets)
+        settled = set()
+        # relax light edges until the bucket stops refilling
+        while buckets.get(index):
+            current = buckets.pop(index)
+            settled |= current
+            visited += len(current)
+            for vertex_id in current:
+                distance = distances[vertex_id]
+                for neighbor_id, weight in graph.get_vertex(vertex_id).get_neighbors_with_weights():
+                    if weight <= delta:
+                        relax(neighbor_id, distance + weight)
+        buckets.pop(index, None)
+
+        # every distance in this bucket is final now
+        if target_id in settled:
+            break
+
+        for vertex_id in settled:
+            distance = distances[vertex_id]
+            for neighbor_id, weight in graph.get_vertex(vertex_id).get_neighbors_with_weights():
+                if weight > delta:
+                    relax(neighbor_id, distance + weight)
+
+    if stats is not None:
+        stats.vertices_visited += visited
+    return distances.get(target_id)
+
+
+def _edge_list(graph):
+    """Return every edge of the graph as a list of (start_id, dest_id, weight)."""
+    return [(vertex.get_id(), neighbor_id, weight)
+            for vertex in graph.get_vertices()
+            for neighbor_id, weight in vertex.get_neighbors_with_weights()]
+
+
+def _count_reached(edges, distances, stats):
+    """
+    Yield `edges` one by one, counting in `stats` each edge whose start has a
+    distance by the time it is yielded, i.e. each edge a pass relaxes.
+    """
+    for edge in edges:
+        if edge[0] in distances:
+            stats.edges_relaxed += 1
+        yield edge
+
+
+def _relax_all_edges(edges, distances, num_vertices, stats=None):
+    """
+    Run Bellman-Ford passes over `edges`, updating `distances` in place.
+
+    Stops as soon as a full pass changes nothing, and raises a ValueError if
+    the distances are still shrinking after `num_vertices` passes.
+    """
+    passes = 0
+    changed = True
+    while changed:
+        if passes == num_vertices:
+            raise ValueError("Graph contains a negative-weight cycle")
+        changed = False
+        passes += 1
+        pass_edges = edges
+        if stats is not None:
+            stats.vertices_visited += num_vertices
+            pass_edges = _count_reached(edges, distances, stats)
+        for start_id, dest_id, weight in pass_edges:
+            start_distance = distances.get(start_id)
+            if start_distance is None:
+                continue
+            new_distance = start_distance + weight
+            if new_distance < distances.get(dest_id, float('inf')):
+                distances[dest_id] = new_distance
+                changed = True
+
+
+def bellman_ford(graph, start_id, stats=None):
+    """
+    Use the Bellman-Ford Algorithm to return the shortest distance from a
+    start vertex to every vertex it can reach. Negative weights are allowed.
+
+    Passes over the edge list stop early once nothing changes, so graphs
+    whose shortest paths have few edges finish in far fewer than V passes.
+
+    Parameters:
+    graph (WeightedGraph): The graph to search.
+    start_id (string): The id of the start vertex.
+    stats (AlgorithmStats): Optional counters to fill in.
+
+    Returns:
+    dict<string, number>: Vertex id -> shortest distance from the start.
+
+    Raises:
+    ValueError: If a negative-weight cycle is reachable from the start.
+    """
+    distances = {start_id: 0}
+    _relax_all_edges(_edge_list(graph), distances, len(graph.get_vertices()), stats)
+    return distances
+
+
+class _CountingVertex(object):
+    """
+    A vertex of a profiled search: every neighbor list handed out counts as
+    one vertex visited and one relaxation per edge.
+    """
+
+    def __init__(self, vertex, stats):
+        self.__vertex = vertex
+        self.__stats = stats
+
+    def get_neighbors_with_weights(self):
+        neighbors = self.__vertex.get_neighbors_with_weights()
+        self.__stats.vertices_visited += 1
+        self.__stats.edges_relaxed += len(neighbors)
+        return neighbors
+
+
+class _CountingGraph(object):
+    """Hands out _CountingVertex views of a graph's vertices."""
+
+    def __init__(self, graph, stats):
+        self.__graph = graph
+        self.__stats = stats
+
+    def get_vertex(self, vertex_id):
+        return _CountingVertex(self.__graph.get_vertex(vertex_id), self.__stats)
+
+
+def spfa(graph, start_id, stats=None):
+    """
+    Use the queue based Bellman-Ford variant (Shortest Path Faster Algorithm)
+    to return the shortest distance from a start vertex to every vertex it
+    can reach. Only vertices whose distance just improved are rescanned.
+
+    Parameters:
+    graph (WeightedGraph): The graph to search.
+    start_id (string): The id of the start vertex.
+    stats (AlgorithmStats): Optional counters to fill in.
+
+    Returns:
+    dict<string, number>: Vertex id -> shortest distance from the start.
+
+    Raises:
+    ValueError: If a negative-weight cycle is reachable from the start.
+    """
+    num_vertices = len(graph.get_vertices())
+    if stats is not None:
+        graph = _CountingGraph(graph, stats)
+    distances = {start_id: 0}
+    edge_count = {start_id: 0} # number of edges on the current best path
+    queue = deque([start_id])
+    in_queue = {start_id}
+
+    while queue:
+        vertex_id = queue.popleft()
+        in_queue.discard(vertex_id)
+        distance = distances[vertex_id]
+        for neighbor_id, weight in graph.get_vertex(vertex_id).get_neighbors_with_weights():
+            new_distance = distance + weight
+            if new_distance < distances.get(neighbor_id, float('inf')):
+                distances[neighbor_id] = new_distance
+                edge_count[neighbor_id] = edge_count[vertex_id] + 1
+                # a simple path has at most V - 1 edges
+                if edge_count[neighbor_id] >= num_vertices:
+                    raise ValueError("Graph contains a negative-weight cycle")
+                if neighbor_id not in in_queue:
+                    in_queue.add(neighbor_id)
+                    queue.append(neighbor_id)
+
+    return distances
+
+
+def johnson(graph, stats=None):
+    """
+    Use Johnson's Algorithm to return the shortest distance between every
+    pair of vertices in a sparse graph that may have negative weights.
+
+    Bellman-Ford from a virtual source computes a potential h(v) for every
+    vertex, so that the reweighted edges w(u, v) + h(u) - h(v) are all
+    non-negative. A heap Dijkstra from every vertex then takes O(VE log V)
+    in total instead of the O(V^3) of Floyd-Warshall.
+
+    Parameters:
+    graph (WeightedGraph): The graph to search.
+    stats (AlgorithmStats): Optional counters to fill in.
+
+    Returns:
+    dict<string, dict<string, number>>: Start id -> (vertex id -> distance)
+    for every vertex reachable from the start.
+
+    Raises:
+    ValueError: If the graph contains a negative-weight cycle.
+    """
+    edges = _edge_list(graph)
+    vertex_ids = [vertex.get_id() for vertex in graph.get_vertices()]
+
+    # the virtual source has a 0 edge to everything, so start them all at 0
+    potential = {vertex_id: 0 for vertex_id in vertex_ids}
+    _relax_all_edges(edges, potential, len(vertex_ids) + 1, stats)
+
+    adjacency = {vertex_id: [] for vertex_id in vertex_ids}
+    for start_id, dest_id, weight in edges:
+        adjacency[start_id].append(
+            (dest_id, weight + potential[start_id] - potential[dest_id]))
+
+    all_distances = {}
+    for source_id in vertex_ids:
+        distances = {}
+        heap = [(0, 0, source_id)]
+        counter = 1
+        while heap:
+            distance, _, vertex_id = heapq.heappop(heap)
+            if vertex_id in distances:
+                continue
+            distances[vertex_id] = distance
+            for neighbor_id, weight in adjacency[vertex_id]:
+                if neighbor_id not in distances:
+                    heapq.heappush(heap, (distance + weight, counter, neighbor_id))
+                    counter += 1
+
+        if stats is not None:
+            # the heap runs empty, so each of the `counter` pushes was popped
+            stats.vertices_visited += len(distances)
+            stats.edges_relaxed += sum(len(adjacency[vertex_id]) for vertex_id in distances)
+            stats.heap_operations += 2 * counter
+
+        # undo the reweighting
+        source_potential = potential[source_id]
+        all_distances[source_id] = {
+            vertex_id: distance - source_potential + potential[vertex_id]
+            for vertex_id, distance in distances.items()}
+
+    return all_distances
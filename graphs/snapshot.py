@@ -0,0 +1,190 @@
+from graphs.graph import Graph
+from graphs.shortest_paths import bellman_ford, dijkstra_heap, spfa
+
+
+class SnapshotVertex(object):
+    """
+    A read-only vertex inside a GraphSnapshot.
+    """
+
+    def __init__(self, snapshot, vertex_id):
+        """
+        Initialize a view of one vertex of a snapshot.
+
+        Parameters:
+        snapshot (GraphSnapshot): The snapshot this vertex belongs to.
+        vertex_id (string): The unique identifier of this vertex.
+        """
+        self.__snapshot = snapshot
+        self.__id = vertex_id
+
+    def __str__(self):
+        """Output the list of neighbors of this vertex."""
+        return f'{self.__id} adjacent to {self.__snapshot.get_neighbor_ids(self.__id)}'
+
+    def __repr__(self):
+        """Output the list of neighbors of this vertex."""
+        return self.__str__()
+
+    def get_neighbors(self):
+        """Return the neighbors of this vertex."""
+        snapshot = self.__snapshot
+        return [snapshot.get_vertex(neighbor_id)
+                for neighbor_id in snapshot.get_neighbor_ids(self.__id)]
+
+    def get_id(self):
+        """Return the id of this vertex."""
+        return self.__id
+
+    def get_neighbors_with_weights(self):
+        """Return the neighbors of this vertex as a list of tuples of (neighbor_id, weight)."""
+        return self.__snapshot.get_neighbors_with_weights(self.__id)
+
+
+class GraphSnapshot(object):
+    """
+    An immutable view of a Graph at the moment `Graph.snapshot()` was called.
+
+    The snapshot shares its dictionaries with the graph. The graph copies a
+    dictionary before its first write after the snapshot was taken, so
+    nothing a snapshot can reach is ever mutated and readers need no locks.
+    """
+
+    def __init__(self, adjacency, is_directed, weight_adjacency=None):
+        """
+        Initialize a snapshot over a frozen adjacency dictionary.
+
+        Parameters:
+        adjacency (dict): vertex_id -> neighbors dict, never mutated again.
+        is_directed (boolean): Whether the graph is directed.
+        weight_adjacency (dict): vertex_id -> weights dict for a weighted
+        graph, never mutated again, or None.
+        """
+        self.__adjacency = adjacency
+        self.__weight_adjacency = weight_adjacency
+        self.__is_directed = is_directed
+        self.__vertex_views = {} # vertex_id -> SnapshotVertex
+        self.__negative_weights = None # found on the first weighted search
+        self._profiler = None # snapshots are never profiled
+
+    def __len__(self):
+        """Return the number of vertices in the snapshot."""
+        return len(self.__adjacency)
+
+    def __str__(self):
+        """Return a string representation of the snapshot."""
+        return f'GraphSnapshot with vertices: {self.get_vertices()}'
+
+    def __repr__(self):
+        """Return a string representation of the snapshot."""
+        return self.__str__()
+
+    def is_directed(self):
+        """Return True if the snapshot was taken from a directed graph."""
+        return self.__is_directed
+
+    def contains_id(self, vertex_id):
+        return vertex_id in self.__adjacency
+
+    def get_vertex(self, vertex_id):
+        """Return the vertex if it exists."""
+        if vertex_id not in self.__adjacency:
+            return None
+
+        vertex_obj = self.__vertex_views.get(vertex_id)
+        if vertex_obj is None:
+            vertex_obj = SnapshotVertex(self, vertex_id)
+            self.__vertex_views[vertex_id] = vertex_obj
+        return vertex_obj
+
+    def get_vertices(self):
+        """
+        Return all vertices in the snapshot.
+
+        Returns:
+        List<SnapshotVertex>: The vertex objects contained in the snapshot.
+        """
+        return [self.get_vertex(vertex_id) for vertex_id in self.__adjacency]
+
+    def get_vertex_ids(self):
+        """Return the ids of all vertices in the snapshot."""
+        return list(self.__adjacency.keys())
+
+    def get_neighbor_ids(self, vertex_id):
+        """Return the ids of the neighbors of the given vertex."""
+        return list(self.__adjacency[vertex_id].keys())
+
+    def is_weighted(self):
+        """Return True if the snapshot was taken from a WeightedGraph."""
+        return self.__weight_adjacency is not None
+
+    def get_neighbors_with_weights(self, vertex_id):
+        """
+        Return the neighbors of the given vertex as a list of tuples of
+        (neighbor_id, weight). Only weighted snapshots have weights.
+        """
+        if self.__weight_adjacency is None:
+            raise TypeError("Snapshot of an unweighted graph has no weights")
+        return list(self.__weight_adjacency[vertex_id].items())
+
+    def has_negative_weights(self):
+        """Return True if any edge weight of a weighted snapshot is negative."""
+        if self.__negative_weights is None:
+            # the snapshot never changes, so one scan answers for good
+            self.__negative_weights = self.is_weighted() and any(
+                weight < 0 for weights in self.__weight_adjacency.values()
+                for weight in weights.values())
+        return self.__negative_weights
+
+    def find_shortest_path(self, start_id, target_id, method=None):
+        """
+        Find the shortest path from start_id to target_id, answering like the
+        graph the snapshot was taken from.
+
+        Parameters:
+        start_id (string): The id of the start vertex.
+        target_id (string): The id of the target (end) vertex.
+        method (string): Weighted snapshots only: 'dijkstra', 'bellman_ford'
+        or 'spfa'. By default Bellman-Ford is used when any weight is
+        negative and a binary heap Dijkstra otherwise.
+
+        Returns:
+        list<string>: For an unweighted snapshot, the vertex ids of a path
+        with the fewest edges, or None.
+        number: For a weighted snapshot, the total weight of the shortest
+        path, or None if the target cannot be reached.
+        """
+        if not self.is_weighted():
+            if method is not None:
+                raise ValueError("Only weighted snapshots take a shortest path method")
+            return Graph.find_shortest_path(self, start_id, target_id)
+
+        if not self.contains_id(start_id) or not self.contains_id(target_id):
+            raise KeyError("One or both vertices are not in the graph!")
+        if method is None:
+            method = 'bellman_ford' if self.has_negative_weights() else 'dijkstra'
+        elif self.has_negative_weights() and method not in ('bellman_ford', 'spfa'):
+            raise ValueError(f'{method} cannot handle negative edge weights')
+
+        if method == 'dijkstra':
+            return dijkstra_heap(self, start_id, target_id)
+        if method == 'bellman_ford':
+            return bellman_ford(self, start_id).get(target_id)
+        if method == 'spfa':
+            return spfa(self, start_id).get(target_id)
+        raise ValueError(f'Unknown shortest path method: {method}')
+
+    def find_shortest_paths(self, start_id, target_ids):
+        """
+        Find the fewest-edge paths from start_id to several targets, see
+        `Graph.find_shortest_paths`. Weighted snapshots raise a TypeError,
+        since hop counts are not their shortest paths.
+        """
+        if self.is_weighted():
+            raise TypeError("Use find_shortest_path for each target of a weighted snapshot")
+        return Graph.find_shortest_paths(self, start_id, target_ids)
+
+    # Traversals that only go through the public vertex API run unchanged.
+    bfs_traversal = Graph.bfs_traversal
+    find_vertices_n_away = Graph.find_vertices_n_away
+    find_k_hop_neighborhood = Graph.find_k_hop_neighborhood
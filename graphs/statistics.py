@@ -0,0 +1,241 @@
+"""
+Summary statistics of large graphs, computed on the flat arrays of a
+CompactGraph instead of Vertex objects: the degree distribution, a
+double-sweep estimate of the diameter and a sampled clustering coefficient.
+
+Every function makes a constant number of passes over the arrays (or a
+fixed number of samples), so the cost grows (nearly) linearly with the graph.
+"""
+import random
+from array import array
+from bisect import bisect_left, bisect_right
+
+from graphs.compact import CompactGraph
+
+
+def degree_distribution(compact, direction='out'):
+    """
+    Count how many vertices have each degree.
+
+    Parameters:
+    compact (CompactGraph): The graph.
+    direction (string): 'out', 'in' or 'total' (in + out) degrees. The three
+    are the same for an undirected graph.
+
+    Returns:
+    array: counts[d] is the number of vertices of degree d (empty for a
+    graph with no vertices).
+    """
+    if direction not in ('out', 'in', 'total'):
+        raise ValueError(f'Unknown degree direction: {direction}')
+
+    num_vertices = compact.num_vertices()
+    offsets = compact.offsets
+    degrees = array('q', [0]) * num_vertices
+    if direction != 'in' or not compact.is_directed:
+        for i in range(num_vertices):
+            degrees[i] = offsets[i + 1] - offsets[i]
+    if compact.is_directed and direction != 'out':
+        for target in compact.targets:
+            degrees[target] += 1
+
+    counts = array('q', [0]) * (max(degrees, default=-1) + 1)
+    for degree in degrees:
+        counts[degree] += 1
+    return counts
+
+
+def _farthest(offsets, targets, start, distances, queue):
+    """
+    Breadth-first search from `start`, reusing the `distances` and `queue`
+    arrays. Return (farthest vertex index, its distance).
+    """
+    for i in range(len(distances)):
+        distances[i] = -1
+    distances[start] = 0
+    queue[0] = start
+    head = 0
+    tail = 1
+    while head < tail:
+        current = queue[head]
+        head += 1
+        next_distance = distances[current] + 1
+        for position in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[position]
+            if distances[neighbor] == -1:
+                distances[neighbor] = next_distance
+                queue[tail] = neighbor
+                tail += 1
+    # the queue holds vertices in order of distance, the last is the farthest
+    farthest = queue[tail - 1]
+    return farthest, distances[farthest]
+
+
+def estimate_diameter(compact, start=None):
+    """
+    Estimate the diameter with a double sweep: search from `start` to its
+    farthest vertex u, then from u to its farthest vertex v. The distance
+    from u to v is a lower bound on the diameter, and is exact for trees and
+    very often for real-world graphs. Costs two breadth-first searches.
+
+    Edges are followed in their stored direction, so pass an undirected
+    compact graph to ignore directions. Only the component of `start` is
+    measured.
+
+    Parameters:
+    compact (CompactGraph): The graph.
+    start (int): The vertex index to start from; defaults to a vertex of
+    highest degree, which is almost always in the largest component.
+
+    Returns:
+    tuple: (diameter lower bound, (u, v)) with the vertex indexes of the
+    two endpoints, or (0, None) for a graph with no vertices.
+    """
+    num_vertices = compact.num_vertices()
+    if num_vertices == 0:
+        return 0, None
+    offsets = compact.offsets
+    targets = compact.targets
+    if start is None:
+        start = max(range(num_vertices), key=lambda i: offsets[i + 1] - offsets[i])
+
+    distances = array('q', [-1]) * num_vertices
+    queue = array('q', [0]) * num_vertices # every vertex is queued once
+    first, _ = _farthest(offsets, targets, start, distances, queue)
+    second, diameter = _farthest(offsets, targets, first, distances, queue)
+    return diameter, (first, second)
+
+
+def simple_adjacency(compact):
+    """
+    Return (offsets, targets) arrays of the graph with directions ignored,
+    self loops and duplicate edges dropped, and every neighbor list sorted
+    so membership can be checked by binary search.
+
+    Parameters:
+    compact (CompactGraph): The graph.
+
+    Returns:
+    tuple: (offsets, targets) in the layout of CompactGraph.
+    """
+    num_vertices = compact.num_vertices()
+    offsets = compact.offsets
+    targets = compact.targets
+    if compact.is_directed:
+        # count then place the reverse edges, keeping memory to flat arrays
+        reverse_offsets = array('q', [0]) * (num_vertices + 1)
+        for target in targets:
+            reverse_offsets[target + 1] += 1
+        for i in range(num_vertices):
+            reverse_offsets[i + 1] += reverse_offsets[i]
+        reverse_targets = array('q', [0]) * len(targets)
+        fill = array('q', reverse_offsets[:num_vertices])
+        for source in range(num_vertices):
+            for position in range(offsets[source], offsets[source + 1]):
+                target = targets[position]
+                reverse_targets[fill[target]] = source
+                fill[target] += 1
+
+    simple_offsets = array('q', [0])
+    simple_targets = array('q')
+    for i in range(num_vertices):
+        neighbors = set(targets[offsets[i]:offsets[i + 1]])
+        if compact.is_directed:
+            neighbors.update(reverse_targets[reverse_offsets[i]:reverse_offsets[i + 1]])
+        neighbors.discard(i)
+        simple_targets.extend(sorted(neighbors))
+        simple_offsets.append(len(simple_targets))
+    return simple_offsets, simple_targets
+
+
+def estimate_clustering(compact, samples=10000, seed=None):
+    """
+    Estimate the global clustering coefficient (transitivity) by sampling
+    wedges, paths u - center - w of length two, uniformly at random and
+    checking whether the edge u - w closes them into a triangle. Edge
+    directions are ignored.
+
+    The cost is one pass to weight every vertex by its number of wedges plus
+    O(log V + log degree) per sample, independent of the number of
+    triangles. The standard error is at most 0.5 / sqrt(samples).
+
+    Parameters:
+    compact (CompactGraph): The graph.
+    samples (int): The number of wedges to sample.
+    seed (int): Seed for the random generator, for repeatable estimates.
+
+    Returns:
+    tuple: (coefficient, triangles) with the estimated fraction of closed
+    wedges and the estimated number of triangles; (0.0, 0.0) if the graph
+    has no wedges.
+    """
+    if samples <= 0:
+        raise ValueError("samples must be positive")
+    offsets, targets = simple_adjacency(compact)
+    return _sample_wedges(offsets, targets, samples, seed)
+
+
+def _sample_wedges(offsets, targets, samples, seed):
+    """Run `estimate_clustering` on arrays made by `simple_adjacency`."""
+    # cumulative[i]: wedges centered on vertices 0..i
+    cumulative = array('q')
+    total = 0
+    for i in range(len(offsets) - 1):
+        degree = offsets[i + 1] - offsets[i]
+        total += degree * (degree - 1) // 2
+        cumulative.append(total)
+    if total == 0:
+        return 0.0, 0.0
+
+    rng = random.Random(seed)
+    closed = 0
+    for _ in range(samples):
+        center = bisect_right(cumulative, rng.randrange(total))
+        first = offsets[center]
+        a, b = rng.sample(range(offsets[center + 1] - first), 2)
+        u = targets[first + a]
+        w = targets[first + b]
+        end = offsets[u + 1]
+        position = bisect_left(targets, w, offsets[u], end)
+        if position < end and targets[position] == w:
+            closed += 1
+
+    coefficient = closed / samples
+    # every triangle closes three wedges
+    return coefficient, coefficient * total / 3
+
+
+def graph_statistics(compact, samples=10000, seed=None):
+    """
+    Compute the degree distribution, diameter estimate and clustering
+    estimate of a graph.
+
+    Parameters:
+    compact (CompactGraph): The graph. The degree distribution uses its
+    stored direction, the other statistics ignore directions.
+    samples (int): Wedges sampled for the clustering estimate.
+    seed (int): Seed for the random generator.
+
+    Returns:
+    dict: With keys 'num_vertices', 'degree_distribution' (list of counts
+    per degree), 'diameter_estimate', 'diameter_endpoints' (pair of vertex
+    ids, or None), 'clustering_coefficient' and 'triangle_estimate'.
+    """
+    if samples <= 0:
+        raise ValueError("samples must be positive")
+    distribution = degree_distribution(compact)
+    offsets, targets = simple_adjacency(compact)
+    compact = CompactGraph(compact.vertex_ids, offsets, targets, False)
+    diameter, endpoints = estimate_diameter(compact)
+    coefficient, triangles = _sample_wedges(offsets, targets, samples, seed)
+
+    vertex_ids = compact.vertex_ids
+    return {
+        'num_vertices': compact.num_vertices(),
+        'degree_distribution': distribution.tolist(),
+        'diameter_estimate': diameter,
+        'diameter_endpoints': None if endpoints is None else
+                              (vertex_ids[endpoints[0]], vertex_ids[endpoints[1]]),
+        'clustering_coefficient': coefficient,
+        'triangle_estimate': triangles,
+    }
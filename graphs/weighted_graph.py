@@ -1,6 +1,12 @@
+import heapq
+
 from graphs.graph import Graph, Vertex
+from graphs.profiling import AlgorithmStats
+from graphs.shortest_paths import (
+    DIAL_MAX_WEIGHT, bellman_ford, delta_stepping, dial, dijkstra_heap,
+    johnson, spfa)
 
-class WeightedVertex(object):
+class WeightedVertex(Vertex):
     def __init__(self, vertex_id):
         """
         Initialize a vertex and its neighbors.
@@ -8,11 +14,9 @@ class WeightedVertex(object):
         Parameters:
         vertex_id (string): A unique identifier to identify this vertex.
         """
-        self.__id = vertex_id
-        self.__neighbors_dict = {} # id -> (obj, weight)
-
-    def get_id(self):
-        return self.__id
+        super().__init__(vertex_id)
+        # neighbors live in the inherited dict so unweighted code sees them
+        self._weights_dict = {} # id -> weight
 
     def add_neighbor(self, vertex_obj, weight):
         """
@@ -22,84 +26,147 @@ class WeightedVertex(object):
         vertex_obj (Vertex): An instance of Vertex to be stored as a neighbor.
         weight (int): The edge weight from self -> neighbor.
         """
-        # TODO: Implement this function.
-        self.__neighbors_dict[vertex_obj.__id] = (vertex_obj, weight)
-        pass
+        self._neighbors_dict[vertex_obj._id] = vertex_obj
+        self._weights_dict[vertex_obj._id] = weight
+
+    def remove_neighbor(self, vertex_id):
+        """
+        Remove a neighbor from the neighbors dictionary.
 
-    def get_neighbors(self):
-        """Return the neighbors of this vertex as a list of neighbor ids."""
-        # TODO: Implement this function.]
-        return [i[0] for i in self.__neighbors_dict.values()]
-        pass
+        Parameters:
+        vertex_id (string): The id of the neighbor to remove.
+        """
+        del self._neighbors_dict[vertex_id]
+        del self._weights_dict[vertex_id]
+
+    def get_weight(self, vertex_id):
+        """Return the weight of the edge from this vertex to `vertex_id`."""
+        return self._weights_dict[vertex_id]
 
     def get_neighbors_with_weights(self):
         """Return the neighbors of this vertex as a list of tuples of (neighbor_id, weight)."""
-        # TODO: Implement this function.
-        return [(neighbor.__id, weight) for neighbor, weight in self.__neighbors_dict.values()]
-        pass
+        return list(self._weights_dict.items())
+
+    def _copy_neighbors_dict(self):
+        """
+        Replace the neighbors and weights dictionaries with private copies and
+        return the neighbors, so a snapshot never sees later edits.
+        """
+        self._weights_dict = dict(self._weights_dict)
+        return super()._copy_neighbors_dict()
 
 
 class WeightedGraph(Graph):
-    def __init__(self, is_directed=True):
+    vertex_class = WeightedVertex
+
+    def __init__(self, is_directed=True, reverse_index=False):
         """
         Initialize a weighted graph object with an empty vertex dictionary.
 
         Parameters:
         is_directed (boolean): Whether the graph is directed (edges go in only one direction).
+        reverse_index (boolean): Whether to maintain the in-neighbors of every
+        vertex as edges are added.
         """
-        self.__vertex_dict = {} # id -> object
-        self.__is_directed = is_directed
-
-    def get_vertex(self, vertex_id):
-        """Return the vertex if it exists."""
-        if vertex_id not in self.__vertex_dict:
-            return None
+        super().__init__(is_directed, reverse_index)
+        self._weight_adjacency = {}
+        # summary of the stored weights, used to pick a shortest path engine:
+        # stored edges (an undirected edge is stored twice) that are negative,
+        # not integers, or above DIAL_MAX_WEIGHT, and the largest weight ever
+        # added (an upper bound, it is not lowered when edges go away)
+        self._negative_weights = 0
+        self._fractional_weights = 0
+        self._heavy_weights = 0
+        self._max_weight = 0
 
-        vertex_obj = self.__vertex_dict[vertex_id]
-        return vertex_obj
-    
-    def get_vertices(self):
-        """
-        Return all vertices in the graph.
-        
-        Returns:
-        List<Vertex>: The vertex objects contained in the graph.
+    def add_edge(self, vertex_id1, vertex_id2, weight):
         """
-        return list(self.__vertex_dict.values())
+        Add an edge from vertex with id `vertex_id1` to vertex with id `vertex_id2`.
 
-    def add_vertex(self, vertex_id):
+        Parameters:
+        vertex_id1 (string): The unique identifier of the first vertex.
+        vertex_id2 (string): The unique identifier of the second vertex.
+        weight (number): The weight of the edge.
         """
-        Add a new vertex object to the graph with the given key and return the vertex.
+        old_weight = self._weight_adjacency.get(vertex_id1, {}).get(vertex_id2)
+        self._add_edge(vertex_id1, vertex_id2, weight)
 
-        Parameters:
-        vertex_id (string): The unique identifier for the new vertex.
+        copies = self.__stored_copies(vertex_id1, vertex_id2)
+        if old_weight is not None:
+            self.__count_weight(old_weight, -copies)
+        self.__count_weight(weight, copies)
+        if weight > self._max_weight:
+            self._max_weight = weight
 
-        Returns:
-        Vertex: The new vertex object.
+    def update_edge_weight(self, vertex_id1, vertex_id2, weight):
         """
-        # TODO: Implement this function.
-        new_vertex = WeightedVertex(vertex_id)
-        self.__vertex_dict[vertex_id] = new_vertex
-        return new_vertex
+        Change the weight of the existing edge from `vertex_id1` to `vertex_id2`.
 
-    
+        Parameters:
+        vertex_id1 (string): The unique identifier of the first vertex.
+        vertex_id2 (string): The unique identifier of the second vertex.
+        weight (number): The new weight of the edge.
+        """
+        vertex1 = self.get_vertex(vertex_id1)
+        if vertex1 is None or not vertex1.has_neighbor(vertex_id2):
+            raise KeyError("Edge is not in the graph!")
+        self.add_edge(vertex_id1, vertex_id2, weight)
 
-    def add_edge(self, vertex_id1, vertex_id2, weight):
+    def remove_edge(self, vertex_id1, vertex_id2):
         """
-        Add an edge from vertex with id `vertex_id1` to vertex with id `vertex_id2`.
+        Remove the edge from vertex `vertex_id1` to vertex `vertex_id2`.
 
         Parameters:
         vertex_id1 (string): The unique identifier of the first vertex.
         vertex_id2 (string): The unique identifier of the second vertex.
         """
-        # TODO: Implement this function.
-        vertex1 = self.get_vertex(vertex_id1)
-        vertex2 = self.get_vertex(vertex_id2)
-        vertex1.add_neighbor(vertex2, weight)
-        if not self.__is_directed:
-            vertex2.add_neighbor(vertex1, weight)
+        weight = self._weight_adjacency.get(vertex_id1, {}).get(vertex_id2)
+        super().remove_edge(vertex_id1, vertex_id2)
+        self.__count_weight(weight, -self.__stored_copies(vertex_id1, vertex_id2))
 
-        pass
+    def remove_vertex(self, vertex_id):
+        """
+        Remove a vertex and every edge into or out of it.
+
+        Parameters:
+        vertex_id (string): The unique identifier of the vertex to remove.
+        """
+        if vertex_id not in self._vertex_dict:
+            raise KeyError("Vertex is not in the graph!")
+
+        # weights of every stored edge that disappears with the vertex
+        weights = list(self._weight_adjacency[vertex_id].values())
+        if not self._is_directed:
+            weights.extend(weight for neighbor_id, weight
+                           in self._weight_adjacency[vertex_id].items()
+                           if neighbor_id != vertex_id)
+        elif self._in_adjacency is not None:
+            weights.extend(self._weight_adjacency[source_id][vertex_id]
+                           for source_id in self._in_adjacency[vertex_id]
+                           if source_id != vertex_id)
+        else:
+            weights.extend(weights_dict[vertex_id]
+                           for source_id, weights_dict in self._weight_adjacency.items()
+                           if source_id != vertex_id and vertex_id in weights_dict)
+
+        super().remove_vertex(vertex_id)
+        for weight in weights:
+            self.__count_weight(weight, -1)
+
+    def __stored_copies(self, vertex_id1, vertex_id2):
+        """Return how many times the edge vertex_id1 - vertex_id2 is stored."""
+        if self._is_directed or vertex_id1 == vertex_id2:
+            return 1
+        return 2
+
+    def __count_weight(self, weight, change):
+        """Add `change` stored edges of `weight` to the weight summaries."""
+        if weight < 0:
+            self._negative_weights += change
+        if not isinstance(weight, int):
+            self._fractional_weights += change
+        if weight > DIAL_MAX_WEIGHT:
+            self._heavy_weights += change
 
     def union(self, parent_map, vertex_id1, vertex_id2):
         """Combine vertex_id1 and vertex_id2 into the same group."""
@@ -110,18 +177,23 @@ class WeightedGraph(Graph):
 
     def find(self, parent_map, vertex_id):
         """Get the root (or, group label) for vertex_id."""
-        if(parent_map[vertex_id] == vertex_id):
-            return vertex_id
-        return self.find(parent_map, parent_map[vertex_id])
-
-    def contains_id(self, vertex_id):
-        return vertex_id in self.__vertex_dict
+        root = vertex_id
+        while parent_map[root] != root:
+            root = parent_map[root]
+        # point everything on the way straight at the root (path compression)
+        while parent_map[vertex_id] != root:
+            parent_map[vertex_id], vertex_id = root, parent_map[vertex_id]
+        return root
 
     def minimum_spanning_tree_kruskal(self):
         """
         Use Kruskal's Algorithm to return a list of edges, as tuples of 
         (start_id, dest_id, weight) in the graph's minimum spanning tree.
         """
+        profiler = self._profiler
+        if profiler is not None:
+            start_time = profiler.start()
+
         # TODO: Create a list of all edges in the graph, sort them by weight 
         # from smallest to largest
         def sortFunc(e):
@@ -130,10 +202,13 @@ class WeightedGraph(Graph):
             return e[0]
 
         edges = []
+        added = set() # same edges as `edges`, for O(1) reverse-edge checks
         for vertex in self.get_vertices():
             for neighbor, weight in vertex.get_neighbors_with_weights():
-                if ((neighbor, vertex.get_id(), weight) not in edges):
-                    edges.append((vertex.get_id(), neighbor, weight))
+                if ((neighbor, vertex.get_id(), weight) not in added):
+                    edge = (vertex.get_id(), neighbor, weight)
+                    edges.append(edge)
+                    added.add(edge)
         edges.sort(reverse=True, key=sortFunc2)
         edges.sort(reverse=True, key=sortFunc)
         
@@ -151,13 +226,20 @@ class WeightedGraph(Graph):
         # (i.e. calling `find()` gets two different roots), then it will not 
         # create a cycle, so add it to the solution set and call `union()` on 
         # the two vertices.
-        while len(solution) < len(self.get_vertices()) - 1 and len(edges) > 0:
+        num_vertices = len(parent_map)
+        num_edges = len(edges)
+        while len(solution) < num_vertices - 1 and len(edges) > 0:
             current_edge = edges.pop()
             group1 = self.find(parent_map, current_edge[0])
             group2 = self.find(parent_map, current_edge[1])
             if group1 != group2:
                 self.union(parent_map, current_edge[0], current_edge[1])
                 solution.append(current_edge)
+
+        if profiler is not None:
+            # every edge popped from the sorted list was examined
+            profiler.record('minimum_spanning_tree_kruskal', start_time,
+                            len(parent_map), num_edges - len(edges))
         return solution
         # TODO: Return the solution list.
     
@@ -168,70 +250,133 @@ class WeightedGraph(Graph):
 
         Assume that the graph is connected.
         """
-        # TODO: Create a dictionary `vertex_to_weight` and initialize all
-        # vertices to INFINITY - hint: use `float('inf')`
-        vertex_to_weight = {vertex.get_id(): float("inf") for vertex in self.get_vertices()}
-        # TODO: Choose one vertex and set its weight to 0
-        start_vertex = list(vertex_to_weight.keys())[0]
-        vertex_to_weight[start_vertex] = 0
-        edges = [(start_vertex, edge_id, weight) for edge_id, weight in self.get_vertex(start_vertex).get_neighbors_with_weights()]
-        print(edges)
-        # TODO: While `vertex_to_weight` is not empty:
-        # 1. Get the minimum-weighted remaining vertex, remove it from the
-        #    dictionary, & add its weight to the total MST weight
-        # 2. Update that vertex's neighbors, if edge weights are smaller than
-        #    previous weights
-        parent_map = {vertex.get_id(): vertex.get_id() for vertex in self.get_vertices()}
-        solution = []
-        def sortFunc(e):
-            return e[2]
-        edges.sort(reverse=True, key=sortFunc)
-        while len(solution) < len(self.get_vertices()) - 1 and len(edges) > 0:
-            print(edges)
-            current_edge = edges.pop()
-            group1 = self.find(parent_map, current_edge[0])
-            group2 = self.find(parent_map, current_edge[1])
-            if group1 != group2:
-                self.union(parent_map, current_edge[0], current_edge[1])
-                solution.append(current_edge)
-                for new_edge, weight in self.get_vertex(current_edge[1]).get_neighbors_with_weights():
-                    edges.append((current_edge[1], new_edge, weight))
-                    edges.sort(reverse=True, key=sortFunc)
+        if not self._vertex_dict:
+            return 0
+
+        # grow the tree from any vertex, always adding the cheapest edge that
+        # leaves it; the heap may hold stale edges into the tree, skip those
+        start_id = next(iter(self._vertex_dict))
+        in_tree = {start_id}
+        heap = []
+        counter = 0 # tie breaker so vertex ids are never compared
+        for neighbor_id, weight in self.get_vertex(start_id).get_neighbors_with_weights():
+            heapq.heappush(heap, (weight, counter, neighbor_id))
+            counter += 1
+
         total = 0
-        for edge in solution:
-            total += edge[2]
+        while heap and len(in_tree) < len(self._vertex_dict):
+            weight, _, vertex_id = heapq.heappop(heap)
+            if vertex_id in in_tree:
+                continue
+            in_tree.add(vertex_id)
+            total += weight
+            for neighbor_id, neighbor_weight in self.get_vertex(vertex_id).get_neighbors_with_weights():
+                if neighbor_id not in in_tree:
+                    heapq.heappush(heap, (neighbor_weight, counter, neighbor_id))
+                    counter += 1
         return total
 
-                    
-        print(solution)
-        # TODO: Return total weight of MST
+    def has_small_integer_weights(self):
+        """
+        Return True if every edge weight is an integer between 0 and
+        DIAL_MAX_WEIGHT, so the bucket based shortest path engines apply.
+        """
+        return (self._negative_weights == 0 and self._fractional_weights == 0
+                and self._heavy_weights == 0)
+
+    def has_negative_weights(self):
+        """Return True if any edge weight is negative."""
+        return self._negative_weights > 0
 
-    def find_shortest_path(self, start_id, target_id):
+    def find_shortest_path(self, start_id, target_id, method=None):
         """
         Use Dijkstra's Algorithm to return the total weight of the shortest path
         from a start vertex to a destination.
+
+        Parameters:
+        start_id (string): The id of the start vertex.
+        target_id (string): The id of the target (end) vertex.
+        method (string): 'dijkstra' for a binary heap, 'dial' for a bucket
+        queue, 'delta_stepping', 'bellman_ford' or 'spfa'. By default
+        Bellman-Ford is used when any weight is negative, Dial's algorithm
+        when all weights are small non-negative integers, and the heap
+        otherwise.
+
+        Returns:
+        number: The total weight of the shortest path, or None if the target
+        vertex cannot be reached.
+
+        Raises:
+        ValueError: If the graph has a negative-weight cycle reachable from
+        the start, or the method cannot handle negative weights.
+        """
+        if not self.contains_id(start_id) or not self.contains_id(target_id):
+            raise KeyError("One or both vertices are not in the graph!")
+
+        if method is None:
+            if self.has_negative_weights():
+                method = 'bellman_ford'
+            elif self.has_small_integer_weights():
+                method = 'dial'
+            else:
+                method = 'dijkstra'
+        elif (self.has_negative_weights()
+                and method not in ('bellman_ford', 'spfa')):
+            raise ValueError(f'{method} cannot handle negative edge weights')
+
+        profiler = self._profiler
+        stats = None
+        if profiler is not None:
+            start_time = profiler.start()
+            stats = AlgorithmStats('find_shortest_path')
+
+        if method == 'dijkstra':
+            distance = dijkstra_heap(self, start_id, target_id, stats)
+        elif method == 'dial':
+            if not self.has_small_integer_weights():
+                raise ValueError("Dial's algorithm needs small non-negative integer weights")
+            # _max_weight may predate removed edges, DIAL_MAX_WEIGHT still bounds
+            max_weight = min(self._max_weight, DIAL_MAX_WEIGHT)
+            distance = dial(self, start_id, target_id, max_weight, stats)
+        elif method == 'delta_stepping':
+            # half the largest weight splits edges into light and heavy ones
+            delta = max(self._max_weight / 2, 1)
+            distance = delta_stepping(self, start_id, target_id, delta, stats)
+        elif method == 'bellman_ford':
+            distance = bellman_ford(self, start_id, stats).get(target_id)
+        elif method == 'spfa':
+            distance = spfa(self, start_id, stats).get(target_id)
+        else:
+            raise ValueError(f'Unknown shortest path method: {method}')
+
+        if profiler is not None:
+            profiler.record('find_shortest_path', start_time,
+                            stats.vertices_visited, stats.edges_relaxed,
+                            stats.heap_operations)
+        return distance
+
+    def find_all_pairs_shortest_paths(self):
+        """
+        Use Johnson's Algorithm to return the total weight of the shortest
+        path between every pair of vertices. Negative weights are allowed.
+
+        Returns:
+        dict<string, dict<string, number>>: Start id -> (vertex id -> shortest
+        distance) for every vertex reachable from the start.
+
+        Raises:
+        ValueError: If the graph contains a negative-weight cycle.
         """
-        # TODO: Create a dictionary `vertex_to_distance` and initialize all
-        # vertices to INFINITY - hint: use `float('inf')`
-        vertex_to_distance = {i.get_id(): float("inf") for i in self.get_vertices()}
-        vertex_to_distance[start_id] = 0
-
-        # TODO: While `vertex_to_distance` is not empty:
-        # 1. Get the minimum-distance remaining vertex, remove it from the
-        #    dictionary. If it is the target vertex, return its distance.
-        # 2. Update that vertex's neighbors by adding the edge weight to the
-        #    vertex's distance, if it is lower than previous.
-        while(vertex_to_distance):
-            bestVert = (start_id, float("inf"))
-            for vert_id, dist in vertex_to_distance.items():
-                if dist < bestVert[1]:
-                    bestVert = (vert_id, dist)
-            if(bestVert[0] == target_id):
-                return bestVert[1]
-
-            del vertex_to_distance[bestVert[0]]
-            for neighbor, weight in self.get_vertex(bestVert[0]).get_neighbors_with_weights():
-                if(neighbor in vertex_to_distance):
-                    vertex_to_distance[neighbor] = min(vertex_to_distance[neighbor], weight + bestVert[1])
-        return None
-        # TODO: Return None if target vertex not found.
+        profiler = self._profiler
+        stats = None
+        if profiler is not None:
+            start_time = profiler.start()
+            stats = AlgorithmStats('find_all_pairs_shortest_paths')
+
+        all_distances = johnson(self, stats)
+
+        if profiler is not None:
+            profiler.record('find_all_pairs_shortest_paths', start_time,
+                            stats.vertices_visited, stats.edges_relaxed,
+                            stats.heap_operations)
+        return all_distances
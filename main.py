@@ -1,72 +1,118 @@
-from graphs.graph import Graph
-from util.file_reader import read_graph_from_file
-# from graphs.weighted_graph import WeightedGraph
+"""
+Command line entry point: load a graph file, run one algorithm, print the result.
 
+    python main.py test_files/graph_medium_undirected.txt shortest-path A F
+    python main.py --weighted roads.txt mst
+
+Only the modules the chosen algorithm needs are imported, so the CLI starts
+quickly (see benchmarks/bench_startup.py).
+"""
+import sys
+
+
+def run_shortest_path(graph, start_id, target_id):
+    return graph.find_shortest_path(start_id, target_id)
+
+
+def run_n_away(graph, start_id, distance):
+    return graph.find_vertices_n_away(start_id, int(distance))
+
+
+def run_components(graph):
+    return graph.find_connected_components()
+
+
+def run_strong_components(graph):
+    return graph.find_strongly_connected_components()
+
+
+def run_bipartite(graph):
+    return graph.find_bipartition()
+
+
+def run_topological_sort(graph):
+    return graph.topological_sort()
+
+
+def run_statistics(graph):
+    return graph.compute_statistics(seed=0)
 
-# Driver code
-if __name__ == '__main__':
 
-    from_file = True
-
-    # Create the graph
-    if not from_file:
-        graph = Graph(is_directed=True)
-
-        # Add some vertices
-        graph.add_vertex('A')
-        graph.add_vertex('E')
-        graph.add_vertex('B')
-        graph.add_vertex('C')
-        graph.add_vertex('D')
-        graph.add_vertex('F')
-        graph.add_vertex('G')
-
-        # Add connections
-        graph.add_edge('A', 'B')
-        graph.add_edge('B', 'C')
-        graph.add_edge('B', 'D')
-        graph.add_edge('D', 'E')
-        graph.add_edge('F', 'G')
-    else:
-        graph = read_graph_from_file("test_files\graph_medium_undirected.txt")
-
-    # Or, read a graph in from a file
-    # graph = read_graph_from_file('test_files/graph_small_directed.txt')
-
-    # Output the vertices & edges
-    # Print vertices
-    print(f'The vertices are: {graph.get_vertices()} \n')
-
-    # Print edges
-    print('The edges are:')
-    for vertex_obj in graph.get_vertices():
-        for neighbor_obj in vertex_obj.get_neighbors():
-            print(f'({vertex_obj.get_id()} , {neighbor_obj.get_id()})')
-
-    # Find whether the graph is bipartite
-    print('Finding bipartiteness...')
-    print(graph.is_bipartite())
-
-    # Find The Topological sort of the graph
-    print("topological sort")
-    print(graph.topological_sort())
-
-    # Get all connected components
-    print('Finding connected components...')
-    print(graph.get_connected_components())
-
-    # Search the graph
-    print('Performing BFS traversal...')
-    graph.bfs_traversal('A')
-
-    # Find shortest path
-    print('Finding shortest path from vertex A to vertex E...')
-    shortest_path = graph.find_shortest_path('A', 'E')
-    print(shortest_path)
-
-    # Find all vertices N distance away
-    print('Finding all vertices distance 2 away...')
-    vertices_2_away = graph.find_vertices_n_away('A', 2)
-    print(vertices_2_away)
-
-    
\ No newline at end of file
+def run_mst(graph):
+    return graph.minimum_spanning_tree_kruskal()
+
+
+def run_all_pairs(graph):
+    return graph.find_all_pairs_shortest_paths()
+
+
+# algorithm name -> (function, argument names, needs a weighted graph)
+ALGORITHMS = {
+    'shortest-path': (run_shortest_path, ['start', 'target'], False),
+    'n-away': (run_n_away, ['start', 'distance'], False),
+    'components': (run_components, [], False),
+    'scc': (run_strong_components, [], False),
+    'bipartite': (run_bipartite, [], False),
+    'topological-sort': (run_topological_sort, [], False),
+    'stats': (run_statistics, [], False),
+    'mst': (run_mst, [], True),
+    'all-pairs': (run_all_pairs, [], True),
+}
+
+
+def usage():
+    """Return the help text."""
+    lines = ['usage: python main.py [--weighted] FILE ALGORITHM [ARGS...]', '',
+             'algorithms:']
+    for name, (_, arg_names, weighted) in ALGORITHMS.items():
+        args = ' '.join(arg_name.upper() for arg_name in arg_names)
+        note = ' (needs --weighted)' if weighted else ''
+        lines.append(f'  {name} {args}'.rstrip() + note)
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    """
+    Run the command line interface and return the exit status.
+
+    Arguments:
+    argv (list<string>): The arguments without the program name; defaults
+    to sys.argv[1:]
+    """
+    # argparse alone costs more than loading a small graph, so parse by hand
+    args = list(sys.argv[1:] if argv is None else argv)
+    if not args or args[0] in ('-h', '--help'):
+        print(usage())
+        return 0
+
+    weighted = False
+    if args[0] == '--weighted':
+        weighted = True
+        args = args[1:]
+    if len(args) < 2 or args[1] not in ALGORITHMS:
+        print(usage(), file=sys.stderr)
+        return 2
+
+    filename, name, algorithm_args = args[0], args[1], args[2:]
+    function, arg_names, needs_weights = ALGORITHMS[name]
+    if len(algorithm_args) != len(arg_names):
+        print(f'{name} expects: {" ".join(arg_names) or "no arguments"}', file=sys.stderr)
+        return 2
+    if needs_weights and not weighted:
+        print(f'{name} needs a weighted graph, pass --weighted', file=sys.stderr)
+        return 2
+
+    from util.file_reader import read_graph_from_file
+
+    try:
+        graph = read_graph_from_file(filename, weighted)
+        result = function(graph, *algorithm_args)
+    except (OSError, KeyError, ValueError) as error:
+        print(f'error: {error}', file=sys.stderr)
+        return 1
+    print(result)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
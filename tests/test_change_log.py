@@ -0,0 +1,112 @@
+import os
+import tempfile
+import unittest
+from util.change_log import GraphStore
+from util.file_reader import read_graph_from_file, write_graph_to_file
+
+
+class TestWriteGraphToFile(unittest.TestCase):
+
+    def test_round_trip(self):
+        graph = read_graph_from_file('test_files/graph_medium_undirected.txt')
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'graph.txt')
+            write_graph_to_file(graph, filename)
+            copy = read_graph_from_file(filename)
+
+        for vertex in graph.get_vertices():
+            self.assertEqual(sorted(copy.get_neighbor_ids(vertex.get_id())),
+                             sorted(graph.get_neighbor_ids(vertex.get_id())))
+
+
+class TestGraphStore(unittest.TestCase):
+
+    def test_replay_log(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = GraphStore(directory, is_directed=True)
+            store.load()
+            for vertex_id in ['A', 'B', 'C']:
+                store.add_vertex(vertex_id)
+            store.add_edge('A', 'B')
+            store.add_edge('B', 'C')
+            store.remove_edge('A', 'B')
+            store.add_edge('C', 'A')
+            store.close()
+
+            graph = GraphStore(directory).load()
+            self.assertEqual(len(graph.get_vertices()), 3)
+            self.assertEqual(graph.get_neighbor_ids('A'), [])
+            self.assertEqual(graph.get_neighbor_ids('B'), ['C'])
+            self.assertEqual(graph.get_neighbor_ids('C'), ['A'])
+
+    def test_compaction(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = GraphStore(directory, is_directed=False, weighted=True, compact_every=4)
+            store.load()
+            for vertex_id in ['A', 'B', 'C']:
+                store.add_vertex(vertex_id)
+            store.add_edge('A', 'B', 2)
+            self.assertEqual(store.log_records, 0)
+            self.assertTrue(os.path.exists(store.snapshot_path))
+
+            store.add_edge('B', 'C', 3.5)
+            store.remove_vertex('A')
+            self.assertEqual(store.log_records, 2)
+            store.close()
+
+            reloaded = GraphStore(directory, weighted=True)
+            graph = reloaded.load()
+            self.assertFalse(graph.contains_id('A'))
+            self.assertEqual(graph.get_vertex('C').get_neighbors_with_weights(), [('B', 3.5)])
+            self.assertEqual(graph.find_shortest_path('B', 'C'), 3.5)
+            reloaded.close()
+
+    def test_replay_is_idempotent(self):
+        """A log replayed over a snapshot that already holds it changes nothing."""
+        with tempfile.TemporaryDirectory() as directory:
+            store = GraphStore(directory, is_directed=True)
+            store.load()
+            for vertex_id in ['A', 'B']:
+                store.add_vertex(vertex_id)
+            store.add_edge('A', 'B')
+            store.remove_vertex('B')
+            store.add_vertex('B')
+            store.close()
+            write_graph_to_file(store.graph, store.snapshot_path)
+
+            graph = GraphStore(directory).load()
+            self.assertEqual(sorted(v.get_id() for v in graph.get_vertices()), ['A', 'B'])
+            self.assertEqual(graph.get_neighbor_ids('A'), [])
+
+    def test_crash_between_snapshot_and_log_truncation(self):
+        """The old log replayed over the compacted snapshot still loads."""
+        with tempfile.TemporaryDirectory() as directory:
+            store = GraphStore(directory, is_directed=False, weighted=True)
+            store.load()
+            store.add_vertex('a')
+            store.add_vertex('b')
+            store.compact()
+            store.add_edge('a', 'b', 3)
+            store.remove_edge('a', 'b')
+            store.add_edge('a', 'b', 4)
+            store.remove_vertex('b')
+            store.close()
+            with open(store.log_path) as log_file:
+                old_log = log_file.read()
+
+            store.load()
+            store.compact()
+            store.close()
+            # the process died after os.replace but before the log was emptied
+            with open(store.log_path, 'w') as log_file:
+                log_file.write(old_log)
+
+            reloaded = GraphStore(directory, weighted=True)
+            graph = reloaded.load()
+            self.assertEqual([vertex.get_id() for vertex in graph.get_vertices()], ['a'])
+            self.assertEqual(graph.get_neighbor_ids('a'), [])
+            reloaded.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+from graphs.compact import CompactGraph
+from util.file_reader import read_graph_from_file
+
+
+class TestCompactGraph(unittest.TestCase):
+
+    def test_from_directed_graph(self):
+        graph = read_graph_from_file('test_files/graph_small_directed.txt')
+        compact = graph.to_compact()
+
+        self.assertEqual(compact.num_vertices(), 4)
+        self.assertEqual(compact.num_edges(), 3)
+        for vertex in graph.get_vertices():
+            i = compact.get_index(vertex.get_id())
+            neighbor_ids = [compact.vertex_ids[j] for j in compact.neighbors(i)]
+            self.assertEqual(neighbor_ids, graph.get_neighbor_ids(vertex.get_id()))
+
+    def test_undirected_copy(self):
+        graph = read_graph_from_file('test_files/graph_small_directed.txt')
+        compact = CompactGraph.from_graph(graph, undirected=True)
+
+        self.assertFalse(compact.is_directed)
+        self.assertEqual(compact.num_edges(), 6)
+        self.assertEqual(compact.degree(compact.get_index('4')), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+from graphs.graph import Graph
+from graphs.distance_oracle import LandmarkIndex, TwoHopLabels, find_shortest_path_astar
+from graphs.shortest_paths import bellman_ford
+from util.random_graph import make_random_graph
+
+
+def make_weighted_graph(is_directed, seed=0):
+    return make_random_graph(80, 200, seed, is_directed, weighted=True,
+                             max_weight=9, vertex_id=int)
+
+
+class TestLandmarkIndex(unittest.TestCase):
+
+    def check_bounds(self, graph, index):
+        for start in range(0, 80, 9):
+            exact = bellman_ford(graph, start)
+            for target in range(80):
+                distance = exact.get(target, float('inf'))
+                self.assertLessEqual(index.lower_bound(start, target), distance)
+                self.assertGreaterEqual(index.upper_bound(start, target), distance)
+
+    def test_bounds(self):
+        for is_directed in [True, False]:
+            graph = make_weighted_graph(is_directed)
+            self.check_bounds(graph, LandmarkIndex.build(graph, num_landmarks=4))
+
+    def test_astar(self):
+        graph = make_weighted_graph(True, seed=2)
+        index = LandmarkIndex.build(graph, num_landmarks=4)
+        for target in range(0, 80, 7):
+            self.assertEqual(
+                find_shortest_path_astar(graph, 0, target, index.heuristic(target)),
+                graph.find_shortest_path(0, target))
+
+    def test_unweighted_and_save(self):
+        graph = Graph(is_directed=False)
+        for vertex_id in ['A', 'B', 'C', 'D']:
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A', 'B')
+        graph.add_edge('B', 'C')
+        index = LandmarkIndex.build(graph, num_landmarks=2)
+        self.assertEqual(index.estimate_distance('A', 'C'), 2)
+        self.assertEqual(index.lower_bound('A', 'D'), float('inf'))
+
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'index.json')
+            index.save(filename)
+            loaded = LandmarkIndex.load(filename)
+        self.assertEqual(loaded.landmarks, index.landmarks)
+        self.assertEqual(loaded.upper_bound('A', 'C'), 2)
+
+
+class TestTwoHopLabels(unittest.TestCase):
+
+    def test_exact_distances(self):
+        for is_directed in [True, False]:
+            graph = make_weighted_graph(is_directed, seed=5)
+            labels = TwoHopLabels.build(graph)
+            for start in range(0, 80, 11):
+                exact = bellman_ford(graph, start)
+                for target in range(80):
+                    self.assertEqual(labels.distance(start, target),
+                                     exact.get(target, float('inf')))
+
+    def test_save_and_load(self):
+        graph = make_weighted_graph(True, seed=6)
+        labels = TwoHopLabels.build(graph)
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'labels.json')
+            labels.save(filename)
+            loaded = TwoHopLabels.load(filename)
+        for target in range(80):
+            self.assertEqual(loaded.distance(3, target), labels.distance(3, target))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import random
+import tempfile
+import unittest
+from graphs.external import (
+    build_edge_store, external_bfs, external_connected_components, measure_peak_memory)
+from util.file_reader import read_graph_from_file
+
+
+class TestExternalGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write_random_graph(self, num_vertices=300, num_edges=700, seed=0):
+        rng = random.Random(seed)
+        filename = os.path.join(self.directory.name, 'random.txt')
+        with open(filename, 'w') as graph_file:
+            graph_file.write('D\n')
+            graph_file.write(','.join(str(i) for i in range(num_vertices)) + '\n')
+            for _ in range(num_edges):
+                graph_file.write(f'({rng.randrange(num_vertices)},{rng.randrange(num_vertices)})\n')
+        return filename
+
+    def test_matches_in_memory_graph(self):
+        filename = self.write_random_graph()
+        graph = read_graph_from_file(filename)
+        # small chunks force several sorted runs to be merged
+        external = build_edge_store(filename, os.path.join(self.directory.name, 'store'),
+                                    chunk_edges=50)
+        self.addCleanup(external.close)
+
+        self.assertEqual(external.num_edges(),
+                         sum(len(vertex.get_neighbors()) for vertex in graph.get_vertices()))
+        for vertex_id in ['0', '17', '299']:
+            self.assertEqual([str(i) for i in external.neighbors(external.get_index(vertex_id))],
+                             sorted(graph.get_neighbor_ids(vertex_id), key=int))
+
+        distances, level_sizes = external_bfs(external, external.get_index('0'))
+        levels = graph.find_k_hop_neighborhood(['0'], len(level_sizes), 'levels', True)
+        self.assertEqual(level_sizes, levels[:len(level_sizes)])
+        self.assertEqual(levels[len(level_sizes)], 0)
+
+        labels, count = external_connected_components(external)
+        self.assertEqual(count, len(graph.find_connected_components()))
+
+    def test_undirected_file(self):
+        filename = 'test_files/graph_multiple_components.txt'
+        external = build_edge_store(filename, os.path.join(self.directory.name, 'store'))
+        self.addCleanup(external.close)
+
+        labels, count = external_connected_components(external)
+        self.assertEqual(count, 2)
+        distances, _ = external_bfs(external, external.get_index('A'))
+        self.assertEqual(distances[external.get_index('F')], 3)
+        self.assertEqual(distances[external.get_index('G')], -1)
+
+    def test_failed_build_removes_runs(self):
+        filename = self.write_random_graph()
+        with open(filename, 'a') as graph_file:
+            graph_file.write('(0,unknown)\n')
+        with self.assertRaises(KeyError):
+            build_edge_store(filename, os.path.join(self.directory.name, 'store'),
+                             chunk_edges=50)
+        self.assertEqual([name for name in os.listdir(self.directory.name)
+                          if name.endswith('.run')], [])
+
+    def test_distances_use_four_bytes(self):
+        filename = self.write_random_graph()
+        external = build_edge_store(filename, os.path.join(self.directory.name, 'store'))
+        self.addCleanup(external.close)
+        distances, _ = external_bfs(external, 0)
+        labels, _ = external_connected_components(external)
+        self.assertEqual((distances.itemsize, labels.itemsize), (4, 4))
+
+    def test_peak_memory(self):
+        filename = self.write_random_graph()
+        external = build_edge_store(filename, os.path.join(self.directory.name, 'store'))
+        self.addCleanup(external.close)
+
+        (labels, count), peak = measure_peak_memory(external_connected_components, external)
+        self.assertGreater(peak, 0)
+        self.assertGreaterEqual(count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
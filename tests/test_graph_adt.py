@@ -37,6 +37,83 @@ class TestGraph(unittest.TestCase):
         self.assertEqual(len(vertex_b.get_neighbors()), 2)
         self.assertEqual(len(vertex_c.get_neighbors()), 2)
 
+    def test_reverse_index(self):
+        """In-neighbors agree with and without the reverse index."""
+        indexed = Graph(is_directed=True, reverse_index=True)
+        scanned = Graph(is_directed=True)
+        for graph in [indexed, scanned]:
+            for vertex_id in ['A', 'B', 'C']:
+                graph.add_vertex(vertex_id)
+            graph.add_edge('A','C')
+            graph.add_edge('B','C')
+            graph.add_edge('C','A')
+
+        self.assertTrue(indexed.has_reverse_index())
+        self.assertFalse(scanned.has_reverse_index())
+        for graph in [indexed, scanned]:
+            in_ids = sorted(v.get_id() for v in graph.get_in_neighbors('C'))
+            self.assertEqual(in_ids, ['A', 'B'])
+            self.assertEqual(graph.get_in_degree('C'), 2)
+            self.assertEqual(graph.get_in_degree('B'), 0)
+
+        scanned.enable_reverse_index()
+        self.assertTrue(scanned.has_reverse_index())
+        self.assertEqual(scanned.get_in_degree('A'), 1)
+
+    def test_reverse_index_topological_sort(self):
+        graph = Graph(is_directed=True, reverse_index=True)
+        for vertex_id in ['C', 'B', 'A']:
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A','B')
+        graph.add_edge('B','C')
+
+        self.assertEqual(graph.topological_sort(), ['A', 'B', 'C'])
+        self.assertEqual(len(graph.find_weakly_connected_components()), 1)
+
+
+    def test_remove_edge(self):
+        graph = Graph(is_directed=False)
+        for vertex_id in ['A', 'B', 'C']:
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A','B')
+        graph.add_edge('B','C')
+        graph.remove_edge('B','A')
+
+        self.assertEqual(graph.get_neighbor_ids('A'), [])
+        self.assertEqual(graph.get_neighbor_ids('B'), ['C'])
+        with self.assertRaises(KeyError):
+            graph.remove_edge('A','B')
+
+    def test_remove_vertex(self):
+        """Removing a vertex drops its in- and out-edges, with or without the index."""
+        for reverse_index in [False, True]:
+            graph = Graph(is_directed=True, reverse_index=reverse_index)
+            for vertex_id in ['A', 'B', 'C']:
+                graph.add_vertex(vertex_id)
+            graph.add_edge('A','B')
+            graph.add_edge('B','C')
+            graph.add_edge('C','B')
+            graph.add_edge('B','B')
+            graph.remove_vertex('B')
+
+            self.assertFalse(graph.contains_id('B'))
+            self.assertEqual(len(graph.get_vertices()), 2)
+            self.assertEqual(graph.get_neighbor_ids('A'), [])
+            self.assertEqual(graph.get_neighbor_ids('C'), [])
+            self.assertEqual(graph.get_in_degree('C'), 0)
+
+    def test_remove_after_snapshot(self):
+        graph = Graph(is_directed=False)
+        for vertex_id in ['A', 'B']:
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A','B')
+        snapshot = graph.snapshot()
+        graph.remove_vertex('B')
+
+        self.assertEqual(snapshot.get_neighbor_ids('A'), ['B'])
+        self.assertEqual(graph.get_neighbor_ids('A'), [])
+
+
 class TestReadGraphFromFile(unittest.TestCase):
     def test_read_directed_graph_from_file(self):
         filename = 'test_files/graph_small_directed.txt'
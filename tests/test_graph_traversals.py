@@ -1,6 +1,7 @@
 import unittest
 # from gradescope_utils.autograder_utils.decorators import weight, visibility
 from graphs.graph import Graph
+from util.file_reader import read_graph_from_file
 
 
 class TestBipartite(unittest.TestCase):
@@ -48,6 +49,51 @@ class TestBipartite(unittest.TestCase):
 
         self.assertTrue(graph.is_bipartite())
 
+    def test_bipartite_every_component(self):
+        """A triangle in a second component is still found."""
+        graph = Graph(is_directed=False)
+        for vertex_id in ['A', 'B', 'C', 'D', 'E']:
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A','B')
+        graph.add_edge('C','D')
+        graph.add_edge('D','E')
+        graph.add_edge('E','C')
+
+        self.assertFalse(graph.is_bipartite())
+        is_bipartite, cycle = graph.find_bipartition()
+        self.assertFalse(is_bipartite)
+        self.assertEqual(sorted(cycle), ['C', 'D', 'E'])
+
+    def test_bipartition_sets(self):
+        graph = Graph(is_directed=False)
+        for vertex_id in ['A', 'B', 'C', 'D', 'E']:
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A','B')
+        graph.add_edge('B','C')
+        graph.add_edge('D','E')
+
+        is_bipartite, sides = graph.find_bipartition()
+        self.assertTrue(is_bipartite)
+        for vertex in graph.get_vertices():
+            side = 0 if vertex.get_id() in sides[0] else 1
+            for neighbor in vertex.get_neighbors():
+                self.assertIn(neighbor.get_id(), sides[1 - side])
+
+    def test_odd_cycle_witness(self):
+        """The witness is a real cycle of odd length."""
+        graph = Graph(is_directed=False)
+        for i in range(9):
+            graph.add_vertex(i)
+        for i in range(9):
+            graph.add_edge(i, (i + 1) % 9)
+        graph.add_edge(0, 4)
+
+        is_bipartite, cycle = graph.find_bipartition()
+        self.assertFalse(is_bipartite)
+        self.assertEqual(len(cycle) % 2, 1)
+        for i in range(len(cycle)):
+            self.assertIn(cycle[(i + 1) % len(cycle)], graph.get_neighbor_ids(cycle[i]))
+
 
 class TestConnectedComponents(unittest.TestCase):
     # @weight(10)
@@ -155,7 +201,105 @@ class TestTopologicalSort(unittest.TestCase):
         topo_sort = graph.topological_sort()
 
         self.assertIn(topo_sort, possible_sorts)
-        
+
+
+    def test_topological_sort_cycle(self):
+        graph = Graph(is_directed=True)
+        graph.add_vertex('A')
+        graph.add_vertex('B')
+        graph.add_edge('A','B')
+        graph.add_edge('B','A')
+
+        with self.assertRaises(ValueError):
+            graph.topological_sort()
+
+
+class TestDirectedComponents(unittest.TestCase):
+
+    def make_graph(self):
+        """Two cycles A-B-C and D-E joined by C -> D, plus a lone F -> D."""
+        graph = Graph(is_directed=True)
+        for vertex_id in ['A', 'B', 'C', 'D', 'E', 'F', 'G']:
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A','B')
+        graph.add_edge('B','C')
+        graph.add_edge('C','A')
+        graph.add_edge('C','D')
+        graph.add_edge('D','E')
+        graph.add_edge('E','D')
+        graph.add_edge('F','D')
+        return graph
+
+    def test_strongly_connected_components(self):
+        graph = self.make_graph()
+        components = [sorted(comp) for comp in graph.find_strongly_connected_components()]
+
+        self.assertCountEqual(components, [['A', 'B', 'C'], ['D', 'E'], ['F'], ['G']])
+        # sinks come first
+        self.assertLess(components.index(['D', 'E']), components.index(['A', 'B', 'C']))
+
+    def test_weakly_connected_components(self):
+        graph = self.make_graph()
+        for start_order in [graph.find_weakly_connected_components(),
+                            graph.find_connected_components()]:
+            components = [sorted(comp) for comp in start_order]
+            self.assertCountEqual(components, [['A', 'B', 'C', 'D', 'E', 'F'], ['G']])
+
+    def test_condensation(self):
+        graph = self.make_graph()
+        dag, components = graph.condensation()
+
+        self.assertEqual(len(dag.get_vertices()), 4)
+        order = [sorted(components[index]) for index in dag.topological_sort()]
+        self.assertLess(order.index(['A', 'B', 'C']), order.index(['D', 'E']))
+        self.assertLess(order.index(['F']), order.index(['D', 'E']))
+
+    def test_long_path_without_recursion(self):
+        graph = Graph(is_directed=True)
+        for i in range(5000):
+            graph.add_vertex(i)
+        for i in range(4999):
+            graph.add_edge(i, i + 1)
+        graph.add_edge(4999, 0)
+
+        components = graph.find_strongly_connected_components()
+        self.assertEqual(len(components), 1)
+        self.assertEqual(len(components[0]), 5000)
+
+
+class TestKHopNeighborhood(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = read_graph_from_file('test_files/graph_medium_undirected.txt')
+
+    def test_modes(self):
+        graph = self.graph
+        self.assertEqual(sorted(graph.find_k_hop_neighborhood(['A'], 2)), ['D', 'E'])
+        self.assertEqual(sorted(graph.find_k_hop_neighborhood(['A'], 1, 'within')),
+                         ['A', 'B', 'C'])
+        levels = graph.find_k_hop_neighborhood(['A'], 3, 'levels')
+        self.assertEqual([sorted(level) for level in levels],
+                         [['A'], ['B', 'C'], ['D', 'E'], ['F']])
+
+    def test_counts_only(self):
+        graph = self.graph
+        self.assertEqual(graph.find_k_hop_neighborhood(['A'], 2, count_only=True), 2)
+        self.assertEqual(graph.find_k_hop_neighborhood(['A'], 2, 'within', True), 5)
+        self.assertEqual(graph.find_k_hop_neighborhood(['A'], 5, 'levels', True),
+                         [1, 2, 2, 1, 0, 0])
+
+    def test_multiple_starts(self):
+        graph = self.graph
+        self.assertEqual(sorted(graph.find_k_hop_neighborhood(['A', 'F'], 1)),
+                         ['B', 'C', 'D', 'E'])
+        self.assertEqual(graph.find_k_hop_neighborhood(['A', 'F'], 2), [])
+
+    def test_bad_arguments(self):
+        with self.assertRaises(KeyError):
+            self.graph.find_k_hop_neighborhood(['Z'], 1)
+        with self.assertRaises(ValueError):
+            self.graph.find_k_hop_neighborhood(['A'], 1, 'nearby')
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
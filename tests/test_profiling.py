@@ -0,0 +1,75 @@
+import unittest
+from graphs.graph import Graph
+from graphs.weighted_graph import WeightedGraph
+
+
+class TestProfiling(unittest.TestCase):
+
+    def make_dag(self):
+        graph = Graph(is_directed=True)
+        for vertex_id in ['A', 'B', 'C', 'D']:
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A', 'B')
+        graph.add_edge('A', 'C')
+        graph.add_edge('B', 'D')
+        graph.add_edge('C', 'D')
+        return graph
+
+    def test_disabled_by_default(self):
+        graph = self.make_dag()
+        self.assertIsNone(graph.get_profiler())
+        self.assertEqual(graph.topological_sort()[0], 'A')
+
+    def test_topological_sort_stats(self):
+        graph = self.make_dag()
+        profiler = graph.enable_profiling()
+        graph.topological_sort()
+
+        stats = profiler.last['topological_sort']
+        self.assertEqual(stats.vertices_visited, 4)
+        self.assertEqual(stats.edges_relaxed, 4)
+        self.assertGreaterEqual(stats.wall_time, 0)
+
+    def test_callback_hook(self):
+        graph = self.make_dag()
+        seen = []
+        graph.enable_profiling(seen.append)
+        graph.find_shortest_path('A', 'D')
+        graph.find_shortest_path('A', 'D')
+
+        self.assertEqual(len(seen), 2)
+        self.assertEqual(seen[0].algorithm, 'find_shortest_path')
+
+        profiler = graph.disable_profiling()
+        graph.find_shortest_path('A', 'D')
+        self.assertEqual(len(profiler.history), 2)
+        self.assertEqual(profiler.totals()['find_shortest_path'].vertices_visited,
+                         2 * seen[0].vertices_visited)
+
+    def test_weighted_stats(self):
+        graph = WeightedGraph(is_directed=False)
+        for vertex_id in ['A', 'B', 'C']:
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A', 'B', 1)
+        graph.add_edge('B', 'C', 2)
+        graph.add_edge('A', 'C', 5)
+        profiler = graph.enable_profiling()
+
+        self.assertEqual(graph.find_shortest_path('A', 'C', method='dijkstra'), 3)
+        stats = profiler.last['find_shortest_path']
+        self.assertEqual(stats.vertices_visited, 3)
+        # pushes A, B, C (via A) and C (via B), pops A, B and C
+        self.assertEqual(stats.heap_operations, 7)
+
+        self.assertEqual(graph.find_shortest_path('A', 'C', method='dial'), 3)
+        stats = profiler.last['find_shortest_path']
+        self.assertEqual(stats.vertices_visited, 3)
+        # the same four bucket insertions and three removals
+        self.assertEqual(stats.heap_operations, 7)
+
+        graph.minimum_spanning_tree_kruskal()
+        self.assertIn('minimum_spanning_tree_kruskal', profiler.last)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+from benchmarks import TIMING_TESTS_ENABLED, TIMING_TESTS_REASON
+from benchmarks.bench_scaling import (
+    CASES, COUNTED_CASES, SLOPE_TOLERANCE, WORK_SLOPE_TOLERANCE, fit_slope,
+    measure_growth, measure_work)
+
+
+class TestScaling(unittest.TestCase):
+
+    def test_fit_slope(self):
+        sizes = [1000, 2000, 4000, 8000]
+        self.assertAlmostEqual(fit_slope(sizes, [1.0] * 4), 0.0)
+        self.assertAlmostEqual(fit_slope(sizes, [size ** 2 for size in sizes]), 2.0)
+
+    def test_work_stays_within_bounds(self):
+        for name in COUNTED_CASES:
+            with self.subTest(name):
+                slope, counts = measure_work(name)
+                # a case that stopped reporting would pass with no work at all
+                self.assertTrue(all(counts), f'{name} recorded no work: {counts}')
+                self.assertLessEqual(
+                    slope, WORK_SLOPE_TOLERANCE,
+                    f'{name} does more work than its bound: {counts}')
+
+    @unittest.skipUnless(TIMING_TESTS_ENABLED, TIMING_TESTS_REASON)
+    def test_algorithms_stay_within_bounds(self):
+        for name in CASES:
+            with self.subTest(name):
+                slope, times = measure_growth(name)
+                if slope > SLOPE_TOLERANCE:
+                    # rule out a noisy run (e.g. a busy machine) before failing
+                    slope, times = measure_growth(name)
+                self.assertLessEqual(
+                    slope, SLOPE_TOLERANCE,
+                    f'{name} grows faster than its bound: {times}')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import asyncio
+import unittest
+from graphs.graph import Graph
+from graphs.service import GraphQueryService
+from graphs.weighted_graph import WeightedGraph
+from util.file_reader import read_graph_from_file
+
+
+class TestGraphQueryService(unittest.TestCase):
+
+    def make_service(self):
+        graph = read_graph_from_file('test_files/graph_medium_undirected.txt')
+        return graph, GraphQueryService(graph.snapshot())
+
+    def test_same_source_queries_are_batched(self):
+        graph, service = self.make_service()
+
+        async def run():
+            return await asyncio.gather(*[
+                service.find_shortest_path('A', target)
+                for target in ['B', 'C', 'D', 'E', 'F', 'F']])
+
+        paths = asyncio.run(run())
+        self.assertEqual(service.batches_run, 1)
+        self.assertEqual([len(path) for path in paths], [2, 2, 3, 3, 4, 4])
+        self.assertEqual(paths[-1], paths[-2])
+        self.assertEqual(len(paths[-1]), len(graph.find_shortest_path('A', 'F')))
+
+    def test_n_away_and_percentiles(self):
+        graph, service = self.make_service()
+
+        async def run():
+            return await asyncio.gather(*[
+                service.find_vertices_n_away('A', 2) for _ in range(10)])
+
+        results = asyncio.run(run())
+        self.assertEqual([sorted(result) for result in results], [['D', 'E']] * 10)
+
+        percentiles = service.latency_percentiles()
+        self.assertEqual(sorted(percentiles), [50, 90, 99])
+        self.assertLessEqual(percentiles[50], percentiles[99])
+
+    def test_weighted_snapshot(self):
+        graph = WeightedGraph(is_directed=False)
+        for vertex_id in ['A', 'B', 'C']:
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A', 'B', 1)
+        graph.add_edge('B', 'C', 2)
+        graph.add_edge('A', 'C', 5)
+        service = GraphQueryService(graph.snapshot())
+
+        async def run():
+            return await asyncio.gather(
+                service.find_shortest_path('A', 'C'),
+                service.find_shortest_path('A', 'B'),
+                service.find_shortest_path('A', 'C'))
+
+        self.assertEqual(asyncio.run(run()), [3, 1, 3])
+        self.assertEqual(service.batches_run, 0)
+
+    def test_publish_during_batch_window(self):
+        graph = Graph(is_directed=True)
+        for vertex_id in ['A', 'B', 'C']:
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A', 'B')
+        graph.add_edge('A', 'C')
+        service = GraphQueryService(graph.snapshot(), batch_window=0.05)
+
+        async def run():
+            first = [asyncio.ensure_future(service.find_shortest_path('A', target))
+                     for target in ['C', 'B']]
+            await asyncio.sleep(0) # both queries are queued for the old snapshot
+            graph.remove_vertex('C')
+            graph.add_edge('B', 'A')
+            service.publish(graph.snapshot())
+            later = await service.find_shortest_path('B', 'A')
+            with self.assertRaises(KeyError):
+                await service.find_shortest_path('A', 'C')
+            return await asyncio.gather(*first), later
+
+        (old_paths, later) = asyncio.run(run())
+        self.assertEqual(old_paths, [['A', 'C'], ['A', 'B']])
+        self.assertEqual(later, ['B', 'A'])
+        self.assertEqual(service.batches_run, 2)
+
+    def test_coalescing_respects_publish(self):
+        graph = Graph(is_directed=True)
+        graph.add_vertex('A')
+        graph.add_vertex('B')
+        service = GraphQueryService(graph.snapshot(), batch_window=0.05)
+
+        async def run():
+            old = asyncio.ensure_future(service.find_shortest_path('A', 'B'))
+            await asyncio.sleep(0)
+            graph.add_edge('A', 'B')
+            service.publish(graph.snapshot())
+            new = await service.find_shortest_path('A', 'B')
+            return await old, new
+
+        self.assertEqual(asyncio.run(run()), (None, ['A', 'B']))
+
+    def test_latency_window(self):
+        graph = read_graph_from_file('test_files/graph_medium_undirected.txt')
+        service = GraphQueryService(graph.snapshot(), latency_window=5)
+
+        async def run():
+            for distance in range(12):
+                await service.find_vertices_n_away('A', distance)
+
+        asyncio.run(run())
+        self.assertEqual(len(service._GraphQueryService__latencies), 5)
+        service.reset_latencies()
+        self.assertEqual(service.latency_percentiles(), {})
+
+    def test_missing_vertex(self):
+        graph, service = self.make_service()
+        with self.assertRaises(KeyError):
+            asyncio.run(service.find_shortest_path('A', 'Z'))
+
+    def test_publish_new_snapshot(self):
+        graph = Graph(is_directed=True)
+        graph.add_vertex('A')
+        graph.add_vertex('B')
+        service = GraphQueryService(graph.snapshot())
+        self.assertIsNone(asyncio.run(service.find_shortest_path('A', 'B')))
+
+        graph.add_edge('A', 'B')
+        service.publish(graph.snapshot())
+        self.assertEqual(asyncio.run(service.find_shortest_path('A', 'B')), ['A', 'B'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import random
+import unittest
+from graphs.weighted_graph import WeightedGraph
+from graphs.shortest_paths import (
+    bellman_ford, delta_stepping, dial, dijkstra_heap, spfa)
+from util.random_graph import make_random_graph
+
+
+def make_weighted_graph(num_vertices, num_edges, max_weight, seed=0):
+    return make_random_graph(num_vertices, num_edges, seed, weighted=True,
+                             min_weight=0, max_weight=max_weight)
+
+
+class TestShortestPathEngines(unittest.TestCase):
+
+    def test_engines_agree(self):
+        graph = make_weighted_graph(60, 240, 9)
+        for target in range(60):
+            target_id = str(target)
+            expected = dijkstra_heap(graph, '0', target_id)
+            self.assertEqual(dial(graph, '0', target_id, 9), expected)
+            self.assertEqual(delta_stepping(graph, '0', target_id, 3), expected)
+
+    def test_unreachable_target(self):
+        graph = WeightedGraph(is_directed=True)
+        graph.add_vertex('A')
+        graph.add_vertex('B')
+        for method in ['dijkstra', 'dial', 'delta_stepping']:
+            self.assertIsNone(graph.find_shortest_path('A', 'B', method))
+
+    def test_automatic_selection(self):
+        graph = make_weighted_graph(10, 30, 5)
+        self.assertTrue(graph.has_small_integer_weights())
+
+        graph.add_edge('0', '1', 0.5)
+        self.assertFalse(graph.has_small_integer_weights())
+        with self.assertRaises(ValueError):
+            graph.find_shortest_path('0', '1', 'dial')
+
+    def test_missing_vertex(self):
+        graph = make_weighted_graph(3, 3, 5)
+        with self.assertRaises(KeyError):
+            graph.find_shortest_path('0', 'Z')
+
+
+class TestNegativeWeights(unittest.TestCase):
+
+    def make_negative_graph(self):
+        graph = WeightedGraph(is_directed=True)
+        for vertex_id in ['A', 'B', 'C', 'D']:
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A', 'B', 4)
+        graph.add_edge('A', 'C', 2)
+        graph.add_edge('B', 'D', -3)
+        graph.add_edge('C', 'D', 2)
+        return graph
+
+    def test_bellman_ford(self):
+        graph = self.make_negative_graph()
+        self.assertEqual(graph.find_shortest_path('A', 'D'), 1)
+        self.assertEqual(graph.find_shortest_path('A', 'D', 'spfa'), 1)
+        self.assertEqual(bellman_ford(graph, 'A'), spfa(graph, 'A'))
+
+        with self.assertRaises(ValueError):
+            graph.find_shortest_path('A', 'D', 'dijkstra')
+
+    def test_negative_cycle(self):
+        graph = self.make_negative_graph()
+        graph.add_edge('D', 'B', 1)
+        for method in ['bellman_ford', 'spfa']:
+            with self.assertRaises(ValueError):
+                graph.find_shortest_path('A', 'D', method)
+        with self.assertRaises(ValueError):
+            graph.find_all_pairs_shortest_paths()
+
+    def test_johnson_matches_bellman_ford(self):
+        graph = make_weighted_graph(40, 160, 9, seed=3)
+        # shift some weights below zero without creating a negative cycle
+        rng = random.Random(3)
+        potential = {str(i): rng.randint(0, 5) for i in range(40)}
+        shifted = WeightedGraph(is_directed=True)
+        for i in range(40):
+            shifted.add_vertex(str(i))
+        for vertex in graph.get_vertices():
+            for neighbor_id, weight in vertex.get_neighbors_with_weights():
+                shifted.add_edge(vertex.get_id(), neighbor_id,
+                                 weight + potential[vertex.get_id()] - potential[neighbor_id])
+        self.assertTrue(shifted.has_negative_weights())
+
+        all_distances = shifted.find_all_pairs_shortest_paths()
+        for i in range(0, 40, 7):
+            self.assertEqual(all_distances[str(i)], bellman_ford(shifted, str(i)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import threading
+import unittest
+from graphs.graph import Graph
+from graphs.weighted_graph import WeightedGraph
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def make_path_graph(self):
+        graph = Graph(is_directed=False)
+        for vertex_id in ['A', 'B', 'C']:
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A', 'B')
+        graph.add_edge('B', 'C')
+        return graph
+
+    def test_snapshot_ignores_later_writes(self):
+        graph = self.make_path_graph()
+        snapshot = graph.snapshot()
+
+        graph.add_vertex('D')
+        graph.add_edge('A', 'D')
+        graph.add_edge('A', 'C')
+
+        self.assertEqual(len(snapshot), 3)
+        self.assertFalse(snapshot.contains_id('D'))
+        self.assertEqual(snapshot.get_neighbor_ids('A'), ['B'])
+        self.assertEqual(sorted(snapshot.get_neighbor_ids('C')), ['B'])
+        self.assertEqual(snapshot.find_shortest_path('A', 'C'), ['A', 'B', 'C'])
+
+        self.assertEqual(sorted(graph.get_vertex('A').get_neighbors(),
+                                key=lambda v: v.get_id())[0].get_id(), 'B')
+        self.assertEqual(len(graph.get_vertex('A').get_neighbors()), 3)
+        self.assertEqual(graph.find_shortest_path('A', 'C'), ['A', 'C'])
+
+    def test_multiple_snapshots(self):
+        graph = self.make_path_graph()
+        first = graph.snapshot()
+        graph.add_vertex('D')
+        graph.add_edge('C', 'D')
+        second = graph.snapshot()
+        graph.add_edge('A', 'D')
+
+        self.assertEqual(first.find_vertices_n_away('A', 3), [])
+        self.assertEqual(second.find_vertices_n_away('A', 3), ['D'])
+        self.assertEqual(sorted(graph.find_vertices_n_away('A', 1)), ['B', 'D'])
+
+    def test_readers_during_writes(self):
+        graph = Graph(is_directed=True)
+        for i in range(200):
+            graph.add_vertex(i)
+        for i in range(199):
+            graph.add_edge(i, i + 1)
+        snapshot = graph.snapshot()
+        errors = []
+
+        def read():
+            for _ in range(20):
+                path = snapshot.find_shortest_path(0, 199)
+                if path != list(range(200)):
+                    errors.append(path)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for i in range(0, 198, 2):
+            graph.add_edge(i, i + 2)
+        for reader in readers:
+            reader.join()
+
+        self.assertEqual(errors, [])
+        self.assertIn(2, [v.get_id() for v in graph.get_vertex(0).get_neighbors()])
+
+    def test_weighted_shortest_path(self):
+        graph = WeightedGraph(is_directed=True)
+        for vertex_id in ['A', 'B', 'C', 'D']:
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A', 'B', 1)
+        graph.add_edge('B', 'C', 2)
+        graph.add_edge('A', 'C', 5)
+        snapshot = graph.snapshot()
+        graph.add_edge('A', 'C', 1)
+
+        # the fewest-edge path A -> C would cost 5
+        self.assertEqual(snapshot.find_shortest_path('A', 'C'), 3)
+        self.assertEqual(snapshot.find_shortest_path('A', 'C', method='spfa'), 3)
+        self.assertIsNone(snapshot.find_shortest_path('A', 'D'))
+        self.assertEqual(graph.find_shortest_path('A', 'C'), 1)
+        with self.assertRaises(TypeError):
+            snapshot.find_shortest_paths('A', ['B', 'C'])
+        with self.assertRaises(KeyError):
+            snapshot.find_shortest_path('A', 'Z')
+        with self.assertRaises(ValueError):
+            snapshot.find_shortest_path('A', 'C', method='astar')
+
+        graph.add_edge('A', 'D', 4)
+        graph.add_edge('D', 'B', -4)
+        negative = graph.snapshot()
+        self.assertTrue(negative.has_negative_weights())
+        self.assertFalse(snapshot.has_negative_weights())
+        self.assertEqual(negative.find_shortest_path('A', 'B'), 0)
+        self.assertEqual(negative.find_shortest_path('A', 'B'),
+                         graph.find_shortest_path('A', 'B'))
+        with self.assertRaises(ValueError):
+            negative.find_shortest_path('A', 'B', method='dijkstra')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import io
+import subprocess
+import sys
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+import main
+from benchmarks import TIMING_TESTS_ENABLED, TIMING_TESTS_REASON
+from benchmarks.bench_startup import REPO_ROOT, STARTUP_BUDGET, measure_startup
+
+
+class TestLazyImports(unittest.TestCase):
+
+    def loaded_modules(self, code):
+        """Return the graphs.* modules loaded after running `code` in a fresh interpreter."""
+        output = subprocess.run(
+            [sys.executable, '-c', code + '\nimport sys\n'
+             'print(sorted(m for m in sys.modules if m.startswith("graphs")))'],
+            cwd=REPO_ROOT, check=True, capture_output=True, text=True).stdout
+        return eval(output)
+
+    def test_import_graphs_is_lazy(self):
+        self.assertEqual(self.loaded_modules('import graphs'), ['graphs'])
+        self.assertEqual(self.loaded_modules('import util.file_reader'), [])
+
+    def test_engines_load_on_first_use(self):
+        modules = self.loaded_modules('import graphs\ngraphs.Graph')
+        self.assertIn('graphs.graph', modules)
+        self.assertNotIn('graphs.service', modules)
+        self.assertNotIn('graphs.distance_oracle', modules)
+
+
+class TestCommandLine(unittest.TestCase):
+
+    def run_main(self, argv):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            status = main.main(argv)
+        return status, output.getvalue()
+
+    def test_shortest_path(self):
+        status, output = self.run_main(
+            ['test_files/graph_medium_undirected.txt', 'shortest-path', 'A', 'F'])
+        self.assertEqual(status, 0)
+        self.assertEqual(len(eval(output)), 4)
+
+    def test_statistics(self):
+        status, output = self.run_main(['test_files/graph_medium_undirected.txt', 'stats'])
+        self.assertEqual(status, 0)
+        self.assertEqual(eval(output)['num_vertices'], 6)
+
+    def test_bad_usage(self):
+        status, output = self.run_main([])
+        self.assertEqual(status, 0)
+        self.assertIn('usage', output)
+        status, _ = self.run_main(['test_files/graph_small_directed.txt', 'mst'])
+        self.assertEqual(status, 2)
+
+    def test_unreadable_file(self):
+        for argv in (['test_files/no_such_graph.txt', 'components'],
+                     ['--weighted', 'test_files/graph_small_directed.txt', 'mst']):
+            with self.subTest(argv):
+                errors = io.StringIO()
+                with redirect_stderr(errors):
+                    status, output = self.run_main(argv)
+                self.assertEqual(status, 1)
+                self.assertEqual(output, '')
+                self.assertTrue(errors.getvalue().startswith('error: '))
+
+    @unittest.skipUnless(TIMING_TESTS_ENABLED, TIMING_TESTS_REASON)
+    def test_startup_budget(self):
+        interpreter, cli = measure_startup(repeat=3)
+        self.assertLess(cli - interpreter, STARTUP_BUDGET)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+from itertools import combinations
+from graphs.graph import Graph
+from graphs.statistics import (
+    degree_distribution, estimate_clustering, estimate_diameter, simple_adjacency)
+from util.file_reader import read_graph_from_file
+from util.random_graph import make_random_graph
+
+
+def make_graph(edges, is_directed=False):
+    graph = Graph(is_directed)
+    for edge in edges:
+        for vertex_id in edge:
+            if not graph.contains_id(vertex_id):
+                graph.add_vertex(vertex_id)
+        graph.add_edge(*edge)
+    return graph
+
+
+def brute_force_transitivity(graph):
+    """Return closed wedges / wedges of the graph, ignoring directions."""
+    neighbors = {vertex.get_id(): set() for vertex in graph.get_vertices()}
+    for vertex_id in neighbors:
+        for neighbor_id in graph.get_neighbor_ids(vertex_id):
+            if neighbor_id != vertex_id:
+                neighbors[vertex_id].add(neighbor_id)
+                neighbors[neighbor_id].add(vertex_id)
+    wedges = 0
+    closed = 0
+    for vertex_id, adjacent in neighbors.items():
+        for u, w in combinations(adjacent, 2):
+            wedges += 1
+            closed += w in neighbors[u]
+    return closed / wedges, closed // 3
+
+
+class TestGraphStatistics(unittest.TestCase):
+
+    def test_degree_distribution(self):
+        star = make_graph([('hub', str(i)) for i in range(4)])
+        self.assertEqual(list(degree_distribution(star.to_compact())), [0, 4, 0, 0, 1])
+
+        directed = make_graph([('A', 'B'), ('A', 'C'), ('B', 'C')], is_directed=True)
+        compact = directed.to_compact()
+        self.assertEqual(list(degree_distribution(compact)), [1, 1, 1])
+        self.assertEqual(list(degree_distribution(compact, 'in')), [1, 1, 1])
+        self.assertEqual(list(degree_distribution(compact, 'total')), [0, 0, 3])
+        self.assertEqual(list(degree_distribution(Graph().to_compact())), [])
+        with self.assertRaises(ValueError):
+            degree_distribution(compact, 'sideways')
+
+    def test_diameter_of_tree_is_exact(self):
+        # a path 0 - ... - 9 with a short branch off vertex 3
+        edges = [(str(i), str(i + 1)) for i in range(9)] + [('3', 'x'), ('x', 'y')]
+        compact = make_graph(edges).to_compact()
+        diameter, (first, second) = estimate_diameter(compact, compact.get_index('5'))
+        self.assertEqual(diameter, 9)
+        self.assertEqual({compact.vertex_ids[first], compact.vertex_ids[second]}, {'0', '9'})
+        self.assertEqual(estimate_diameter(Graph().to_compact()), (0, None))
+
+    def test_simple_adjacency(self):
+        directed = make_graph([('A', 'B'), ('B', 'A'), ('B', 'B'), ('C', 'A')],
+                              is_directed=True)
+        compact = directed.to_compact()
+        offsets, targets = simple_adjacency(compact)
+        neighbors = {compact.vertex_ids[i]: sorted(compact.vertex_ids[j]
+                                                   for j in targets[offsets[i]:offsets[i + 1]])
+                     for i in range(compact.num_vertices())}
+        self.assertEqual(neighbors, {'A': ['B', 'C'], 'B': ['A'], 'C': ['A']})
+
+    def test_clustering(self):
+        clique = make_graph(list(combinations('ABCDE', 2)))
+        self.assertEqual(estimate_clustering(clique.to_compact(), 200, seed=1), (1.0, 10.0))
+        tree = make_graph([('A', 'B'), ('A', 'C'), ('C', 'D')])
+        self.assertEqual(estimate_clustering(tree.to_compact(), 200, seed=1), (0.0, 0.0))
+
+        graph = make_random_graph(60, 400, seed=3)
+        expected, triangles = brute_force_transitivity(graph)
+        coefficient, estimate = estimate_clustering(graph.to_compact(), 20000, seed=3)
+        self.assertAlmostEqual(coefficient, expected, delta=0.02)
+        self.assertAlmostEqual(estimate, triangles, delta=0.1 * triangles)
+
+    def test_compute_statistics(self):
+        graph = read_graph_from_file('test_files/graph_medium_undirected.txt')
+        stats = graph.compute_statistics(samples=500, seed=0)
+        self.assertEqual(stats, graph.compute_statistics(samples=500, seed=0))
+        self.assertEqual(stats['num_vertices'], len(graph.get_vertices()))
+        self.assertEqual(sum(stats['degree_distribution']), stats['num_vertices'])
+        self.assertGreater(stats['diameter_estimate'], 0)
+        first, second = stats['diameter_endpoints']
+        self.assertEqual(len(graph.find_shortest_path(first, second)) - 1,
+                         stats['diameter_estimate'])
+        self.assertTrue(0.0 <= stats['clustering_coefficient'] <= 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,10 @@
+import io
+import timeit
 import unittest
-from graphs.graph import Graph
+from contextlib import redirect_stdout
+from benchmarks import TIMING_TESTS_ENABLED, TIMING_TESTS_REASON
 from graphs.weighted_graph import WeightedGraph
+from util.random_graph import forward_only, make_random_graph
 
 
 class TestGraph(unittest.TestCase):
@@ -68,6 +72,134 @@ class TestGraph(unittest.TestCase):
 
         self.assertEqual(
             graph.find_shortest_path('A', 'J'), expected_shortest_path)
+    def test_remove_and_update(self):
+        graph = self.make_large_graph()
+        graph.update_edge_weight('H', 'J', 1)
+        self.assertEqual(graph.find_shortest_path('A', 'J'), 12)
+
+        graph.remove_edge('F', 'H')
+        self.assertEqual(graph.find_shortest_path('A', 'J'), 17)
+
+        graph.remove_vertex('H')
+        self.assertIsNone(graph.get_vertex('H'))
+        self.assertEqual(graph.find_shortest_path('A', 'J'), 28)
+
+        with self.assertRaises(KeyError):
+            graph.update_edge_weight('A', 'J', 3)
+
+    def test_remove_vertex_directed(self):
+        graph = WeightedGraph(is_directed=True)
+        for vertex_id in ['A', 'B', 'C']:
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A', 'B', 1)
+        graph.add_edge('B', 'C', 1)
+        graph.remove_vertex('B')
+
+        self.assertEqual(graph.get_vertex('A').get_neighbors_with_weights(), [])
+        self.assertEqual(len(graph.get_vertices()), 2)
+
+    def test_weight_summaries_follow_changes(self):
+        graph = WeightedGraph(is_directed=True)
+        for vertex_id in ['A', 'B', 'C']:
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A', 'B', -1)
+        graph.add_edge('B', 'C', 2)
+        self.assertTrue(graph.has_negative_weights())
+
+        graph.update_edge_weight('A', 'B', 1)
+        self.assertFalse(graph.has_negative_weights())
+        self.assertEqual(graph.find_shortest_path('A', 'C', 'dijkstra'), 3)
+        self.assertEqual(graph.find_shortest_path('A', 'C', 'dial'), 3)
+
+        graph.add_edge('C', 'A', 1000.5)
+        self.assertFalse(graph.has_small_integer_weights())
+        graph.remove_edge('C', 'A')
+        self.assertTrue(graph.has_small_integer_weights())
+
+        graph.add_edge('C', 'A', -4)
+        graph.remove_vertex('A')
+        self.assertFalse(graph.has_negative_weights())
+        self.assertEqual(graph.find_shortest_path('B', 'C', 'dial'), 2)
+
+    def test_weight_summaries_undirected(self):
+        graph = self.make_large_graph()
+        graph.add_edge('A', 'J', -3)
+        graph.add_edge('J', 'J', 0.5)
+        graph.remove_vertex('J')
+        self.assertTrue(graph.has_small_integer_weights())
+
+
+class TestInheritedAlgorithms(unittest.TestCase):
+    """Unweighted algorithms from Graph run on the same storage in WeightedGraph."""
+
+    def make_pair(self, is_directed, num_vertices=300, num_edges=900):
+        # the same seed gives both graphs the same edges
+        return tuple(
+            make_random_graph(num_vertices, num_edges, is_directed=is_directed,
+                              weighted=weighted, max_weight=9, vertex_id=int,
+                              # keep the directed graphs acyclic
+                              edge_filter=forward_only if is_directed else None)
+            for weighted in (False, True))
+
+    def test_same_results(self):
+        graph, weighted = self.make_pair(is_directed=False)
+        self.assertCountEqual(
+            [sorted(comp) for comp in graph.find_connected_components()],
+            [sorted(comp) for comp in weighted.find_connected_components()])
+        self.assertEqual(graph.is_bipartite(), weighted.is_bipartite())
+        self.assertEqual(sorted(graph.find_vertices_n_away(0, 2)),
+                         sorted(weighted.find_vertices_n_away(0, 2)))
+
+        graph, weighted = self.make_pair(is_directed=True)
+        self.assertEqual(graph.topological_sort(), weighted.topological_sort())
+        self.assertEqual(len(weighted.find_strongly_connected_components()), 300)
+
+    def test_components_and_in_degree(self):
+        graph = WeightedGraph(is_directed=False)
+        graph.add_vertex('A')
+        graph.add_vertex('B')
+        graph.add_edge('A', 'B', 3)
+        self.assertEqual(graph.find_connected_components(), [['A', 'B']])
+        self.assertEqual(graph.get_in_degree('B'), 1)
+
+    def test_bfs_traversal_on_weighted_graph(self):
+        graph = WeightedGraph(is_directed=True)
+        for vertex_id in ['A', 'B', 'C', 'D']:
+            graph.add_vertex(vertex_id)
+        graph.add_edge('A', 'B', 3)
+        graph.add_edge('B', 'C', 1)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            graph.bfs_traversal('A')
+        self.assertCountEqual(output.getvalue().splitlines(),
+                              ['Processing vertex A', 'Processing vertex B',
+                               'Processing vertex C'])
+        with self.assertRaises(KeyError):
+            graph.bfs_traversal('Z')
+
+    def test_weighted_snapshot(self):
+        graph = WeightedGraph(is_directed=True)
+        graph.add_vertex('A')
+        graph.add_vertex('B')
+        graph.add_edge('A', 'B', 3)
+        snapshot = graph.snapshot()
+        graph.update_edge_weight('A', 'B', 5)
+
+        self.assertEqual(snapshot.get_neighbors_with_weights('A'), [('B', 3)])
+        self.assertEqual(graph.get_vertex('A').get_neighbors_with_weights(), [('B', 5)])
+
+    @unittest.skipUnless(TIMING_TESTS_ENABLED, TIMING_TESTS_REASON)
+    def test_same_speed(self):
+        graph, weighted = self.make_pair(is_directed=False, num_vertices=2000, num_edges=8000)
+
+        def best_time(target):
+            return min(timeit.repeat(
+                lambda: target.find_k_hop_neighborhood([0], 10, 'within'),
+                number=5, repeat=5))
+
+        # same storage and the same code, so allow only timing noise
+        self.assertLess(best_time(weighted), 2 * best_time(graph) + 0.01)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,183 @@
+import os
+
+from graphs.graph import Graph
+from graphs.weighted_graph import WeightedGraph
+from util.file_reader import parse_weight, read_graph_from_file, write_graph_to_file
+
+
+SNAPSHOT_FILENAME = 'graph.txt'
+LOG_FILENAME = 'changes.log'
+
+ADD_VERTEX = '+V'
+REMOVE_VERTEX = '-V'
+ADD_EDGE = '+E'
+REMOVE_EDGE = '-E'
+
+
+def apply_change(graph, record):
+    """
+    Apply one change log record to a graph.
+
+    Records are applied as "make it so": adding something that exists or
+    removing something that is gone does nothing, and edge records whose
+    endpoints are gone are skipped (a later record of the log removed that
+    vertex). That makes replaying a log over a snapshot that already
+    contains some or all of its changes safe.
+
+    Arguments:
+    graph (Graph): The graph (or WeightedGraph) to change
+    record (list<string>): The fields of one log line
+    """
+    kind = record[0]
+    if kind == ADD_VERTEX:
+        if not graph.contains_id(record[1]):
+            graph.add_vertex(record[1])
+    elif kind == REMOVE_VERTEX:
+        if graph.contains_id(record[1]):
+            graph.remove_vertex(record[1])
+    elif kind == ADD_EDGE:
+        if not graph.contains_id(record[1]) or not graph.contains_id(record[2]):
+            return
+        if len(record) == 4:
+            graph.add_edge(record[1], record[2], parse_weight(record[3]))
+        else:
+            graph.add_edge(record[1], record[2])
+    elif kind == REMOVE_EDGE:
+        if not graph.contains_id(record[1]) or not graph.contains_id(record[2]):
+            return
+        if record[2] in graph.get_neighbor_ids(record[1]):
+            graph.remove_edge(record[1], record[2])
+    else:
+        raise ValueError(f'Invalid change log record: {record}')
+
+
+def replay_log(graph, filename):
+    """
+    Apply every record of a change log file to a graph, in order.
+
+    Arguments:
+    graph (Graph): The graph (or WeightedGraph) to change
+    filename (string): The path of the change log
+
+    Returns:
+    int: The number of records applied
+    """
+    count = 0
+    with open(filename) as log_file:
+        for line in log_file:
+            line = line.rstrip('\n')
+            if not line:
+                continue
+            apply_change(graph, line.split('\t'))
+            count += 1
+    return count
+
+
+class GraphStore(object):
+    """
+    Persist a graph as a snapshot file plus an append-only change log.
+
+    Every change is applied to the in-memory graph and appended to the log,
+    so a write costs O(change) instead of rewriting the whole graph. Loading
+    reads the snapshot and replays the log. Once the log holds
+    `compact_every` records it is folded into a fresh snapshot.
+    """
+
+    def __init__(self, directory, is_directed=True, weighted=False, compact_every=10000):
+        """
+        Initialize a store kept in `directory`. Call `load()` before writing.
+
+        Parameters:
+        directory (string): Folder holding the snapshot and the change log.
+        is_directed (boolean): Whether a brand new graph should be directed.
+        weighted (boolean): Whether the graph is a WeightedGraph.
+        compact_every (int): Number of log records that triggers compaction.
+        """
+        self.directory = directory
+        self.is_directed = is_directed
+        self.weighted = weighted
+        self.compact_every = compact_every
+        self.snapshot_path = os.path.join(directory, SNAPSHOT_FILENAME)
+        self.log_path = os.path.join(directory, LOG_FILENAME)
+        self.graph = None
+        self.log_records = 0
+        self.__log_file = None
+
+    def load(self):
+        """
+        Load the snapshot, replay the change log on top and return the graph.
+
+        Returns:
+        Graph: The graph (or WeightedGraph) as of the last logged change.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        if os.path.exists(self.snapshot_path):
+            self.graph = read_graph_from_file(self.snapshot_path, self.weighted)
+        elif self.weighted:
+            self.graph = WeightedGraph(self.is_directed)
+        else:
+            self.graph = Graph(self.is_directed)
+
+        self.log_records = 0
+        if os.path.exists(self.log_path):
+            self.log_records = replay_log(self.graph, self.log_path)
+        self.__log_file = open(self.log_path, 'a')
+        return self.graph
+
+    def close(self):
+        """Close the change log."""
+        if self.__log_file is not None:
+            self.__log_file.close()
+            self.__log_file = None
+
+    def add_vertex(self, vertex_id):
+        """Add a vertex (if it is new) and log it. Returns the vertex."""
+        if not self.graph.contains_id(vertex_id):
+            self.graph.add_vertex(vertex_id)
+            self.__append([ADD_VERTEX, vertex_id])
+        return self.graph.get_vertex(vertex_id)
+
+    def remove_vertex(self, vertex_id):
+        """Remove a vertex and its edges, and log it."""
+        self.graph.remove_vertex(vertex_id)
+        self.__append([REMOVE_VERTEX, vertex_id])
+
+    def add_edge(self, vertex_id1, vertex_id2, weight=None):
+        """Add (or re-weight) an edge and log it."""
+        if self.weighted:
+            self.graph.add_edge(vertex_id1, vertex_id2, weight)
+            self.__append([ADD_EDGE, vertex_id1, vertex_id2, repr(weight)])
+        else:
+            self.graph.add_edge(vertex_id1, vertex_id2)
+            self.__append([ADD_EDGE, vertex_id1, vertex_id2])
+
+    def remove_edge(self, vertex_id1, vertex_id2):
+        """Remove an edge and log it."""
+        self.graph.remove_edge(vertex_id1, vertex_id2)
+        self.__append([REMOVE_EDGE, vertex_id1, vertex_id2])
+
+    def compact(self):
+        """
+        Write the current graph as the new snapshot and empty the log.
+
+        The snapshot is written to a temporary file and renamed over the old
+        one. If the process dies before the log is emptied, the old log is
+        replayed over the new snapshot on the next load, which is harmless
+        because `apply_change` skips records that are already reflected in
+        it, including edges to vertices the log removes later on.
+        """
+        temp_snapshot = self.snapshot_path + '.tmp'
+        write_graph_to_file(self.graph, temp_snapshot)
+        os.replace(temp_snapshot, self.snapshot_path)
+
+        self.close()
+        self.__log_file = open(self.log_path, 'w')
+        self.log_records = 0
+
+    def __append(self, record):
+        """Append one record to the change log, compacting when it is full."""
+        self.__log_file.write('\t'.join(str(field) for field in record) + '\n')
+        self.__log_file.flush()
+        self.log_records += 1
+        if self.log_records >= self.compact_every:
+            self.compact()
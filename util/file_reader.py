@@ -1,50 +1,105 @@
-from graphs.graph import Graph
+def parse_weight(text):
+    """Return an edge weight read from a file as an int if possible, else a float."""
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
 
 
-def read_graph_from_file(filename):
+def read_graph_from_file(filename, weighted=False):
     """
     Read in data from the specified filename, and create and return a graph
     object corresponding to that data.
 
     Arguments:
     filename (string): The relative path of the file to be processed
+    weighted (boolean): Whether edges are written as (id1,id2,weight) and a
+    WeightedGraph should be returned
 
     Returns:
     Graph: A directed or undirected Graph object containing the specified
     vertices and edges
     """
 
-    # TODO: Use 'open' to open the file
-    my_file = open(filename)
-    
-    
-
-    # TODO: Use the first line (G or D) to determine whether graph is directed 
-    # and create a graph object
-    graph_type = my_file.readline().strip()
-    if graph_type == "G" :
-        graph = Graph(False)
-    elif graph_type == "D" :
-        graph = Graph(True)
+    # imported here so loading this module does not load the graph engines
+    if weighted:
+        from graphs.weighted_graph import WeightedGraph as graph_class
     else:
-        raise ValueError("Invalid Graph type")
+        from graphs.graph import Graph as graph_class
+
+    # TODO: Use 'open' to open the file
+    with open(filename) as my_file:
+
+        # TODO: Use the first line (G or D) to determine whether graph is directed
+        # and create a graph object
+        graph_type = my_file.readline().strip()
+        if graph_type == "G" :
+            graph = graph_class(False)
+        elif graph_type == "D" :
+            graph = graph_class(True)
+        else:
+            raise ValueError("Invalid Graph type")
 
-    # TODO: Use the second line to add the vertices to the graph
-    vertices = my_file.readline().strip().split(",")
-    for vertex in vertices:
-        graph.add_vertex(vertex)
+        # TODO: Use the second line to add the vertices to the graph
+        vertices = my_file.readline().strip().split(",")
+        for vertex in vertices:
+            if vertex:
+                graph.add_vertex(vertex)
 
 
-    # TODO: Use the 3rd+ line to add the edges to the graph
-    for edge in my_file:
-        vertex1, vertex2 = edge.strip()[1:-1].split(",")
-        graph.add_edge(vertex1, vertex2)
+        # TODO: Use the 3rd+ line to add the edges to the graph
+        for edge in my_file:
+            edge = edge.strip()
+            if not edge:
+                continue
+            if weighted:
+                vertex1, vertex2, weight = edge[1:-1].split(",")
+                graph.add_edge(vertex1, vertex2, parse_weight(weight))
+            else:
+                vertex1, vertex2 = edge[1:-1].split(",")
+                graph.add_edge(vertex1, vertex2)
 
     return graph
-    pass
+
+
+def write_graph_to_file(graph, filename):
+    """
+    Write a graph to the specified filename in the format read by
+    `read_graph_from_file`. Edges of undirected graphs are written once.
+
+    Arguments:
+    graph (Graph): The graph (or WeightedGraph) to write
+    filename (string): The relative path of the file to write
+    """
+    from graphs.weighted_graph import WeightedGraph
+
+    weighted = isinstance(graph, WeightedGraph)
+    directed = graph.is_directed()
+    vertices = graph.get_vertices()
+
+    with open(filename, 'w') as my_file:
+        my_file.write('D\n' if directed else 'G\n')
+        my_file.write(','.join(str(vertex.get_id()) for vertex in vertices) + '\n')
+
+        written = set() # undirected edges to these vertices are already out
+        for vertex in vertices:
+            vertex_id = vertex.get_id()
+            if weighted:
+                edges = vertex.get_neighbors_with_weights()
+            else:
+                edges = [(neighbor.get_id(), None) for neighbor in vertex.get_neighbors()]
+            for neighbor_id, weight in edges:
+                if not directed and neighbor_id in written:
+                    continue
+                if weighted:
+                    my_file.write(f'({vertex_id},{neighbor_id},{weight!r})\n')
+                else:
+                    my_file.write(f'({vertex_id},{neighbor_id})\n')
+            written.add(vertex_id)
+
 
 if __name__ == '__main__':
 
     graph = read_graph_from_file('test.txt')
 
-    print(graph)
\ No newline at end of file
+    print(graph)
@@ -0,0 +1,69 @@
+import random
+
+
+def make_random_graph(num_vertices, num_edges, seed=0, is_directed=True,
+                      weighted=False, min_weight=1, max_weight=100,
+                      edge_filter=None, vertex_id=str):
+    """
+    Create and return a graph with uniformly random edges, for tests and
+    benchmarks.
+
+    A weight is drawn for every edge even when the graph is unweighted, so a
+    Graph and a WeightedGraph built with the same arguments and seed have
+    exactly the same edges.
+
+    Arguments:
+    num_vertices (int): Number of vertices, numbered 0 .. num_vertices - 1
+    num_edges (int): Number of edges to draw (duplicates are merged by add_edge)
+    seed (int): Random seed
+    is_directed (boolean): Whether the graph is directed
+    weighted (boolean): Whether to return a WeightedGraph
+    min_weight (int): Smallest edge weight
+    max_weight (int): Largest edge weight
+    edge_filter (function): Maps a drawn (start, end) index pair to the pair
+    to add, or None to skip it
+    vertex_id (function): Maps a vertex number to its id
+
+    Returns:
+    Graph: A Graph, or a WeightedGraph if weighted is set
+    """
+
+    # imported here so loading this module does not load the graph engines
+    if weighted:
+        from graphs.weighted_graph import WeightedGraph as graph_class
+    else:
+        from graphs.graph import Graph as graph_class
+
+    rng = random.Random(seed)
+    graph = graph_class(is_directed)
+    for i in range(num_vertices):
+        graph.add_vertex(vertex_id(i))
+    for _ in range(num_edges):
+        pair = (rng.randrange(num_vertices), rng.randrange(num_vertices))
+        weight = rng.randint(min_weight, max_weight)
+        if edge_filter is not None:
+            pair = edge_filter(pair)
+            if pair is None:
+                continue
+        start_id, end_id = vertex_id(pair[0]), vertex_id(pair[1])
+        if weighted:
+            graph.add_edge(start_id, end_id, weight)
+        else:
+            graph.add_edge(start_id, end_id)
+    return graph
+
+
+def forward_only(pair):
+    """Edge filter keeping edges from lower to higher number, so the graph is acyclic."""
+    start, end = pair
+    if start == end:
+        return None
+    return (min(pair), max(pair))
+
+
+def across_parity(pair):
+    """Edge filter keeping edges between even and odd numbers, so the graph is bipartite."""
+    start, end = pair
+    if (start + end) % 2 == 0:
+        return None
+    return pair